@@ -0,0 +1,9 @@
+"""Performance benchmarks for the savegame parser.
+
+Run each benchmark as a module from the repository root, e.g.::
+
+    python -m benchmarks.bench_checksums
+
+``benchmarks.suite`` runs the main operations and checks them against the
+committed ``baseline.json``.
+"""
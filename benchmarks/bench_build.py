@@ -0,0 +1,74 @@
+"""Bulk Pokemon generation benchmark.
+
+Builds every given species at several levels, one by one with
+``pkm_builder`` and at once with ``build_many``, and reports Pokemon built
+per second. Species data missing from the bundled dataset is fetched from
+PokeAPI before timing (see ``fetch_missing_species_data``).
+
+Usage::
+
+    python -m benchmarks.bench_build [--species bulbasaur pikachu ...]
+"""
+import argparse
+import sys
+import time
+
+from rr_parser.enums import GameType
+from rr_parser.exceptions import SpeciesDataException
+from rr_parser.pkm_builder import pkm_builder, build_many, PokemonSpec
+
+_SPECIES = ["bulbasaur", "charmander", "squirtle", "pikachu", "mewtwo"]
+_LEVELS = list(range(5, 101, 5))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--species', nargs='+', type=str, default=_SPECIES)
+    parser.add_argument('--copies', type=int, default=10,
+                        help="Pokemon per species and level.")
+    args = parser.parse_args()
+
+    specs = [
+        PokemonSpec(species, level=level, shiny=copy % 2 == 0)
+        for species in args.species
+        for level in _LEVELS
+        for copy in range(0, args.copies)
+    ]
+
+    # Fetch missing species data outside of the timings.
+    try:
+        for gen in (GameType.RR, GameType.FR):
+            build_many(gen, [PokemonSpec(species) for species in args.species])
+            pass
+        pass
+    except SpeciesDataException as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    print("{:<6}{:<14}{:>12}{:>16}".format(
+        "game", "builder", "time (s)", "pokemon / s"
+    ))
+    for gen in (GameType.RR, GameType.FR):
+        t0 = time.perf_counter()
+        for spec in specs:
+            pkm_builder(gen, spec.species, level=spec.level,
+                        shiny=spec.shiny)
+            pass
+        one_by_one = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        build_many(gen, specs)
+        bulk = time.perf_counter() - t0
+
+        for name, elapsed in (("pkm_builder", one_by_one),
+                              ("build_many", bulk)):
+            print("{:<6}{:<14}{:>12.3f}{:>16.0f}".format(
+                gen.name, name, elapsed, len(specs) / elapsed
+            ))
+            pass
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
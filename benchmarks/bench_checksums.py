@@ -0,0 +1,76 @@
+"""Section checksum micro-benchmark.
+
+Compares every available word summing backend against the original pure
+Python loop (``python`` backend) over the 28 game save sections of a
+savegame, checking that all of them return byte-identical checksums.
+
+Usage::
+
+    python -m benchmarks.bench_checksums [--sav rr.sav] [--repeat 200]
+"""
+import argparse
+import os
+import timeit
+
+from rr_parser import checksums
+from rr_parser.checksums import RRSectionChecksum, CHECKSUM_BACKENDS
+
+
+def _load_sections(filename: str) -> list[tuple[bytes, int]]:
+    if os.path.exists(filename):
+        with open(filename, "rb") as f:
+            data = f.read()
+            pass
+    else:
+        print("W: '{}' not found, using random sections.".format(filename))
+        data = os.urandom(0x20000)
+        pass
+
+    sections = list()
+    for i in range(0, 28):
+        section = data[i * 4096:(i + 1) * 4096]
+        section_id = int.from_bytes(section[0x0FF4:0x0FF4 + 2], 'little')
+        sections.append((section, section_id % 14))
+        pass
+    return sections
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sav', type=str, default='rr.sav')
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+
+    sections = _load_sections(args.sav)
+
+    def run():
+        return [RRSectionChecksum.get_checksum(s, i) for s, i in sections]
+
+    default_backend = checksums.CHECKSUM_BACKEND
+    results = dict()
+    for name in reversed(list(CHECKSUM_BACKENDS)):
+        checksums.set_checksum_backend(name)
+        results[name] = (
+            run(),
+            timeit.timeit(run, number=args.repeat) / args.repeat
+        )
+        pass
+    checksums.set_checksum_backend(default_backend)
+
+    reference, reference_time = results["python"]
+    print("{:<12}{:>14}{:>10}{:>12}".format(
+        "backend", "us / save", "speedup", "identical"
+    ))
+    for name, (values, elapsed) in results.items():
+        print("{:<12}{:>14.1f}{:>9.1f}x{:>12}".format(
+            name,
+            elapsed * 1e6,
+            reference_time / elapsed,
+            str(values == reference)
+        ))
+        pass
+    pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+"""Constants data pack benchmark.
+
+Compares, in fresh interpreters, importing the generated Python learnset
+table against opening the binary data pack, and then the cost of a
+``get_species_learnset`` lookup for every species with each of them.
+
+Usage::
+
+    python -m benchmarks.bench_data_pack [--repeat 10]
+"""
+import argparse
+import subprocess
+import sys
+import timeit
+
+_IMPORT = {
+    "python": "from rr_parser.constants.rr import _learnset",
+    "data pack": (
+        "from rr_parser.constants.rr.data_pack import DataPack\n"
+        "DataPack()"
+    )
+}
+
+# Package and constants modules shared by both are imported before timing.
+_RUNNER = """
+import time
+import rr_parser.constants.rr
+t0 = time.perf_counter()
+exec(compile({code!r}, '<scenario>', 'exec'))
+print(time.perf_counter() - t0)
+"""
+
+
+def _cold(code: str) -> float:
+    out = subprocess.run(
+        [sys.executable, "-B", "-c", _RUNNER.format(code=code)],
+        check=True,
+        capture_output=True,
+        text=True
+    ).stdout
+    return float(out.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    print("{:<12}{:>16}".format("table", "cold load (ms)"))
+    for name, code in _IMPORT.items():
+        best = min(_cold(code) for _ in range(0, args.repeat))
+        print("{:<12}{:>16.2f}".format(name, best * 1e3))
+        pass
+
+    from rr_parser.constants import rr
+    from rr_parser.constants.rr import data_pack
+    from rr_parser.constants.rr.species_registry import SPECIES_IDS
+
+    names = list(SPECIES_IDS)
+
+    def run():
+        return [rr.get_species_learnset(name) for name in names]
+
+    results = dict()
+    pack = data_pack.get_data_pack()
+    for name, reader in (("python", None), ("data pack", pack)):
+        data_pack._DATA_PACK = reader
+        results[name] = (
+            run(),
+            timeit.timeit(run, number=args.repeat) / args.repeat
+        )
+        pass
+    data_pack._DATA_PACK = pack
+
+    reference = results["python"][0]
+    print("{:<12}{:>16}{:>12}".format("table", "us / species", "identical"))
+    for name, (values, elapsed) in results.items():
+        print("{:<12}{:>16.2f}{:>12}".format(
+            name,
+            elapsed * 1e6 / len(names),
+            str(values == reference)
+        ))
+        pass
+    pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""Scripted savegame edits benchmark.
+
+Times ``set_pokedex_entry`` bulk edits on a Radical Red savegame for an
+increasing number of edits: the time per edit must stay flat.
+
+Usage::
+
+    python -m benchmarks.bench_edits [--sav rr.sav]
+"""
+import argparse
+import time
+
+from rr_parser.enums import PokedexEntryState
+from rr_parser.functions import set_pokedex_entry
+from rr_parser.games import RadicalRed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sav', type=str, default='rr.sav')
+    args = parser.parse_args()
+
+    with open(args.sav, "rb") as f:
+        data = f.read()
+        pass
+
+    caught = PokedexEntryState(PokedexEntryState.CAUGHT)
+    print("{:<8}{:>12}{:>14}".format("edits", "total (ms)", "us / edit"))
+    for n_edits in (50, 100, 200, 400, 800):
+        g = RadicalRed(data)
+        t0 = time.perf_counter()
+        for i in range(0, n_edits):
+            set_pokedex_entry(g, 1 + i % 999, caught)
+            pass
+        elapsed = time.perf_counter() - t0
+        assert g.check_valid()
+        print("{:<8}{:>12.2f}{:>14.1f}".format(
+            n_edits, elapsed * 1e3, elapsed * 1e6 / n_edits
+        ))
+        pass
+    pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""Package import-time benchmark.
+
+Times, in fresh interpreters, the import of ``rr_parser`` and a few typical
+entry points (parsing a savegame, loading it through the helpers, importing
+the Pokemon builder), and reports which heavy modules each of them pulled in.
+
+Usage::
+
+    python -m benchmarks.bench_import [--sav rr.sav] [--repeat 10]
+"""
+import argparse
+import json
+import subprocess
+import sys
+
+# Modules that parsing and validating a savegame must not import.
+HEAVY_MODULES = [
+    "pokebase",
+    "requests",
+    "rr_parser.constants.rr._learnset",
+    "rr_parser.functions",
+    "rr_parser.pkm_builder"
+]
+
+SCENARIOS = {
+    "import": "import rr_parser",
+    "parse": (
+        "import rr_parser\n"
+        "with open({sav!r}, 'rb') as f:\n"
+        "    g = rr_parser.RadicalRed(f.read())\n"
+        "assert g.check_valid()"
+    ),
+    "load": (
+        "import rr_parser\n"
+        "g = rr_parser.load_radical_red_game({sav!r})\n"
+        "assert g.check_valid()"
+    ),
+    "builder": "from rr_parser.pkm_builder import pkm_builder"
+}
+
+_RUNNER = """
+import json, sys, time
+t0 = time.perf_counter()
+exec(compile({code!r}, '<scenario>', 'exec'))
+t1 = time.perf_counter()
+print(json.dumps([t1 - t0, [m for m in {heavy!r} if m in sys.modules]]))
+"""
+
+
+def _run(code: str) -> tuple[float, list[str]]:
+    out = subprocess.run(
+        [sys.executable, "-c", _RUNNER.format(code=code, heavy=HEAVY_MODULES)],
+        check=True,
+        capture_output=True,
+        text=True
+    ).stdout
+    elapsed, imported = json.loads(out.strip().splitlines()[-1])
+    return elapsed, imported
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sav', type=str, default='rr.sav')
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    print("{:<10}{:>12}  {}".format("scenario", "ms (best)", "heavy imports"))
+    for name, code in SCENARIOS.items():
+        code = code.format(sav=args.sav)
+        runs = [_run(code) for _ in range(0, args.repeat)]
+        best = min(elapsed for elapsed, _ in runs)
+        print("{:<10}{:>12.1f}  {}".format(
+            name,
+            best * 1e3,
+            ", ".join(runs[-1][1]) or "-"
+        ))
+        pass
+    pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""Full savegame load benchmark.
+
+Times, and measures memory allocated (with ``tracemalloc``) by, loading a
+Radical Red savegame and reading its team and PC box Pokemon species, as
+most consumers do. Pokemon fields are decoded on first access, the
+``eager`` scenario forces every field to be decoded, as done on load before
+lazy decoding.
+
+Usage::
+
+    python -m benchmarks.bench_load [--sav rr.sav] [--repeat 20]
+"""
+import argparse
+import timeit
+import tracemalloc
+
+from rr_parser.games import RadicalRed
+
+_TEAM_FIELDS = (
+    'pid', 'trainer_id', 'ot', 'sot', 'nickname', 'level', 'language',
+    'is_egg', 'ot_name', 'status', 'current_hp', 'hp', 'attack', 'defense',
+    'speed', 'special_attack', 'special_defense', 'sub_data',
+    'sub_data_decrypted', 'sub_data_encrypted'
+)
+_BOX_FIELDS = (
+    'sub_data', 'nickname', 'lang', 'misc_flags', 'ot_name', 'markings'
+)
+
+
+def _species(g: RadicalRed) -> list[int]:
+    game_save = g.game_save
+    return [
+        pkm.sub_data.species for pkm in game_save.team.team_pokemon_list
+    ] + [
+        pkm.species for box in game_save.pc.boxes for pkm in box.pokemon
+    ]
+
+
+def lazy(data: bytes):
+    g = RadicalRed(data)
+    _species(g)
+    return g
+
+
+def eager(data: bytes):
+    g = RadicalRed(data)
+    _species(g)
+    game_save = g.game_save
+    for pkm in game_save.team.team_pokemon_list:
+        for name in _TEAM_FIELDS:
+            getattr(pkm, name)
+            pass
+        pass
+    for box in game_save.pc.boxes:
+        for pkm in box.pokemon:
+            for name in _BOX_FIELDS:
+                getattr(pkm, name)
+                pass
+            pass
+        pass
+    return g
+
+
+def _allocated(func, data: bytes) -> tuple[int, int]:
+    tracemalloc.start()
+    g = func(data)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del g
+    return current, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sav', type=str, default='rr.sav')
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    with open(args.sav, "rb") as f:
+        data = f.read()
+        pass
+
+    print("{:<10}{:>12}{:>16}{:>14}".format(
+        "scenario", "load (ms)", "retained (KiB)", "peak (KiB)"
+    ))
+    for func in (eager, lazy):
+        elapsed = min(timeit.repeat(
+            lambda: func(data), number=1, repeat=args.repeat
+        ))
+        current, peak = _allocated(func, data)
+        print("{:<10}{:>12.2f}{:>16.1f}{:>14.1f}".format(
+            func.__name__, elapsed * 1e3, current / 1024, peak / 1024
+        ))
+        pass
+    pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,170 @@
+"""Resident Pokemon memory benchmark.
+
+Measures, with ``tracemalloc``, the bytes allocated per Pokemon kept in
+memory with every field decoded, as an archive indexer does: team
+Pokemon (``Pokemon``, both sub-data blocks) and PC box Pokemon
+(``BoxPokemon``), each over its own copy of the Pokemon bytes. The
+``dict-backed`` column is the baseline: sub-data blocks without
+``__slots__``, storing their derived containers (EVs and IVs lists and
+dicts, decryption key, substructure order) on decode, as done before they
+declared ``__slots__``.
+
+Usage::
+
+    python -m benchmarks.bench_memory [--sav rr.sav] [--count 10000]
+"""
+from contextlib import contextmanager
+import argparse
+import gc
+import tracemalloc
+
+from rr_parser import pkms
+from rr_parser.encryption import SUBSTRUCTURE_ORDER
+from rr_parser.enums import GameType
+from rr_parser.games import RadicalRed
+from rr_parser.pkms import Pokemon, BoxPokemon
+
+_STATS = ['HP', 'Atk', 'Def', 'Spe', 'SpA', 'SpD']
+
+
+# Subclasses without __slots__ get a __dict__ back.
+class _DictGrowth(pkms.Growth):
+    pass
+
+
+class _DictAttacks(pkms.Attacks):
+    pass
+
+
+class _DictEVs(pkms.EVs):
+    def update_from_data(self):
+        self.evs_list = self._evs
+        self.evs_dict = dict(zip(_STATS, self.evs_list))
+        pass
+    pass
+
+
+class _DictMisc(pkms.Misc):
+    def update_from_data(self):
+        super().update_from_data()
+        self.ivs_list = self.IVs
+        self.ivs_dict = dict(zip(_STATS, self.ivs_list))
+        pass
+    pass
+
+
+class _DictDecryptedData(pkms.DecryptedData):
+    def __init__(self, b: bytes, pid: int, ot_id: int, isBoxMon=False):
+        super().__init__(b, pid, ot_id, isBoxMon)
+        if not isBoxMon:
+            self.decrypt_key = (pid ^ ot_id) & ((1 << 32) - 1)
+            pass
+        pass
+    pass
+
+
+class _DictEncryptedData(pkms.EncryptedData):
+    def __init__(self, b: bytes, pid: int, ot_id: int, decrypted=None):
+        self.sub_order = SUBSTRUCTURE_ORDER[pid % 24].upper()
+        super().__init__(b, pid, ot_id, decrypted)
+        pass
+    pass
+
+
+_DICT_BACKED = {
+    "Growth": _DictGrowth,
+    "Attacks": _DictAttacks,
+    "EVs": _DictEVs,
+    "Misc": _DictMisc,
+    "DecryptedData": _DictDecryptedData,
+    "EncryptedData": _DictEncryptedData
+}
+
+
+@contextmanager
+def _dict_backed():
+    # Pokemon build their sub-data blocks from the pkms module classes.
+    classes = {name: getattr(pkms, name) for name in _DICT_BACKED}
+    for name, cls in _DICT_BACKED.items():
+        setattr(pkms, name, cls)
+        pass
+    try:
+        yield
+    finally:
+        for name, cls in classes.items():
+            setattr(pkms, name, cls)
+            pass
+        pass
+    pass
+
+
+def _decode_team(pkm: Pokemon):
+    pkm.nickname, pkm.ot_name, pkm.language, pkm.status, pkm.hp
+    for sub_data in (pkm.sub_data_decrypted, pkm.sub_data_encrypted):
+        sub_data.species, sub_data.evs
+        pass
+    pass
+
+
+def _decode_box(pkm: BoxPokemon):
+    pkm.nickname, pkm.ot_name, pkm.markings
+    sub_data = pkm.sub_data
+    sub_data.growth.species, sub_data.attacks.moves, sub_data.evs
+    sub_data.misc.IVs
+    pass
+
+
+def _bytes_per_pokemon(records: list[bytes], build, decode,
+                       count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    resident = list()
+    for i in range(0, count):
+        pkm = build(bytes(records[i % len(records)]))
+        decode(pkm)
+        resident.append(pkm)
+        pass
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sav', type=str, default='rr.sav')
+    parser.add_argument('--count', type=int, default=10000)
+    args = parser.parse_args()
+
+    with open(args.sav, "rb") as f:
+        game_save = RadicalRed(f.read()).game_save
+        pass
+    team = [
+        bytes(pkm.data) for pkm in game_save.team.team_pokemon_list
+    ]
+    boxes = [
+        bytes(pkm.data)
+        for box in game_save.pc.boxes for pkm in box.pokemon
+        if pkm.species != 0
+    ]
+
+    print("{:<12}{:>16}{:>12}{:>10}".format(
+        "bytes / pkm", "dict-backed", "slots", "ratio"
+    ))
+    for name, records, build, decode in (
+            ("team", team, lambda b: Pokemon(b, GameType.RR), _decode_team),
+            ("box", boxes, lambda b: BoxPokemon(b, GameType.RR), _decode_box)
+    ):
+        with _dict_backed():
+            baseline = _bytes_per_pokemon(records, build, decode, args.count)
+            pass
+        per_pokemon = _bytes_per_pokemon(records, build, decode, args.count)
+        print("{:<12}{:>16.1f}{:>12.1f}{:>10.2f}".format(
+            name, baseline, per_pokemon, per_pokemon / baseline
+        ))
+        pass
+    pass
+
+
+if __name__ == '__main__':
+    main()
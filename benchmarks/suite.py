@@ -0,0 +1,335 @@
+"""Savegame benchmark suite, checked against a committed baseline.
+
+Times the main parser and editor operations on the committed ``rr.sav``
+and on a synthetic savegame built from it (every PC slot filled, a single
+team Pokemon, so that a Pokemon can be inserted): cold import, parse,
+validation, money and Pokedex edits, Pokemon creation, full PC decoding
+and set export. Pokemon creation fetches the species data missing from the
+bundled dataset from PokeAPI on its first run (see
+``fetch_missing_species_data``), outside of the timings.
+
+Every benchmark is run ``--rounds`` times (fast ones until ``--min_time``
+seconds are timed), with its setup (e.g. parsing a fresh savegame) left
+out of the timings. The best time of each one is compared against the
+baseline, and the suite fails if any of them is slower than the baseline
+by more than ``--threshold``, or if any of them raises. Timings depend on the machine, regenerate
+the baseline with ``--save_baseline`` when comparing on another one.
+
+Usage::
+
+    python -m benchmarks.suite [--sav rr.sav] [--rounds 20]
+    python -m benchmarks.suite --save_baseline
+"""
+from contextlib import redirect_stdout
+from dataclasses import dataclass, asdict
+from typing import Callable, Optional
+import argparse
+import gc
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+from rr_parser.games import RadicalRed
+from rr_parser.game_saves import PC_SECTIONS
+from rr_parser.sections import BYTES_PER_PKM
+from rr_parser.functions import set_money, complete_pokedex, \
+    create_and_insert_pokemon, export_pkm_sets_for_calc
+
+from .bench_import import _run
+from .bench_load import _BOX_FIELDS
+
+BASELINE_FILE: str = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "baseline.json"
+)
+
+# Benchmarks timed in a fresh interpreter, returning their own timing.
+SELF_TIMED = {"import_cold"}
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    rounds: int
+    min: float
+    mean: float
+    stddev: float
+    pass
+
+
+def full_pc_save(data: bytes) -> bytes:
+    """Synthetic savegame: every PC slot filled with copies of the stored
+    Pokemon, and a single team Pokemon."""
+    g = RadicalRed(data)
+    game_save = g.game_save
+    storage = game_save.pc.storage
+    records = [
+        bytes(storage._data[s * BYTES_PER_PKM:(s + 1) * BYTES_PER_PKM])
+        for s in storage.occupied()
+    ]
+    pc = bytearray(game_save.pc.data)
+    for slot in range(0, storage.n_slots):
+        offset = 0x4 + slot * BYTES_PER_PKM
+        pc[offset:offset + BYTES_PER_PKM] = records[slot % len(records)]
+        pass
+
+    # Scatter the PC buffer back into its sections.
+    offset = 0
+    for sec_id in PC_SECTIONS:
+        sec_data = game_save.sections[sec_id].data
+        sec_data[:] = pc[offset:offset + len(sec_data)]
+        offset += len(sec_data)
+        game_save.update_section(sec_id)
+        pass
+
+    team = game_save.team
+    team._section[0x0034:0x0034 + 4] = (1).to_bytes(4, 'little')
+    team.update_security()
+    game_save.update_section(1)
+    game_save.update_from_sub_data()
+    assert g.check_valid()
+    return bytes(g.data)
+
+
+def _unvalidated(d: bytes) -> tuple[RadicalRed]:
+    # Parsing validates the savegame, drop the cached section checksums.
+    g = RadicalRed(d)
+    for game_save in (g.game_save_a, g.game_save_b):
+        for sec in game_save.sections.values():
+            sec._valid = None
+            pass
+        pass
+    return (g,)
+
+
+def _decode_pc(g: RadicalRed):
+    for box in g.game_save.pc.boxes:
+        for pkm in box.pokemon:
+            for name in _BOX_FIELDS:
+                getattr(pkm, name)
+                pass
+            pass
+        pass
+    pass
+
+
+def _export(g: RadicalRed):
+    with redirect_stdout(io.StringIO()):
+        export_pkm_sets_for_calc(g, os.devnull, level=50)
+        pass
+    pass
+
+
+def benchmarks(data: bytes) -> dict[str, tuple[Callable, Callable]]:
+    """Benchmarks, by name, as a setup and a timed function, called with
+    whatever the setup returns."""
+    synthetic = full_pc_save(data)
+
+    def _parse(d: bytes) -> Callable:
+        return lambda: (RadicalRed(d),)
+
+    return {
+        "import_cold": (
+            lambda: (), lambda: _run("import rr_parser")[0]
+        ),
+        "parse": (
+            lambda: (data,), RadicalRed
+        ),
+        "parse_full_pc": (
+            lambda: (synthetic,), RadicalRed
+        ),
+        "check_valid": (
+            lambda: _unvalidated(data), lambda g: g.check_valid()
+        ),
+        "set_money": (
+            _parse(data), lambda g: set_money(g, 123456)
+        ),
+        "complete_pokedex": (
+            _parse(data), complete_pokedex
+        ),
+        "create_and_insert_pokemon": (
+            _parse(synthetic),
+            lambda g: create_and_insert_pokemon(g, "bulbasaur", level=50)
+        ),
+        "decode_pc_full": (
+            _parse(synthetic), _decode_pc
+        ),
+        "export_pkm_sets_for_calc": (
+            _parse(synthetic), _export
+        )
+    }
+
+
+def _time(name: str, setup: Callable, func: Callable, rounds: int,
+          min_time: float, max_rounds: int) -> BenchmarkResult:
+    func(*setup())  # Warm up caches and lazy imports.
+    times = list()
+    # Keep garbage collection out of the timings, previous rounds are
+    # collected before timing the next one.
+    gc.disable()
+    try:
+        while len(times) < rounds or (
+                sum(times) < min_time and len(times) < max_rounds):
+            gc.collect()
+            args = setup()
+            t0 = time.perf_counter()
+            elapsed = func(*args)
+            t1 = time.perf_counter()
+            times.append(elapsed if name in SELF_TIMED else t1 - t0)
+            pass
+        pass
+    finally:
+        gc.enable()
+        pass
+    return BenchmarkResult(
+        name=name,
+        rounds=len(times),
+        min=min(times),
+        mean=statistics.mean(times),
+        stddev=statistics.stdev(times) if len(times) > 1 else 0.0
+    )
+
+
+def run(data: bytes, rounds: int, min_time: float = 0.0,
+        max_rounds: int = 1000, names: Optional[list[str]] = None
+        ) -> tuple[list[BenchmarkResult], dict[str, str]]:
+    """Run the benchmarks.
+
+    A benchmark raising does not stop the others.
+
+    Parameters
+    ----------
+    data : bytes
+        Radical Red savegame.
+    rounds : int
+        Timed rounds per benchmark, at least.
+    min_time : float
+        Fast benchmarks run more rounds, until their timings add up to
+        ``min_time`` seconds or they reach ``max_rounds``.
+    max_rounds : int
+        Maximum number of rounds.
+    names : Optional[list[str]]
+        Benchmarks to run, all by default.
+
+    Returns
+    -------
+    tuple[list[BenchmarkResult], dict[str, str]]
+        Timings, in seconds, and errors of the benchmarks which raised, by
+        name.
+    """
+    results = list()
+    failures = dict()
+    for name, (setup, func) in benchmarks(data).items():
+        if names is not None and name not in names:
+            continue
+        try:
+            results.append(
+                _time(name, setup, func, rounds, min_time, max_rounds)
+            )
+        except Exception as e:
+            failures[name] = "{}: {}".format(type(e).__name__, e)
+            pass
+        pass
+    return results, failures
+
+
+def compare(results: list[BenchmarkResult], baseline: dict,
+            threshold: float) -> list[str]:
+    """Names of the benchmarks slower than the baseline by more than
+    ``threshold`` (e.g. 0.25 for 25%)."""
+    reference = baseline.get("benchmarks", {})
+    return [
+        r.name for r in results
+        if r.name in reference and
+        r.min > reference[r.name]["min"] * (1 + threshold)
+    ]
+
+
+def main(argv: Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sav', type=str, default='rr.sav')
+    parser.add_argument('--rounds', type=int, default=20)
+    parser.add_argument('--min_time', type=float, default=0.05,
+                        help="Minimum timed seconds per benchmark.")
+    parser.add_argument('--only', nargs='+', type=str, default=None,
+                        help="Benchmarks to run, all by default.")
+    parser.add_argument('--baseline', type=str, default=BASELINE_FILE)
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="Allowed slowdown over the baseline.")
+    parser.add_argument('--save_baseline', action='store_true',
+                        help="Write the results as the new baseline.")
+    parser.add_argument('--json', type=str, default=None,
+                        help="Also write the results to this file.")
+    args = parser.parse_args(argv)
+
+    with open(args.sav, "rb") as f:
+        data = f.read()
+        pass
+    results, failures = run(data, args.rounds, args.min_time,
+                            names=args.only)
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "benchmarks": {
+            r.name: {k: v for k, v in asdict(r).items() if k != "name"}
+            for r in results
+        }
+    }
+
+    baseline = dict()
+    if not args.save_baseline and os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+            pass
+        pass
+    reference = baseline.get("benchmarks", {})
+
+    print("{:<28}{:>12}{:>12}{:>14}{:>10}".format(
+        "benchmark", "min (ms)", "mean (ms)", "baseline (ms)", "ratio"
+    ))
+    for r in results:
+        ref = reference.get(r.name, None)
+        print("{:<28}{:>12.3f}{:>12.3f}{:>14}{:>10}".format(
+            r.name, r.min * 1e3, r.mean * 1e3,
+            "-" if ref is None else "{:.3f}".format(ref["min"] * 1e3),
+            "-" if ref is None else "{:.2f}".format(r.min / ref["min"])
+        ))
+        pass
+    for name, error in failures.items():
+        print("{:<28}{:>12}".format(name, "failed"))
+        print("  {}".format(error), file=sys.stderr)
+        pass
+
+    # A partial baseline would silently stop checking failed benchmarks.
+    save_baseline = args.save_baseline and not failures
+    for filename in ([args.baseline] if save_baseline else []) + \
+            ([args.json] if args.json else []):
+        with open(filename, "w") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+            pass
+        pass
+
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print("Slower than the baseline by more than {:.0%}: {}".format(
+            args.threshold, ", ".join(regressions)
+        ), file=sys.stderr)
+        pass
+    if failures:
+        print("Failed: {}{}".format(
+            ", ".join(failures),
+            ", baseline not saved" if args.save_baseline else ""
+        ), file=sys.stderr)
+        pass
+    if regressions or failures:
+        # Exit here, so that the gate fails however main is called.
+        sys.exit(1)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,22 +1,52 @@
-from .functions import export_first_team_pkm, save_game, \
-    load_radical_red_game, clone_first_team_pkm, create_and_insert_pokemon,\
-    set_pokedex_entry, clear_pokedex, complete_pokedex, infinite_money,\
-    set_money
 from .games import RadicalRed, FireRed
 from .pkms import Pokemon
+from .profiling import profile
+
+# Savegame editing helpers live in ``functions``, which pulls in the
+# constants tables and the Pokemon builder. It is only imported on first
+# access (PEP 562), so parsing and validating a savegame stays cheap.
+_LAZY_FUNCTIONS = (
+    "clone_first_team_pkm",
+    "export_first_team_pkm",
+    "load_radical_red_game",
+    "set_pokedex_entry",
+    "set_pokedex_entries",
+    "complete_pokedex",
+    "clear_pokedex",
+    "save_game",
+    "write_back_game",
+    "create_and_insert_pokemon",
+    "infinite_money",
+    "set_money"
+)
+
+
+def __getattr__(name: str):
+    if name in _LAZY_FUNCTIONS:
+        from . import functions
+        return getattr(functions, name)
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + list(_LAZY_FUNCTIONS))
+
 
 __all__ = [
     "clone_first_team_pkm",
     "export_first_team_pkm",
     "load_radical_red_game",
     "set_pokedex_entry",
+    "set_pokedex_entries",
     "complete_pokedex",
     "clear_pokedex",
     "save_game",
+    "write_back_game",
     "create_and_insert_pokemon",
     "infinite_money",
     "set_money",
     "RadicalRed",
     "FireRed",
-    "Pokemon"
+    "Pokemon",
+    "profile"
 ]
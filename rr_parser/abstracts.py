@@ -29,6 +29,8 @@ class SectionChecksum(ABC):
 
 
 class UpdatableData(ABC):
+    __slots__ = ()
+
     @property
     @abstractmethod
     def data(self) -> bytes:
@@ -130,6 +132,8 @@ class Section(UpdatableData):
 
 
 class Pokemon(UpdatableData, Gen3Charset):
+    __slots__ = ()
+
     LANGUAGES = {
         0x0201: "Japanese",
         0x0202: "English",
@@ -155,6 +159,8 @@ class Pokemon(UpdatableData, Gen3Charset):
 
 
 class PokemonSubData(UpdatableData, Gen3Charset):
+    __slots__ = ()
+
     @property
     @abstractmethod
     def species(self) -> int:
@@ -0,0 +1,349 @@
+"""Batch savegame scanner.
+
+Parses many savegames across a process pool and streams one result per
+file: trainer info, team, boxes and validity. Every savegame is parsed
+read-only, straight from a memory mapping, and a corrupt savegame only
+fails its own result.
+
+Usage::
+
+    python -m rr_parser.batch savs/ "archive/**/*.sav" --workers 8 > out.jsonl
+"""
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import redirect_stdout
+from dataclasses import dataclass, field, asdict
+from typing import Iterable, Iterator, Optional, Union
+import argparse
+import glob
+import itertools
+import json
+import mmap
+import os
+import sys
+
+from .enums import GameType
+from .functions import SAVEGAME_SIZES
+from .exceptions import InvalidSizeException
+from .games import Gen3, RadicalRed, FireRed
+
+GAMES = {
+    "rr": RadicalRed,
+    "fr": FireRed
+}
+
+
+@dataclass
+class PokemonSummary:
+    species: int
+    nickname: str
+    level: Optional[int] = None
+    pid: int = 0
+    pass
+
+
+@dataclass
+class ScanResult:
+    filename: str
+    ok: bool
+    error: Optional[str] = None
+    valid: bool = False
+    game: Optional[str] = None
+    player_name: Optional[str] = None
+    player_gender: Optional[str] = None
+    trainer_id: Optional[int] = None
+    played_time: Optional[tuple[int, int, int]] = None
+    team: list[PokemonSummary] = field(default_factory=list)
+    boxes: Optional[list[list[PokemonSummary]]] = None
+
+    def to_json(self) -> dict:
+        return asdict(self)
+    pass
+
+
+def scan_save(filename: str, game: str = "rr",
+              boxes: bool = True) -> ScanResult:
+    """Parse a savegame read-only and summarize it.
+
+    Never raises: any error is reported in the result instead.
+
+    Parameters
+    ----------
+    filename : str
+        Savegame path.
+    game : {'rr', 'fr'}
+        Savegame type.
+    boxes : bool
+        Whether to summarize the PC boxes too.
+
+    Returns
+    -------
+    ScanResult
+        Savegame summary, or error if it could not be parsed.
+    """
+    try:
+        with open(filename, "rb") as f:
+            if f.seek(0, 2) not in SAVEGAME_SIZES:
+                raise InvalidSizeException("Savegame size is not 128 KiB.")
+            # Unmapped once the parsed savegame is released.
+            b = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            pass
+        return _summarize(filename, GAMES[game](b), game, boxes)
+    except Exception as e:
+        return ScanResult(
+            filename=filename,
+            ok=False,
+            error="{}: {}".format(type(e).__name__, e)
+        )
+
+
+def _summarize(filename: str, g: Gen3, game: str,
+               boxes: bool) -> ScanResult:
+    game_save = g.game_save
+    trainer_info = game_save.trainer_info
+    result = ScanResult(
+        filename=filename,
+        ok=True,
+        valid=g.check_valid(),
+        game=game,
+        player_name=trainer_info.player_name,
+        player_gender=trainer_info.player_gender,
+        trainer_id=trainer_info.trainer_id,
+        played_time=trainer_info.played_time,
+        team=[
+            PokemonSummary(
+                species=pkm.sub_data.species,
+                nickname=pkm.nickname,
+                level=pkm.level,
+                pid=pkm.pid
+            )
+            for pkm in game_save.team.team_pokemon_list
+        ]
+    )
+    if boxes and g.gt == GameType(GameType.RR):
+        pc = game_save.pc
+        storage = pc.storage
+        nicknames = storage.nicknames()
+        result.boxes = [
+            [
+                PokemonSummary(
+                    species=storage.species[slot],
+                    nickname=nicknames[slot],
+                    pid=storage.pid[slot]
+                )
+                for slot in storage.occupied(box.id)
+            ]
+            for box in pc.boxes
+        ]
+        pass
+    return result
+
+
+def _scan_chunk(filenames: list[str], game: str,
+                boxes: bool) -> list[ScanResult]:
+    # Parser warnings must not mix with results streamed to stdout.
+    with redirect_stdout(sys.stderr):
+        return [scan_save(filename, game, boxes) for filename in filenames]
+
+
+def find_saves(paths: Iterable[str], pattern: str = "*.sav") -> Iterator[str]:
+    """Expand directories and glob patterns into savegame paths.
+
+    Parameters
+    ----------
+    paths : Iterable[str]
+        Savegame paths, directories (searched recursively for ``pattern``)
+        or glob patterns (``**`` is recursive).
+    pattern : str
+        Savegame file name pattern used within directories.
+
+    Returns
+    -------
+    Iterator[str]
+        Savegame paths, lazily, in sorted order within each input path.
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            yield from sorted(glob.iglob(
+                os.path.join(glob.escape(path), "**", pattern),
+                recursive=True
+            ))
+            pass
+        elif os.path.exists(path):
+            yield path
+            pass
+        else:
+            yield from sorted(glob.iglob(path, recursive=True))
+            pass
+        pass
+    pass
+
+
+def _chunks(it: Iterator[str], size: int) -> Iterator[list[str]]:
+    chunk = list()
+    for item in it:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = list()
+            pass
+        pass
+    if chunk:
+        yield chunk
+        pass
+    pass
+
+
+def scan_saves(paths: Union[str, Iterable[str]],
+               game: str = "rr",
+               workers: Optional[int] = None,
+               chunk_size: int = 16,
+               boxes: bool = True) -> Iterator[ScanResult]:
+    """Scan many savegames in parallel, streaming results as they finish.
+
+    Files are submitted in chunks of ``chunk_size``, and at most two chunks
+    per worker are in flight, so that arbitrarily large archives are
+    scanned in bounded memory. If a worker process dies, the pool is
+    restarted and only the chunk it was scanning fails.
+
+    Parameters
+    ----------
+    paths : Union[str, Iterable[str]]
+        Savegame paths, directories or glob patterns, see ``find_saves``.
+    game : {'rr', 'fr'}
+        Savegame type.
+    workers : Optional[int]
+        Number of worker processes, CPU count by default. If 0, scan in the
+        calling process.
+    chunk_size : int
+        Number of savegames per submitted task.
+    boxes : bool
+        Whether to summarize the PC boxes too.
+
+    Returns
+    -------
+    Iterator[ScanResult]
+        One result per savegame, in completion order.
+    """
+    if game not in GAMES:
+        raise ValueError(f"Invalid game: {game}")
+    if isinstance(paths, str):
+        paths = [paths]
+        pass
+    chunks = _chunks(find_saves(paths), max(1, chunk_size))
+
+    if workers == 0:
+        for chunk in chunks:
+            yield from _scan_chunk(chunk, game, boxes)
+            pass
+        return
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+        pass
+    executor = ProcessPoolExecutor(max_workers=workers)
+    pending = dict()
+    # Chunks in flight when a worker died, rescanned one at a time in a new
+    # pool to find the one that killed it.
+    suspects = list()
+    broken = False
+    try:
+        while True:
+            limit = 0 if broken else 1 if suspects else 2 * workers
+            while len(pending) < limit:
+                if suspects:
+                    chunk = suspects.pop()
+                    pass
+                else:
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        break
+                    pass
+                try:
+                    future = executor.submit(_scan_chunk, chunk, game, boxes)
+                except BrokenProcessPool:
+                    # Not scanned yet, submit it again to the new pool.
+                    chunks = itertools.chain([chunk], chunks)
+                    broken = True
+                    break
+                pending[future] = chunk
+                pass
+            if not pending:
+                if not broken:
+                    break
+                executor.shutdown()
+                executor = ProcessPoolExecutor(max_workers=workers)
+                broken = False
+                continue
+            alone = len(pending) == 1
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                chunk = pending.pop(future)
+                try:
+                    results = future.result()
+                except BrokenProcessPool as e:
+                    broken = True
+                    if not alone:
+                        suspects.append(chunk)
+                        continue
+                    # Only chunk in flight, its worker died.
+                    results = _failed_chunk(chunk, e)
+                except Exception as e:
+                    results = _failed_chunk(chunk, e)
+                yield from results
+                pass
+            pass
+        pass
+    finally:
+        executor.shutdown()
+        pass
+    pass
+
+
+def _failed_chunk(chunk: list[str], e: Exception) -> list[ScanResult]:
+    error = "{}: {}".format(type(e).__name__, e)
+    return [
+        ScanResult(filename=filename, ok=False, error=error)
+        for filename in chunk
+    ]
+
+
+def main(argv: Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(
+        description="Scan savegames in parallel and print one JSON line per "
+                    "savegame."
+    )
+    parser.add_argument('paths', nargs='+', type=str,
+                        help="Savegames, directories or glob patterns.")
+    parser.add_argument('--game', type=str, choices=list(GAMES), default='rr')
+    parser.add_argument('--workers', '-j', type=int, default=None,
+                        help="Worker processes, CPU count by default. 0 "
+                             "scans in-process.")
+    parser.add_argument('--chunk_size', type=int, default=16)
+    parser.add_argument('--no_boxes', action='store_true',
+                        help="Skip PC boxes.")
+    args = parser.parse_args(argv)
+
+    n_files = n_errors = 0
+    for result in scan_saves(args.paths, args.game, args.workers,
+                             args.chunk_size, not args.no_boxes):
+        n_files += 1
+        n_errors += not result.ok
+        sys.stdout.write(json.dumps(result.to_json()) + "\n")
+        pass
+    print("Scanned {} savegames, {} errors.".format(n_files, n_errors),
+          file=sys.stderr)
+    return 1 if n_errors else 0
+
+
+__all__ = [
+    "ScanResult",
+    "PokemonSummary",
+    "scan_save",
+    "scan_saves",
+    "find_saves"
+]
+
+
+if __name__ == '__main__':
+    sys.exit(main())
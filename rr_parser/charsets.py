@@ -1,5 +1,8 @@
+from codecs import charmap_decode
 from typing import Union
 
+from . import profiling
+
 INTER_CHARSET = {
     0x00: " ",
     0x01: "À",
@@ -148,42 +151,107 @@ INTER_CHARSET = {
 
 INTER_CHARSET_INV = {v: k for k, v in INTER_CHARSET.items()}
 
+# String terminator.
+TERMINATOR = 0xFF
+
+# Decoding table, character of every byte value (unknown bytes decode as a
+# space). ``codecs.charmap_decode`` translates a whole string at once.
+DECODE_TABLE: str = "".join(INTER_CHARSET.get(i, " ") for i in range(256))
+
+# Same table, decoding the terminator as a sentinel character, for
+# splitting strings decoded in bulk.
+_SENTINEL = "\uffff"
+_DECODE_TABLE_TERM: str = DECODE_TABLE[:TERMINATOR] + _SENTINEL
+
+# Encoding table for ``str.translate``, then Latin-1 encoding maps every
+# character to its byte value.
+ENCODE_TABLE = str.maketrans({
+    c: chr(b) for c, b in INTER_CHARSET_INV.items()
+})
+_ENCODABLE = frozenset(INTER_CHARSET_INV)
+
+
+def _decode(b: bytes) -> str:
+    # Decode up to the terminator.
+    b = bytes(b)
+    end = b.find(TERMINATOR)
+    if end >= 0:
+        b = b[:end]
+        pass
+    return charmap_decode(b, "strict", DECODE_TABLE)[0]
+
 
 class Gen3Charset:
+    __slots__ = ()
+
     @staticmethod
     def bin2char3(b: Union[int, bytes]) -> str:
-        if isinstance(b, bytes) or isinstance(b, bytearray):
-            s_arr = ""
-            for bb in b:
-                if bb == 0xFF:
-                    break
-                    pass
-                s_arr += Gen3Charset.bin2char3(bb)
-                pass
-            return s_arr
-        else:
-            if b in INTER_CHARSET:
-                return INTER_CHARSET[b]
-            else:
-                return " "
-            pass
-        pass
+        """Decode a Gen3 string, up to its terminator, or a single byte."""
+        if isinstance(b, int):
+            return DECODE_TABLE[b]
+        if profiling.active is not None:
+            profiling.active.count("strings_decoded")
+            return profiling.active.timed("charset_decode", _decode, b)
+        return _decode(b)
+
+    @staticmethod
+    def decode_many(data: Union[bytes, memoryview], count: int,
+                    length: int, stride: int, offset: int = 0) -> list[str]:
+        """Decode fixed-size Gen3 strings laid out at a regular stride.
+
+        The whole window is decoded in a single call, e.g. every PC box
+        Pokemon nickname at once.
+
+        Parameters
+        ----------
+        data : Union[bytes, memoryview]
+            Records, back to back.
+        count : int
+            Number of strings.
+        length : int
+            Maximum string length, in bytes.
+        stride : int
+            Record size, in bytes.
+        offset : int
+            Offset of the first string.
+
+        Returns
+        -------
+        list[str]
+            Decoded strings, each one up to its terminator.
+        """
+        if count <= 0:
+            return list()
+        if profiling.active is not None:
+            profiling.active.count("strings_decoded", count)
+            return profiling.active.timed(
+                "charset_decode", Gen3Charset._decode_many, data, count,
+                length, stride, offset
+            )
+        return Gen3Charset._decode_many(data, count, length, stride, offset)
+
+    @staticmethod
+    def _decode_many(data: Union[bytes, memoryview], count: int,
+                     length: int, stride: int, offset: int) -> list[str]:
+        end = offset + (count - 1) * stride + length
+        assert (len(data) >= end)
+        text = charmap_decode(
+            bytes(data[offset:end]), "strict", _DECODE_TABLE_TERM
+        )[0]
+        return [
+            text[i:i + length].partition(_SENTINEL)[0]
+            for i in range(0, count * stride, stride)
+        ]
 
     @staticmethod
     def ascii2bin(c: str) -> Union[int, bytes]:
+        """Encode a string (unknown characters encode as 0x00), or a single
+        character into its byte value."""
         if isinstance(c, str) and len(c) > 1:
-            s_arr = bytearray()
-            for cc in c:
-                s_arr.append(Gen3Charset.ascii2bin(cc))
-                pass
-            return bytes(s_arr)
-        else:
-            if c in INTER_CHARSET_INV:
-                return INTER_CHARSET_INV[c]
-            else:
-                return 0x00
-            pass
-        pass
+            if _ENCODABLE.issuperset(c):
+                return c.translate(ENCODE_TABLE).encode("latin-1")
+            return bytes(INTER_CHARSET_INV.get(cc, 0x00) for cc in c)
+        return INTER_CHARSET_INV.get(c, 0x00)
 
 
-__all__ = ["Gen3Charset"]
+__all__ = ["Gen3Charset", "DECODE_TABLE", "ENCODE_TABLE", "TERMINATOR"]
@@ -1,7 +1,21 @@
 import ctypes
+import struct
+import sys
+from array import array
 
 from .abstracts import SectionChecksum
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# 32 bit unsigned array typecode, platform dependent.
+_WORD_TYPECODE = next(
+    (tc for tc in ('I', 'L') if array(tc).itemsize == 4),
+    None
+)
+
 # Gen3 section data size used for generating each section's correct checksum.
 DATA_SIZES = [
         3884,  # 0, Trainer info.
@@ -39,6 +53,81 @@ RR_DATA_SIZES = [
     ]
 
 
+def _sum_words_numpy(section_data: bytes, n_words: int) -> int:
+    """Sum ``n_words`` little endian 32 bit words using NumPy."""
+    words = numpy.frombuffer(section_data, dtype='<u4', count=n_words)
+    return int(words.sum(dtype=numpy.uint64))
+
+
+def _sum_words_memoryview(section_data: bytes, n_words: int) -> int:
+    """Sum ``n_words`` 32 bit words through a native ``memoryview`` cast.
+
+    Only valid on little endian hosts whose C ``unsigned int`` is 4 bytes
+    long, as the cast uses the native word layout.
+    """
+    return sum(memoryview(section_data)[:n_words << 2].cast('B').cast('I'))
+
+
+def _sum_words_array(section_data: bytes, n_words: int) -> int:
+    """Sum ``n_words`` little endian 32 bit words using ``array``."""
+    words = array(_WORD_TYPECODE)
+    words.frombytes(bytes(section_data[:n_words << 2]))
+    if sys.byteorder != 'little':
+        words.byteswap()
+        pass
+    return sum(words)
+
+
+def _sum_words_python(section_data: bytes, n_words: int) -> int:
+    """Reference implementation: add 4 bytes at a time."""
+    checksum = 0
+    for i in range(0, n_words):
+        inc = int.from_bytes(section_data[i * 4:(i + 1) * 4], 'little')
+        checksum = checksum + inc
+        pass
+    return checksum
+
+
+def _fold_checksum(checksum: int) -> bytes:
+    """Fold a 32 bit word sum into the 2 byte section checksum."""
+    # 3-4. Split and get the checksum.
+    tmp = (checksum >> 16)
+    tmp = tmp + checksum
+    checksum = tmp & ((1 << 16) - 1)
+    return checksum.to_bytes(2, 'little')
+
+
+# Word summing backends, from fastest to slowest.
+CHECKSUM_BACKENDS = dict()
+if numpy is not None:
+    CHECKSUM_BACKENDS["numpy"] = _sum_words_numpy
+if sys.byteorder == 'little' and array('I').itemsize == 4:
+    CHECKSUM_BACKENDS["memoryview"] = _sum_words_memoryview
+if _WORD_TYPECODE is not None:
+    CHECKSUM_BACKENDS["array"] = _sum_words_array
+CHECKSUM_BACKENDS["python"] = _sum_words_python
+
+CHECKSUM_BACKEND: str = next(iter(CHECKSUM_BACKENDS))
+_sum_words = CHECKSUM_BACKENDS[CHECKSUM_BACKEND]
+
+
+def set_checksum_backend(name: str):
+    """Select the section checksum backend.
+
+    Parameters
+    ----------
+    name : str
+        One of ``CHECKSUM_BACKENDS`` keys: 'numpy' (if installed),
+        'memoryview', 'array' or 'python'.
+    """
+    global CHECKSUM_BACKEND, _sum_words
+    if name not in CHECKSUM_BACKENDS:
+        raise ValueError("Unavailable checksum backend: '{}'.".format(name))
+    CHECKSUM_BACKEND = name
+    _sum_words = CHECKSUM_BACKENDS[name]
+    pass
+
+
 class RRSectionChecksum(SectionChecksum):
     @staticmethod
     def get_checksum(section_data: bytes, section_id: int) -> bytes:
@@ -49,24 +138,13 @@ class RRSectionChecksum(SectionChecksum):
         """
 
         # Invalid section, return bad value.
-        if 0 > section_id >= 14:
+        if not 0 <= section_id < 14:
             return bytes([0xFF, 0xFF])
         pass
 
-        # 1. Initialize checksum.
-        checksum = 0
-
-        # 2. Add 4-bytes at a time to checksum.
-        for i in range(0, RR_DATA_SIZES[section_id] >> 2):
-            inc = int.from_bytes(section_data[i * 4:(i + 1) * 4], 'little')
-            checksum = checksum + inc
-            pass
-
-        # 3-4. Split and get the checksum.
-        tmp = (checksum >> 16)
-        tmp = tmp + checksum
-        checksum = tmp & ((1 << 16) - 1)
-        return checksum.to_bytes(2, 'little')
+        return _fold_checksum(
+            _sum_words(section_data, RR_DATA_SIZES[section_id] >> 2)
+        )
 
     pass
 
@@ -75,38 +153,25 @@ class Gen3SectionChecksum(SectionChecksum):
     @staticmethod
     def get_checksum(section_data: bytes, section_id: int) -> bytes:
         # Invalid section, return bad value.
-        if 0 > section_id >= 14:
+        if not 0 <= section_id < 14:
             return bytes([0xFF, 0xFF])
         pass
 
-        # 1. Initialize checksum.
-        checksum = 0
+        return _fold_checksum(
+            _sum_words(section_data, DATA_SIZES[section_id] >> 2)
+        )
 
-        # 2. Add 4-bytes at a time to checksum.
-        for i in range(0, DATA_SIZES[section_id] >> 2):
-            inc = int.from_bytes(section_data[i * 4:(i + 1) * 4], 'little')
-            checksum = checksum + inc
-            pass
+    pass
 
-        # 3-4. Split and get the checksum.
-        tmp = (checksum >> 16)
-        tmp = tmp + checksum
-        checksum = tmp & ((1 << 16) - 1)
-        return checksum.to_bytes(2, 'little')
 
-    pass
+# Pokemon sub-data, as 24 little endian half words.
+_SUB_DATA_HALF_WORDS = struct.Struct('<24H')
 
 
 class Gen3PokemonChecksum:
     @staticmethod
     def get_checksum(decrypted_sub_data: bytes) -> bytes:
-        checksum = 0
-        for i in range(0, 48 >> 1):
-            checksum = checksum + int.from_bytes(
-                decrypted_sub_data[i * 2:(i + 1) * 2],
-                'little'
-            )
-            pass
+        checksum = sum(_SUB_DATA_HALF_WORDS.unpack_from(decrypted_sub_data))
         checksum = ctypes.c_uint16(checksum).value
         checksum_bytes = checksum.to_bytes(2, 'little')
         return checksum_bytes
@@ -114,4 +179,10 @@ class Gen3PokemonChecksum:
     pass
 
 
-__all__ = ["RRSectionChecksum", "Gen3SectionChecksum", "Gen3PokemonChecksum"]
+__all__ = [
+    "RRSectionChecksum",
+    "Gen3SectionChecksum",
+    "Gen3PokemonChecksum",
+    "CHECKSUM_BACKENDS",
+    "set_checksum_backend"
+]
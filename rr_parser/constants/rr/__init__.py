@@ -1,11 +1,8 @@
 from dataclasses import dataclass
 
-from . import _species as module_species
-from . import _learnset as module_learnset
-from . import _pps as module_pps
 from . import _abilities as module_abilities
-from . import _pokedex as module_pokedex
-from . import _items as module_items
+from .species_registry import SPECIES_IDS, POKEDEX_IDS
+from .data_pack import get_data_pack
 
 from typing import Optional, List
 import re
@@ -33,8 +30,7 @@ def get_species_id(species: str) -> Optional[int]:
     Optional[int]
         Species ID if species was found or else, None.
     """
-    species_name = "SPECIES_{}".format(species).upper()
-    return getattr(module_species, species_name, None)
+    return SPECIES_IDS.get(species.upper(), None)
 
 
 def get_species_pokedex_id(species: str) -> Optional[int]:
@@ -50,8 +46,7 @@ def get_species_pokedex_id(species: str) -> Optional[int]:
     Optional[int]
         Species Pokedex ID if species was found or else, None.
     """
-    species_name = "NATIONAL_DEX_{}".format(species).upper()
-    return getattr(module_pokedex, species_name, None)
+    return POKEDEX_IDS.get(species.upper(), None)
 
 
 def get_ability_id(ability: str) -> Optional[int]:
@@ -72,6 +67,27 @@ def get_ability_id(ability: str) -> Optional[int]:
     return getattr(module_abilities, ab, None)
 
 
+def get_move_pp(move_id: int) -> Optional[int]:
+    """Get RadicalRed move PP from its index.
+
+    Parameters
+    ----------
+    move_id : int
+        RadicalRed move index.
+
+    Returns
+    -------
+    Optional[int]
+        Move PP if the move has a PP entry or else, None.
+    """
+    data_pack = get_data_pack()
+    if data_pack is not None:
+        return data_pack.move_pp(move_id)
+    # PP table is only imported without a data pack.
+    from . import _pps as module_pps
+    return module_pps.gBattleMoves.get(move_id, None)
+
+
 def get_species_learnset(species: str) -> Optional[List[MoveLevel]]:
     """Get RadicalRed Pokemon species learnset moves' IDs.
 
@@ -86,17 +102,26 @@ def get_species_learnset(species: str) -> Optional[List[MoveLevel]]:
         If species was not found, return None, else, return a list of
         moves.
     """
-    species_name = "SPECIES_{}".format(species).upper()
-    sp_id = getattr(module_species, species_name, None)
+    sp_id = SPECIES_IDS.get(species.upper(), None)
     if sp_id is None:
         return None
-    moves = module_learnset.gLevelUpLearnsets.get(sp_id, None)
+    data_pack = get_data_pack()
+    if data_pack is not None:
+        moves = data_pack.learnset(sp_id)
+        pass
+    else:
+        # Largest constants table, only imported without a data pack.
+        from . import _learnset as module_learnset
+        moves = module_learnset.gLevelUpLearnsets.get(sp_id, None)
+        pass
     if moves is None:
         return None
 
     moves_out: list[MoveLevel] = list()
     for lvl, move_id in moves:
-        pp = module_pps.gBattleMoves[move_id]
+        pp = get_move_pp(move_id)
+        if pp is None:
+            raise KeyError(move_id)
         moves_out.append(
             MoveLevel(
                 id=move_id,
@@ -113,5 +138,6 @@ __all__ = [
     "get_species_pokedex_id",
     "get_species_learnset",
     "get_ability_id",
+    "get_move_pp",
     "MoveLevel"
 ]
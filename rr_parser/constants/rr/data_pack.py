@@ -0,0 +1,351 @@
+"""Compiled binary pack of the RadicalRed constants tables.
+
+Learnsets, the PP table and the species and National Pokedex constants are
+packed into one compact little endian file of fixed-width records, so they
+can be read without importing (and unmarshalling) the generated Python
+tables. Learnsets are decoded lazily, one species at a time, straight from
+a memory mapping of the file.
+
+Layout::
+
+    header      '<4sHH'      magic, version, number of tables
+    directory   '<II' x n    offset and record count of every table
+    tables      see TABLE_* below, each one 4-byte aligned
+
+Regenerate it after editing the constants tables::
+
+    python -m rr_parser.constants.rr.data_pack
+"""
+from bisect import bisect_left
+from typing import Optional
+import mmap
+import os
+import struct
+
+DATA_PACK_MAGIC: bytes = b"RRDP"
+DATA_PACK_VERSION: int = 1
+
+DATA_PACK_FILE: str = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "_data_pack.bin"
+)
+
+_HEADER = struct.Struct('<4sHH')
+_DIRECTORY_ENTRY = struct.Struct('<II')
+
+# Tables, in file order, and their record layout.
+TABLE_PPS = 0  # 'B' by move ID, 0xFF if the move has no PP entry.
+TABLE_LEARNSET_KEYS = 1  # '<I' species ID, sorted.
+TABLE_LEARNSET_INDEX = 2  # '<I' first learnset move, one extra end record.
+TABLE_LEARNSET_MOVES = 3  # '<HH' level and move ID.
+TABLE_SPECIES_KEYS = 4  # '<I' species ID, sorted.
+TABLE_SPECIES = 5  # '<Ii' name offset and National Pokedex ID (-1 if none).
+TABLE_SPECIES_ALIASES = 6  # '<II' name offset and species ID.
+TABLE_POKEDEX_ALIASES = 7  # '<II' name offset and National Pokedex ID.
+TABLE_STRINGS = 8  # NUL terminated ASCII names.
+NUM_TABLES = 9
+
+_RECORDS = {
+    TABLE_PPS: struct.Struct('B'),
+    TABLE_LEARNSET_KEYS: struct.Struct('<I'),
+    TABLE_LEARNSET_INDEX: struct.Struct('<I'),
+    TABLE_LEARNSET_MOVES: struct.Struct('<HH'),
+    TABLE_SPECIES_KEYS: struct.Struct('<I'),
+    TABLE_SPECIES: struct.Struct('<Ii'),
+    TABLE_SPECIES_ALIASES: struct.Struct('<II'),
+    TABLE_POKEDEX_ALIASES: struct.Struct('<II'),
+    TABLE_STRINGS: struct.Struct('B')
+}
+
+_NO_PP = 0xFF
+
+
+def build_data_pack(filename: str = DATA_PACK_FILE) -> int:
+    """Pack the constants tables into a binary data pack.
+
+    Parameters
+    ----------
+    filename : str
+        Output path, bundled data pack by default.
+
+    Returns
+    -------
+    int
+        Data pack size in bytes.
+    """
+    from . import _learnset as module_learnset
+    from . import _pps as module_pps
+    from .species_registry import tables_registry
+
+    SPECIES_IDS, SPECIES_NAMES, POKEDEX_IDS, SPECIES_POKEDEX_IDS = \
+        tables_registry()
+
+    strings = bytearray()
+    string_offsets: dict[str, int] = dict()
+
+    def string(name: str) -> int:
+        if name not in string_offsets:
+            string_offsets[name] = len(strings)
+            strings.extend(name.encode('ascii') + b'\x00')
+            pass
+        return string_offsets[name]
+
+    tables: list[list[tuple]] = [list() for _ in range(0, NUM_TABLES)]
+
+    pps = module_pps.gBattleMoves
+    tables[TABLE_PPS] = [
+        (pps.get(move_id, _NO_PP),) for move_id in range(0, max(pps) + 1)
+    ]
+
+    learnsets = module_learnset.gLevelUpLearnsets
+    for species_id in sorted(learnsets):
+        tables[TABLE_LEARNSET_KEYS].append((species_id,))
+        tables[TABLE_LEARNSET_INDEX].append(
+            (len(tables[TABLE_LEARNSET_MOVES]),)
+        )
+        tables[TABLE_LEARNSET_MOVES].extend(learnsets[species_id])
+        pass
+    tables[TABLE_LEARNSET_INDEX].append((len(tables[TABLE_LEARNSET_MOVES]),))
+
+    for species_id in sorted(SPECIES_NAMES):
+        dex = SPECIES_POKEDEX_IDS.get(species_id, None)
+        tables[TABLE_SPECIES_KEYS].append((species_id,))
+        tables[TABLE_SPECIES].append((
+            string(SPECIES_NAMES[species_id]),
+            -1 if dex is None else dex
+        ))
+        pass
+    tables[TABLE_SPECIES_ALIASES] = [
+        (string(name), species_id) for name, species_id in SPECIES_IDS.items()
+    ]
+    tables[TABLE_POKEDEX_ALIASES] = [
+        (string(name), dex) for name, dex in POKEDEX_IDS.items()
+    ]
+
+    packed: list[bytes] = list()
+    for i, records in enumerate(tables):
+        if i == TABLE_STRINGS:
+            packed.append(bytes(strings))
+            pass
+        else:
+            packed.append(b''.join(_RECORDS[i].pack(*r) for r in records))
+            pass
+        pass
+
+    out = bytearray(_HEADER.pack(DATA_PACK_MAGIC, DATA_PACK_VERSION, NUM_TABLES))
+    offset = len(out) + NUM_TABLES * _DIRECTORY_ENTRY.size
+    directory = bytearray()
+    for i, table in enumerate(packed):
+        offset += -offset % 4
+        count = len(table) // _RECORDS[i].size
+        directory.extend(_DIRECTORY_ENTRY.pack(offset, count))
+        offset += len(table)
+        pass
+    out.extend(directory)
+    for table in packed:
+        out.extend(bytes(-len(out) % 4))
+        out.extend(table)
+        pass
+
+    with open(filename, 'wb') as f:
+        f.write(out)
+        pass
+    return len(out)
+
+
+class DataPack:
+    """Memory-mapped reader of a binary data pack.
+
+    Only the small sorted key tables are decoded when opened. Learnsets are
+    decoded per species on every lookup and name tables on first name
+    lookup.
+    """
+
+    def __init__(self, filename: str = DATA_PACK_FILE):
+        with open(filename, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            pass
+        magic, version, n_tables = _HEADER.unpack_from(self._mm, 0)
+        if magic != DATA_PACK_MAGIC or version != DATA_PACK_VERSION or \
+                n_tables != NUM_TABLES:
+            self._mm.close()
+            raise ValueError(f"Invalid data pack: {filename}")
+        self._tables: list[tuple[int, int]] = [
+            _DIRECTORY_ENTRY.unpack_from(
+                self._mm,
+                _HEADER.size + i * _DIRECTORY_ENTRY.size
+            )
+            for i in range(0, NUM_TABLES)
+        ]
+        self._learnset_keys = self._keys(TABLE_LEARNSET_KEYS)
+        self._species_keys = self._keys(TABLE_SPECIES_KEYS)
+        self._species_ids: Optional[dict[str, int]] = None
+        self._pokedex_ids: Optional[dict[str, int]] = None
+        pass
+
+    def _table(self, table: int) -> memoryview:
+        offset, count = self._tables[table]
+        return memoryview(self._mm)[
+            offset:offset + count * _RECORDS[table].size
+        ]
+
+    def _keys(self, table: int) -> list[int]:
+        return [k for k, in _RECORDS[table].iter_unpack(self._table(table))]
+
+    def _record(self, table: int, i: int) -> tuple:
+        offset, _ = self._tables[table]
+        rec = _RECORDS[table]
+        return rec.unpack_from(self._mm, offset + i * rec.size)
+
+    @staticmethod
+    def _find(keys: list[int], key: int) -> Optional[int]:
+        i = bisect_left(keys, key)
+        return i if i < len(keys) and keys[i] == key else None
+
+    def _string(self, offset: int) -> str:
+        start = self._tables[TABLE_STRINGS][0] + offset
+        return self._mm[start:self._mm.find(b'\x00', start)].decode('ascii')
+
+    def _aliases(self, table: int) -> dict[str, int]:
+        return {
+            self._string(name): value
+            for name, value in _RECORDS[table].iter_unpack(self._table(table))
+        }
+
+    def learnset(self, species_id: int) -> Optional[list[tuple[int, int]]]:
+        """Get a species level up learnset.
+
+        Parameters
+        ----------
+        species_id : int
+            RadicalRed species index.
+
+        Returns
+        -------
+        Optional[list[tuple[int, int]]]
+            Level and move index pairs, as in ``gLevelUpLearnsets``, if
+            found or else, None.
+        """
+        i = self._find(self._learnset_keys, species_id)
+        if i is None:
+            return None
+        start, = self._record(TABLE_LEARNSET_INDEX, i)
+        end, = self._record(TABLE_LEARNSET_INDEX, i + 1)
+        rec = _RECORDS[TABLE_LEARNSET_MOVES]
+        return list(rec.iter_unpack(
+            self._table(TABLE_LEARNSET_MOVES)[start * rec.size:end * rec.size]
+        ))
+
+    def move_pp(self, move_id: int) -> Optional[int]:
+        """Get a move PP, None if the move has no PP entry."""
+        if not 0 <= move_id < self._tables[TABLE_PPS][1]:
+            return None
+        pp, = self._record(TABLE_PPS, move_id)
+        return None if pp == _NO_PP else pp
+
+    def species_name(self, species_id: int) -> Optional[str]:
+        """Get a species constant name (without 'SPECIES_')."""
+        i = self._find(self._species_keys, species_id)
+        if i is None:
+            return None
+        return self._string(self._record(TABLE_SPECIES, i)[0])
+
+    def species_dex(self, species_id: int) -> Optional[int]:
+        """Get a species National Pokedex index."""
+        i = self._find(self._species_keys, species_id)
+        if i is None:
+            return None
+        dex = self._record(TABLE_SPECIES, i)[1]
+        return None if dex < 0 else dex
+
+    def species_id(self, name: str) -> Optional[int]:
+        """Get a species index from its case sensitive constant name (without
+        'SPECIES_').
+        """
+        if self._species_ids is None:
+            self._species_ids = self._aliases(TABLE_SPECIES_ALIASES)
+            pass
+        return self._species_ids.get(name, None)
+
+    def pokedex_id(self, name: str) -> Optional[int]:
+        """Get a National Pokedex index from its case sensitive constant name
+        (without 'NATIONAL_DEX_').
+        """
+        if self._pokedex_ids is None:
+            self._pokedex_ids = self._aliases(TABLE_POKEDEX_ALIASES)
+            pass
+        return self._pokedex_ids.get(name, None)
+
+    def species(self) -> list[tuple[int, str, Optional[int]]]:
+        """Get every species index, constant name (without 'SPECIES_') and
+        National Pokedex index (None if it has no entry), sorted by index.
+        """
+        return [
+            (species_id, self._string(name), None if dex < 0 else dex)
+            for species_id, (name, dex) in zip(
+                self._species_keys,
+                _RECORDS[TABLE_SPECIES].iter_unpack(
+                    self._table(TABLE_SPECIES)
+                )
+            )
+        ]
+
+    def species_ids(self) -> dict[str, int]:
+        """Get every species index, by constant name (without 'SPECIES_')."""
+        if self._species_ids is None:
+            self._species_ids = self._aliases(TABLE_SPECIES_ALIASES)
+            pass
+        return dict(self._species_ids)
+
+    def pokedex_ids(self) -> dict[str, int]:
+        """Get every National Pokedex index, by constant name (without
+        'NATIONAL_DEX_').
+        """
+        if self._pokedex_ids is None:
+            self._pokedex_ids = self._aliases(TABLE_POKEDEX_ALIASES)
+            pass
+        return dict(self._pokedex_ids)
+
+    def close(self):
+        self._mm.close()
+        pass
+    pass
+
+
+_DATA_PACK: Optional[DataPack] = None
+_DATA_PACK_LOADED: bool = False
+
+
+def get_data_pack() -> Optional[DataPack]:
+    """Get the bundled data pack, opened once.
+
+    Returns
+    -------
+    Optional[DataPack]
+        Bundled data pack reader, or None if it is missing or outdated, in
+        which case the Python constants tables are to be used.
+    """
+    global _DATA_PACK, _DATA_PACK_LOADED
+    if not _DATA_PACK_LOADED:
+        _DATA_PACK_LOADED = True
+        try:
+            _DATA_PACK = DataPack()
+        except (OSError, ValueError):
+            print("W: Constants data pack not available, using Python tables.")
+            _DATA_PACK = None
+            pass
+        pass
+    return _DATA_PACK
+
+
+__all__ = [
+    "DataPack",
+    "build_data_pack",
+    "get_data_pack",
+    "DATA_PACK_FILE",
+    "DATA_PACK_VERSION"
+]
+
+
+if __name__ == '__main__':
+    print("Wrote {} bytes to '{}'.".format(build_data_pack(), DATA_PACK_FILE))
@@ -0,0 +1,134 @@
+from dataclasses import dataclass
+from typing import Optional
+import csv
+import os
+import re
+
+from . import get_move_pp
+
+MOVE_NAMES_FILE: str = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "move_names.tsv"
+)
+
+
+@dataclass(frozen=True)
+class MoveData:
+    id: int
+    name: str
+    pp: int
+    type: Optional[str] = None
+    category: Optional[str] = None
+    pass
+
+
+# Move data by move ID.
+MOVES: dict[int, MoveData] = dict()
+
+# Move ID by normalized name, see ``_normalize``.
+MOVE_IDS: dict[str, int] = dict()
+
+
+def _normalize(name: str) -> str:
+    # 'Double Slap', 'DOUBLE_SLAP' and 'doubleslap' are the same move.
+    return re.sub(r"[^a-zA-Z0-9]+", '', name).upper()
+
+
+def _load():
+    # Resolve the 'MOVE_<name>' constant names first, they take priority
+    # over the table names.
+    from . import _moves as module_moves
+    for v, val in vars(module_moves).items():
+        if v.startswith("MOVE_") and isinstance(val, int):
+            MOVE_IDS.setdefault(_normalize(v[len("MOVE_"):]), val)
+            pass
+        pass
+
+    # Rows: hexadecimal ID, name and, optionally, type and category. Some
+    # IDs are listed twice, the first row wins.
+    with open(MOVE_NAMES_FILE, 'r', newline='') as f:
+        rd = csv.reader(f, delimiter='\t')
+        for row in rd:
+            if not row:
+                continue
+            move_id = int(row[0], 16)
+            MOVES.setdefault(move_id, MoveData(
+                id=move_id,
+                name=row[1].title(),
+                pp=get_move_pp(move_id) or 0,
+                type=row[2] if len(row) > 2 and row[2] else None,
+                category=row[3] if len(row) > 3 and row[3] else None
+            ))
+            MOVE_IDS.setdefault(_normalize(row[1]), move_id)
+            pass
+        pass
+    pass
+
+
+def _moves() -> dict[int, MoveData]:
+    # Load move table once, on first lookup.
+    if not MOVES:
+        _load()
+        pass
+    return MOVES
+
+
+def get_move(move_id: int) -> Optional[MoveData]:
+    """Get RadicalRed move data from its index.
+
+    Parameters
+    ----------
+    move_id : int
+        RadicalRed move index.
+
+    Returns
+    -------
+    Optional[MoveData]
+        Move name, PP, type and category if found or else, None.
+    """
+    return _moves().get(move_id, None)
+
+
+def get_move_name(move_id: int) -> Optional[str]:
+    """Get RadicalRed move name from its index.
+
+    Parameters
+    ----------
+    move_id : int
+        RadicalRed move index.
+
+    Returns
+    -------
+    Optional[str]
+        Title-cased move name if found or else, None.
+    """
+    move = _moves().get(move_id, None)
+    return None if move is None else move.name
+
+
+def get_move_id(name: str) -> Optional[int]:
+    """Get RadicalRed move index from its name.
+
+    Parameters
+    ----------
+    name : str
+        Case insensitive move name, with or without spaces, or move
+        constant name (without 'MOVE_').
+
+    Returns
+    -------
+    Optional[int]
+        Move index if found or else, None.
+    """
+    _moves()
+    return MOVE_IDS.get(_normalize(name), None)
+
+
+__all__ = [
+    "MoveData",
+    "MOVES",
+    "MOVE_IDS",
+    "get_move",
+    "get_move_name",
+    "get_move_id"
+]
@@ -0,0 +1,125 @@
+"""Species and National Pokedex names and indices.
+
+Read from the constants data pack, the Python constants tables are only
+imported if it is not available.
+"""
+from typing import Optional
+
+from .data_pack import get_data_pack
+
+# Species IDs by constant name (without 'SPECIES_'), e.g. 'BULBASAUR'.
+SPECIES_IDS: dict[str, int] = dict()
+
+# Species constant name by ID. Several constants may share an ID, keep the
+# last one in alphabetical order.
+SPECIES_NAMES: dict[int, str] = dict()
+
+# National Pokedex IDs by constant name (without 'NATIONAL_DEX_').
+POKEDEX_IDS: dict[str, int] = dict()
+
+# National Pokedex ID by species ID, None if species has no entry.
+SPECIES_POKEDEX_IDS: dict[int, Optional[int]] = dict()
+
+
+def tables_registry() -> tuple[dict, dict, dict, dict]:
+    """Build the registry from the Python constants tables.
+
+    Returns
+    -------
+    tuple[dict, dict, dict, dict]
+        ``SPECIES_IDS``, ``SPECIES_NAMES``, ``POKEDEX_IDS`` and
+        ``SPECIES_POKEDEX_IDS``.
+    """
+    from . import _species as module_species
+    from . import _pokedex as module_pokedex
+
+    species_ids, species_names, pokedex_ids, species_pokedex_ids = \
+        dict(), dict(), dict(), dict()
+    for v in dir(module_species)[::-1]:
+        val = getattr(module_species, v)
+        if not isinstance(val, int):
+            continue
+        if v.startswith("SPECIES_"):
+            species_ids[v[len("SPECIES_"):]] = val
+            pass
+        species_names.setdefault(val, v[v.find('_') + 1:])
+        pass
+
+    for v in dir(module_pokedex):
+        if v.startswith("NATIONAL_DEX_"):
+            pokedex_ids[v[len("NATIONAL_DEX_"):]] = getattr(module_pokedex, v)
+            pass
+        pass
+
+    for species_id, name in species_names.items():
+        species_pokedex_ids[species_id] = pokedex_ids.get(name, None)
+        pass
+    return species_ids, species_names, pokedex_ids, species_pokedex_ids
+
+
+def _build():
+    data_pack = get_data_pack()
+    if data_pack is None:
+        species_ids, species_names, pokedex_ids, species_pokedex_ids = \
+            tables_registry()
+        pass
+    else:
+        species_ids = data_pack.species_ids()
+        pokedex_ids = data_pack.pokedex_ids()
+        species_names, species_pokedex_ids = dict(), dict()
+        for species_id, name, dex in data_pack.species():
+            species_names[species_id] = name
+            species_pokedex_ids[species_id] = dex
+            pass
+        pass
+    SPECIES_IDS.update(species_ids)
+    SPECIES_NAMES.update(species_names)
+    POKEDEX_IDS.update(pokedex_ids)
+    SPECIES_POKEDEX_IDS.update(species_pokedex_ids)
+    pass
+
+
+_build()
+
+
+def get_species_name(species_id: int) -> Optional[str]:
+    """Get RadicalRed species constant name from its index.
+
+    Parameters
+    ----------
+    species_id : int
+        RadicalRed species index.
+
+    Returns
+    -------
+    Optional[str]
+        Species name (as in 'SPECIES_<name>') if found or else, None.
+    """
+    return SPECIES_NAMES.get(species_id, None)
+
+
+def get_species_dex(species_id: int) -> Optional[int]:
+    """Get National Pokedex index from RadicalRed species index.
+
+    Parameters
+    ----------
+    species_id : int
+        RadicalRed species index.
+
+    Returns
+    -------
+    Optional[int]
+        National Pokedex index if found or else, None.
+    """
+    return SPECIES_POKEDEX_IDS.get(species_id, None)
+
+
+__all__ = [
+    "SPECIES_IDS",
+    "SPECIES_NAMES",
+    "POKEDEX_IDS",
+    "SPECIES_POKEDEX_IDS",
+    "get_species_name",
+    "get_species_dex",
+    "tables_registry"
+]
@@ -0,0 +1,483 @@
+from dataclasses import dataclass
+from typing import Optional, Union
+from bisect import bisect_right
+import json
+import os
+import re
+
+from .rr import get_move_pp as _get_move_pp
+
+SPECIES_DB_VERSION: int = 1
+
+SPECIES_DB_FILE: str = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "_species_db.json"
+)
+
+# Species data fetched from PokeAPI for species missing fields in the
+# bundled dataset, next to the pokebase cache.
+SPECIES_CACHE_FILE: str = os.path.join(
+    os.path.expanduser("~"), ".cache", "rr_parser", "species_db.json"
+)
+
+# Pokemon names, IDs and RadicalRed abilities the dataset is generated from.
+PKM_DB_FILE: str = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "rr", "_pokemon.json"
+)
+
+# Stats order used by the savegame (and Pokemon builder).
+STAT_NAMES = [
+    "hp",
+    "attack",
+    "defense",
+    "speed",
+    "special-attack",
+    "special-defense"
+]
+
+
+@dataclass
+class AbilitySlot:
+    name: str
+    is_hidden: bool
+    pass
+
+
+@dataclass
+class SpeciesData:
+    id: int
+    name: str
+    growth_rate: Optional[str] = None
+    base_stats: Optional[list[int]] = None
+    abilities: Optional[list[AbilitySlot]] = None
+    learnset_fr: Optional[list[tuple[int, int, str]]] = None
+
+    def is_complete(self, fr_learnset: bool = False) -> bool:
+        """Whether every field needed for building a Pokemon is present.
+
+        Parameters
+        ----------
+        fr_learnset : bool
+            Whether the FireRed learnset is needed as well.
+
+        Returns
+        -------
+        bool
+            True if the Pokemon can be built without any online request.
+        """
+        is_complete = self.growth_rate is not None and \
+            self.base_stats is not None and \
+            self.abilities is not None
+        if fr_learnset:
+            is_complete = is_complete and self.learnset_fr is not None
+            pass
+        return is_complete
+
+    def to_json(self) -> dict:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "growth_rate": self.growth_rate,
+            "base_stats": self.base_stats,
+            "abilities": None if self.abilities is None else [
+                [ab.name, ab.is_hidden] for ab in self.abilities
+            ],
+            "learnset_fr": None if self.learnset_fr is None else [
+                list(mv) for mv in self.learnset_fr
+            ]
+        }
+
+    @classmethod
+    def from_json(cls, d: dict) -> "SpeciesData":
+        abilities = d.get("abilities", None)
+        learnset_fr = d.get("learnset_fr", None)
+        return cls(
+            id=d["id"],
+            name=d["name"],
+            growth_rate=d.get("growth_rate", None),
+            base_stats=d.get("base_stats", None),
+            abilities=None if abilities is None else [
+                AbilitySlot(name=name, is_hidden=is_hidden)
+                for name, is_hidden in abilities
+            ],
+            learnset_fr=None if learnset_fr is None else [
+                (move_id, lvl, name) for move_id, lvl, name in learnset_fr
+            ]
+        )
+    pass
+
+
+def _growth_experience(growth_rate: str, n: int) -> int:
+    """Experience needed to reach level ``n`` (Gen3 formulas)."""
+    if n == 1:
+        return 0
+    n3 = n ** 3
+    if growth_rate == "fast":
+        return 4 * n3 // 5
+    elif growth_rate == "medium":
+        return n3
+    elif growth_rate == "medium-slow":
+        return 6 * n3 // 5 - 15 * n * n + 100 * n - 140
+    elif growth_rate == "slow":
+        return 5 * n3 // 4
+    elif growth_rate == "slow-then-very-fast":
+        # Erratic.
+        if n < 50:
+            return n3 * (100 - n) // 50
+        elif n < 68:
+            return n3 * (150 - n) // 100
+        elif n < 98:
+            return n3 * ((1911 - 10 * n) // 3) // 500
+        else:
+            return n3 * (160 - n) // 100
+    elif growth_rate == "fast-then-very-slow":
+        # Fluctuating.
+        if n < 15:
+            return n3 * ((n + 1) // 3 + 24) // 50
+        elif n < 36:
+            return n3 * (n + 14) // 50
+        else:
+            return n3 * (n // 2 + 32) // 50
+    raise ValueError(f"Unknown growth rate: {growth_rate}")
+
+
+def create_growth_tables() -> dict[str, list[int]]:
+    """Create the experience tables of every growth rate.
+
+    Returns
+    -------
+    dict[str, list[int]]
+        Experience needed for levels 1 to 100, by PokeAPI growth rate name.
+    """
+    return {
+        gr: [_growth_experience(gr, lvl) for lvl in range(1, 101)]
+        for gr in [
+            "slow",
+            "medium",
+            "fast",
+            "medium-slow",
+            "slow-then-very-fast",
+            "fast-then-very-slow"
+        ]
+    }
+
+
+_SPECIES_DB: Optional[dict] = None
+
+
+def _read_species_cache() -> dict[str, dict]:
+    # Species data fetched so far, by name, empty if none (or outdated).
+    try:
+        with open(SPECIES_CACHE_FILE) as f:
+            cache = json.load(f)
+            pass
+    except (OSError, ValueError):
+        return dict()
+    if cache.get("version", None) != SPECIES_DB_VERSION:
+        return dict()
+    return cache.get("species", dict())
+
+
+def _write_species_cache(data: SpeciesData):
+    species = _read_species_cache()
+    species[data.name.lower()] = data.to_json()
+    tmp = "{}.tmp{}".format(SPECIES_CACHE_FILE, os.getpid())
+    try:
+        os.makedirs(os.path.dirname(SPECIES_CACHE_FILE), exist_ok=True)
+        with open(tmp, "w") as f:
+            json.dump({"version": SPECIES_DB_VERSION, "species": species}, f,
+                      separators=(',', ':'))
+            pass
+        os.replace(tmp, SPECIES_CACHE_FILE)
+        pass
+    except OSError as e:
+        # Still cached in memory for this process.
+        print("W: Could not write species data cache: {}".format(e))
+        pass
+    pass
+
+
+def _species_db() -> dict:
+    # Load bundled dataset, and species data fetched so far, once.
+    global _SPECIES_DB
+    if _SPECIES_DB is None:
+        with open(SPECIES_DB_FILE) as f:
+            db = json.load(f)
+            pass
+        if db.get("version", None) != SPECIES_DB_VERSION:
+            print("W: Species dataset version mismatch, ignoring it.")
+            db = {"version": SPECIES_DB_VERSION, "species": {}}
+            pass
+        if not db.get("growth_rates", None):
+            db["growth_rates"] = create_growth_tables()
+            pass
+        db["species"].update(_read_species_cache())
+        db["species"] = {
+            name: SpeciesData.from_json(d)
+            for name, d in db["species"].items()
+        }
+        _SPECIES_DB = db
+        pass
+    return _SPECIES_DB
+
+
+def get_species_data(species: str) -> Optional[SpeciesData]:
+    """Get the bundled species data from its PokeAPI name.
+
+    Parameters
+    ----------
+    species : str
+        PokeAPI name of the Pokemon species.
+
+    Returns
+    -------
+    Optional[SpeciesData]
+        Species data if species was found or else, None.
+    """
+    return _species_db()["species"].get(species.lower(), None)
+
+
+def get_experience(growth_rate: str, level: int) -> int:
+    """Get the experience needed to reach a level.
+
+    Parameters
+    ----------
+    growth_rate : str
+        PokeAPI growth rate name.
+    level : int
+        Level, in [1, 100].
+
+    Returns
+    -------
+    int
+        Experience points.
+    """
+    assert (0 < level <= 100)
+    return _species_db()["growth_rates"][growth_rate][level - 1]
+
+
+def get_level(growth_rate: str, exp: int) -> int:
+    """Get the level reached with some experience.
+
+    Parameters
+    ----------
+    growth_rate : str
+        PokeAPI growth rate name.
+    exp : int
+        Experience points.
+
+    Returns
+    -------
+    int
+        Level, in [1, 100].
+    """
+    return max(1, bisect_right(_species_db()["growth_rates"][growth_rate], exp))
+
+def fetch_species_data(species: Union[str, int]) -> SpeciesData:
+    """Fetch species data from PokeAPI.
+
+    Used for generating the bundled dataset (see ``generate_species_db``),
+    and for filling in the fields it misses (see
+    ``fetch_missing_species_data``). Needs network access and ``pokebase``.
+
+    Parameters
+    ----------
+    species : Union[str, int]
+        PokeAPI name (or ID) of the Pokemon, alternate forms included.
+
+    Returns
+    -------
+    SpeciesData
+        Complete species data.
+    """
+    import pokebase as pb
+
+    pkm = pb.pokemon(species)
+    pkm_species = pb.pokemon_species(pkm.species.name)
+
+    base_stats: list[int] = [0] * 6
+    for st in pkm.stats:
+        base_stats[STAT_NAMES.index(st.stat.name)] = st.base_stat
+        pass
+
+    learnset_fr: list[tuple[int, int, str]] = list()
+    for move in pkm.moves:
+        version_group_detail = None
+        for vgd in move.version_group_details:
+            if vgd.version_group.name == "firered-leafgreen":
+                version_group_detail = vgd
+                pass
+            pass
+        if version_group_detail is not None and \
+                version_group_detail.move_learn_method.name == "level-up":
+            id_match = re.search(r"/move/(?P<id>[0-9]+)/?$", move.move.url)
+            learnset_fr.append((
+                int(id_match.group("id")),
+                version_group_detail.level_learned_at,
+                move.move.name
+            ))
+            pass
+        pass
+
+    return SpeciesData(
+        id=pkm.id,
+        name=pkm.name,
+        growth_rate=pkm_species.growth_rate.name,
+        base_stats=base_stats,
+        abilities=[
+            AbilitySlot(name=ab.ability.name, is_hidden=ab.is_hidden)
+            for ab in pkm.abilities
+        ],
+        learnset_fr=learnset_fr
+    )
+
+
+def fetch_missing_species_data(data: SpeciesData,
+                               fr_learnset: bool = False) -> SpeciesData:
+    """Fill in the fields missing from species data, from PokeAPI.
+
+    Fetched fields are kept in the in-memory dataset and in
+    ``SPECIES_CACHE_FILE``, so that every species is fetched at most once.
+    Needs network access and ``pokebase``.
+
+    Parameters
+    ----------
+    data : SpeciesData
+        Species data of the dataset, completed in place.
+    fr_learnset : bool
+        Whether the FireRed learnset is needed as well.
+
+    Returns
+    -------
+    SpeciesData
+        ``data``, complete.
+
+    Raises
+    ------
+    ImportError
+        If ``pokebase`` is not installed.
+    OSError
+        If PokeAPI could not be reached, or does not know the species.
+    """
+    if data.is_complete(fr_learnset):
+        return data
+    fetched = fetch_species_data(data.name)
+    # Abilities of the dataset are RadicalRed ones, keep them.
+    if data.growth_rate is None:
+        data.growth_rate = fetched.growth_rate
+        pass
+    if data.base_stats is None:
+        data.base_stats = fetched.base_stats
+        pass
+    if data.abilities is None:
+        data.abilities = fetched.abilities
+        pass
+    if data.learnset_fr is None:
+        data.learnset_fr = fetched.learnset_fr
+        pass
+    _write_species_cache(data)
+    return data
+
+
+def get_move_pp(move_id: int) -> int:
+    """Get the move PP from the RadicalRed moves table.
+
+    Parameters
+    ----------
+    move_id : int
+        Move index.
+
+    Returns
+    -------
+    int
+        Move PP.
+    """
+    pp = _get_move_pp(move_id)
+    if pp is None:
+        raise KeyError(move_id)
+    return pp
+
+
+def generate_species_db(fetch: bool = False) -> list[SpeciesData]:
+    """Generate the species dataset from the RadicalRed Pokemon table.
+
+    Names, IDs and abilities come from ``_pokemon.json``, whose last
+    ability is the hidden one if there are several. Growth rates, base
+    stats and FireRed learnsets are not part of the repository tables, and
+    are left missing unless fetched.
+
+    Parameters
+    ----------
+    fetch : bool
+        Whether to fill in growth rates, base stats and FireRed learnsets
+        from PokeAPI, for species (not alternate forms). Needs network
+        access and ``pokebase``.
+
+    Returns
+    -------
+    list[SpeciesData]
+        Species data, by Pokemon table order.
+    """
+    with open(PKM_DB_FILE) as f:
+        pkm_db = json.load(f)
+        pass
+
+    species = list()
+    for idx, info in pkm_db.items():
+        names = info["abilities"]
+        data = SpeciesData(
+            id=info["id"],
+            name=info["name"],
+            abilities=[
+                AbilitySlot(name=name, is_hidden=len(names) > 1 and
+                            i == len(names) - 1)
+                for i, name in enumerate(names)
+            ]
+        )
+        if fetch and int(idx) < 10000:
+            fetched = fetch_species_data(int(idx))
+            data.growth_rate = fetched.growth_rate
+            data.base_stats = fetched.base_stats
+            data.learnset_fr = fetched.learnset_fr
+            pass
+        species.append(data)
+        pass
+    return species
+
+
+def dump_species_db(species: list[SpeciesData], filename: str = SPECIES_DB_FILE):
+    """Write the species dataset.
+
+    Parameters
+    ----------
+    species : list[SpeciesData]
+        Species data to store.
+    filename : str
+        Output path, bundled dataset by default.
+    """
+    db = {
+        "version": SPECIES_DB_VERSION,
+        "growth_rates": create_growth_tables(),
+        "species": {sp.name.lower(): sp.to_json() for sp in species}
+    }
+    with open(filename, "w") as f:
+        json.dump(db, f, separators=(',', ':'))
+        pass
+    pass
+
+
+__all__ = [
+    "SpeciesData",
+    "AbilitySlot",
+    "get_species_data",
+    "get_experience",
+    "get_level",
+    "get_move_pp",
+    "fetch_species_data",
+    "fetch_missing_species_data",
+    "generate_species_db",
+    "create_growth_tables",
+    "dump_species_db",
+    "SPECIES_DB_VERSION"
+]
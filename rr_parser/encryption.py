@@ -0,0 +1,234 @@
+"""Gen3 Pokemon sub-data XOR codec.
+
+A Pokemon 48 bytes sub-data block is stored shuffled, by PID, and each of
+its 12 little endian words XOR-ed with ``PID ^ OT ID``. The XOR is done on
+the whole block at once, as a single 384 bit integer, and batches of blocks
+are XOR-ed at once too (with NumPy, if installed).
+"""
+from typing import Sequence
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+SUB_DATA_SIZE: int = 48
+
+SUBSTRUCTURE_ORDER = {
+        0: "GAEM",
+        6: "AGEM",
+        12: "EGAM",
+        18: "MGAE",
+        1: "GAME",
+        7: "AGME",
+        13: "EGMA",
+        19: "MGEA",
+        2: "GEAM",
+        8: "AEGM",
+        14: "EAGM",
+        20: "MAGE",
+        3: "GEMA",
+        9: "AEMG",
+        15: "EAMG",
+        21: "MAEG",
+        4: "GMAE",
+        10: "AMGE",
+        16: "EMGA",
+        22: "MEGA",
+        5: "GMEA",
+        11: "AMEG",
+        17: "EMAG",
+        23: "MEAG"
+    }
+
+# Stored block index of the growth, attacks, EVs and misc blocks, by PID % 24.
+_BLOCK_INDICES: dict[int, tuple[int, int, int, int]] = {
+    k: tuple(order.find(block) for block in "GAEM")
+    for k, order in SUBSTRUCTURE_ORDER.items()
+}
+
+# Multiplying a 32 bit key by it repeats the key on all 12 words.
+_KEY_REPEAT: int = int.from_bytes(bytes([1, 0, 0, 0]) * 12, 'little')
+
+_WORD_MASK: int = (1 << 32) - 1
+
+
+def xor_sub_data(data: bytes, key: int) -> bytes:
+    """XOR every 32 bit word of a 48 bytes block with ``key``.
+
+    Encrypts and decrypts alike.
+
+    Parameters
+    ----------
+    data : bytes
+        48 bytes sub-data block.
+    key : int
+        32 bit key, ``PID ^ OT ID``.
+
+    Returns
+    -------
+    bytes
+        XOR-ed block.
+    """
+    return (
+        int.from_bytes(data, 'little') ^ ((key & _WORD_MASK) * _KEY_REPEAT)
+    ).to_bytes(SUB_DATA_SIZE, 'little')
+
+
+def xor_sub_data_many(data: bytes, keys: Sequence[int]) -> bytes:
+    """XOR a batch of contiguous 48 bytes blocks, each with its own key.
+
+    Parameters
+    ----------
+    data : bytes
+        ``len(keys)`` sub-data blocks, back to back.
+    keys : Sequence[int]
+        32 bit key of every block.
+
+    Returns
+    -------
+    bytes
+        XOR-ed blocks.
+    """
+    n = len(keys)
+    assert (len(data) == n * SUB_DATA_SIZE)
+    if numpy is not None:
+        words = numpy.frombuffer(data, dtype='<u4').reshape(n, 12)
+        keys_arr = numpy.asarray(
+            [k & _WORD_MASK for k in keys], dtype='<u4'
+        ).reshape(n, 1)
+        return (words ^ keys_arr).astype('<u4', copy=False).tobytes()
+    mask = int.from_bytes(
+        b''.join((k & _WORD_MASK).to_bytes(4, 'little') * 12 for k in keys),
+        'little'
+    )
+    return (int.from_bytes(data, 'little') ^ mask).to_bytes(len(data), 'little')
+
+
+def block_indices(pid: int) -> tuple[int, int, int, int]:
+    """Stored block index of the growth, attacks, EVs and misc blocks."""
+    return _BLOCK_INDICES[pid % 24]
+
+
+def unshuffle_sub_data(data: bytes, pid: int) -> bytes:
+    """Reorder a stored (shuffled) block into growth, attacks, EVs and misc
+    order.
+    """
+    return b''.join(data[i * 12:(i + 1) * 12] for i in _BLOCK_INDICES[pid % 24])
+
+
+def shuffle_sub_data(data: bytes, pid: int) -> bytes:
+    """Reorder a growth, attacks, EVs and misc ordered block into its stored
+    order.
+    """
+    d = bytearray(SUB_DATA_SIZE)
+    for j, i in enumerate(_BLOCK_INDICES[pid % 24]):
+        d[i * 12:(i + 1) * 12] = data[j * 12:(j + 1) * 12]
+        pass
+    return bytes(d)
+
+
+def decrypt_sub_data(data: bytes, pid: int, ot_id: int) -> bytes:
+    """Decrypt a stored sub-data block into growth, attacks, EVs and misc
+    order.
+
+    Parameters
+    ----------
+    data : bytes
+        Encrypted 48 bytes sub-data block.
+    pid : int
+        Pokemon PID.
+    ot_id : int
+        Pokemon OT full ID (secret and public).
+
+    Returns
+    -------
+    bytes
+        Decrypted and unshuffled block.
+    """
+    return unshuffle_sub_data(xor_sub_data(data, pid ^ ot_id), pid)
+
+
+def encrypt_sub_data(data: bytes, pid: int, ot_id: int) -> bytes:
+    """Encrypt a growth, attacks, EVs and misc ordered sub-data block.
+
+    Parameters
+    ----------
+    data : bytes
+        Decrypted 48 bytes sub-data block.
+    pid : int
+        Pokemon PID.
+    ot_id : int
+        Pokemon OT full ID (secret and public).
+
+    Returns
+    -------
+    bytes
+        Shuffled and encrypted block, as stored in the savegame.
+    """
+    return xor_sub_data(shuffle_sub_data(data, pid), pid ^ ot_id)
+
+
+def decrypt_sub_data_many(data: bytes, pids: Sequence[int],
+                          ot_ids: Sequence[int]) -> list[bytes]:
+    """Decrypt a batch of contiguous stored sub-data blocks.
+
+    Parameters
+    ----------
+    data : bytes
+        Encrypted 48 bytes sub-data blocks, back to back.
+    pids : Sequence[int]
+        PID of every block.
+    ot_ids : Sequence[int]
+        OT full ID of every block.
+
+    Returns
+    -------
+    list[bytes]
+        Decrypted blocks, in growth, attacks, EVs and misc order.
+    """
+    plain = xor_sub_data_many(data, [p ^ o for p, o in zip(pids, ot_ids)])
+    return [
+        unshuffle_sub_data(plain[i * SUB_DATA_SIZE:(i + 1) * SUB_DATA_SIZE], p)
+        for i, p in enumerate(pids)
+    ]
+
+
+def encrypt_sub_data_many(data: bytes, pids: Sequence[int],
+                          ot_ids: Sequence[int]) -> bytes:
+    """Encrypt a batch of contiguous growth, attacks, EVs and misc ordered
+    sub-data blocks.
+
+    Parameters
+    ----------
+    data : bytes
+        Decrypted 48 bytes sub-data blocks, back to back.
+    pids : Sequence[int]
+        PID of every block.
+    ot_ids : Sequence[int]
+        OT full ID of every block.
+
+    Returns
+    -------
+    bytes
+        Shuffled and encrypted blocks, back to back.
+    """
+    shuffled = b''.join(
+        shuffle_sub_data(data[i * SUB_DATA_SIZE:(i + 1) * SUB_DATA_SIZE], p)
+        for i, p in enumerate(pids)
+    )
+    return xor_sub_data_many(shuffled, [p ^ o for p, o in zip(pids, ot_ids)])
+
+
+__all__ = [
+    "SUBSTRUCTURE_ORDER",
+    "xor_sub_data",
+    "xor_sub_data_many",
+    "block_indices",
+    "shuffle_sub_data",
+    "unshuffle_sub_data",
+    "encrypt_sub_data",
+    "decrypt_sub_data",
+    "encrypt_sub_data_many",
+    "decrypt_sub_data_many"
+]
@@ -6,4 +6,9 @@ class ChecksumException(Exception):
     pass
 
 
-__all__ = ["InvalidSizeException", "ChecksumException"]
+class SpeciesDataException(Exception):
+    pass
+
+
+__all__ = ["InvalidSizeException", "ChecksumException",
+           "SpeciesDataException"]
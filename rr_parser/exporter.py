@@ -0,0 +1,604 @@
+"""Streaming Pokemon set exporter.
+
+Exports are a pipeline of generators: ``iter_pokemon`` walks the team and
+PC boxes of one or many savegames, ``iter_sets`` resolves every Pokemon
+into a ``PokemonSet``, a format turns each set into text and a sink writes
+it as soon as it is produced. Savegames given as paths are loaded one at a
+time, so that exports of many savegames run in constant memory.
+
+Species, ability, move and item lookups are cached and shared by every
+format.
+
+Usage::
+
+    python -m rr_parser.exporter rr.sav [more.sav ...] --format jsonl \\
+        --output - --level 50 [--box_min 0 --box_max 18] [--skip_boxes 3 4]
+"""
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass, field, asdict
+from typing import IO, Iterable, Iterator, Optional, Union
+import argparse
+import csv
+import io
+import json
+import os
+import socket
+import sys
+
+from .constants.rr.move_table import get_move_name
+from .constants.rr.species_registry import SPECIES_IDS, SPECIES_NAMES, \
+    POKEDEX_IDS, SPECIES_POKEDEX_IDS
+from .enums import GameType
+from .games import Gen3
+from .pkms import Pokemon, BoxPokemon
+from .sections import MAX_BOXES
+
+# Stat labels, in the Gen3 EVs and IVs order.
+STAT_LABELS = ("HP", "Atk", "Def", "Spe", "SpA", "SpD")
+
+PKM_DB_FILE: str = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "constants", "rr", "_pokemon.json"
+)
+
+
+@dataclass
+class PokemonSet:
+    """Exported Pokemon.
+
+    ``box`` is None for team Pokemon.
+    """
+    source: str
+    box: Optional[int]
+    position: int
+    species: str
+    nickname: str
+    item: Optional[str]
+    level: int
+    nature: str
+    ability: Optional[str]
+    evs: list[int] = field(default_factory=list)
+    ivs: list[int] = field(default_factory=list)
+    moves: list[str] = field(default_factory=list)
+
+    def to_json(self) -> dict:
+        return asdict(self)
+    pass
+
+
+@dataclass(frozen=True)
+class _SpeciesInfo:
+    name: str
+    abilities: Optional[tuple[str, ...]]
+    pass
+
+
+# National Pokedex names of the species misspelled in the Radical Red species
+# constants, with '_' separators.
+_DEX_ALIASES: dict[str, str] = {
+    "ASHGRENINJA": "GRENINJA_ASH",
+    "BOMBIDIER": "BOMBIRDIER",
+    "DARMANITANZEN": "DARMANITAN_ZEN",
+    "DHLEMISE": "DHELMISE",
+    "ESPARTHA": "ESPATHRA",
+    "FARFETCHED": "FARFETCHD",
+    "FEZANDIPIDI": "FEZANDIPITI",
+    "GLIMORA": "GLIMMORA",
+    "IRON_CROWNS": "IRON_CROWN",
+    "KILOWATTRELL": "KILOWATTREL",
+    "MABOSTIFF": "MABOSSTIFF",
+    "MINIOR_SHIELD": "MINIOR_RED_METEOR",
+    "MMUNKIDORI": "MUNKIDORI",
+    "OINKNOLOGNE": "OINKOLOGNE_MALE",
+    "OINKNOLOGNE_F": "OINKOLOGNE_F",
+    "POLCHAGEIS": "POLTCHAGEIST",
+    "SANDY_SHOCK": "SANDY_SHOCKS",
+    "SINISCHA": "SINISTCHA",
+    "WATTRELL": "WATTREL"
+}
+
+# Resolved species, move and item names, by index.
+_SPECIES_INFO: dict[int, _SpeciesInfo] = dict()
+_MOVE_NAMES: dict[int, str] = dict()
+_ITEM_NAMES: dict[int, Optional[str]] = dict()
+_NATURE_NAMES: list[str] = list()
+_PKM_DB: Optional[dict] = None
+# National Pokedex IDs by name with '_' separators, e.g. 'TAPU_KOKO'.
+_DEX_IDS: dict[str, int] = dict()
+
+
+def _pkm_db() -> dict:
+    # Load Pokemon abilities database once, on first export.
+    global _PKM_DB
+    if _PKM_DB is None:
+        with open(PKM_DB_FILE) as f:
+            _PKM_DB = json.load(f)
+            pass
+        pass
+    return _PKM_DB
+
+
+def _pokedex_id(species: int, const: str) -> Optional[int]:
+    dex = SPECIES_POKEDEX_IDS.get(species, None)
+    if dex is not None:
+        return dex
+    if not _DEX_IDS:
+        # Pokedex names separate words with '__', e.g. 'TAPU__KOKO'.
+        for name, dex in POKEDEX_IDS.items():
+            _DEX_IDS.setdefault(name.replace('__', '_'), dex)
+            pass
+        pass
+
+    # Forms (e.g. 'VIVILLON_ELEGANT') share the base species entries.
+    parts = const.upper().replace('__', '_').split('_')
+    for i in range(len(parts), 0, -1):
+        name = '_'.join(parts[:i])
+        name = _DEX_ALIASES.get(name, name)
+        dex = _DEX_IDS.get(name, None)
+        if dex is not None:
+            return dex
+        # Species only listed by form (e.g. 'DEOXYS_NORMAL'), the default
+        # one comes first.
+        if i == len(parts) or name in SPECIES_IDS:
+            forms = [
+                dex for form, dex in _DEX_IDS.items()
+                if form.startswith(name + '_')
+            ]
+            if forms:
+                return min(forms)
+            pass
+        pass
+    return None
+
+
+def _species_info(species: int) -> _SpeciesInfo:
+    info = _SPECIES_INFO.get(species, None)
+    if info is not None:
+        return info
+    const = SPECIES_NAMES.get(species, None)
+    if const is None:
+        raise KeyError(f'Species not found: {species}')
+
+    dex = _pokedex_id(species, const)
+    db_entry = _pkm_db().get(str(dex), None) if dex is not None else None
+    abilities = None
+    if db_entry is not None:
+        abilities = tuple(
+            ab.replace('-', ' ').title() for ab in db_entry['abilities']
+        )
+        pass
+
+    info = _SpeciesInfo(
+        name=const.replace('__', '-').replace('_', ' ').title(),
+        abilities=abilities
+    )
+    if abilities is None:
+        # Once per species, sets are streamed to stdout.
+        print("W: No abilities found for species {}, exported without "
+              "ability.".format(info.name), file=sys.stderr)
+        pass
+    _SPECIES_INFO[species] = info
+    return info
+
+
+def _move_name(move: int) -> str:
+    name = _MOVE_NAMES.get(move, None)
+    if name is None:
+        name = get_move_name(move) or f'Move {move}'
+        _MOVE_NAMES[move] = name
+        pass
+    return name
+
+
+def _item_name(item: int) -> Optional[str]:
+    if item == 0:
+        return None
+    if item not in _ITEM_NAMES:
+        # Items table is imported on first item lookup.
+        from .constants.rr._items import items_dict
+        _ITEM_NAMES[item] = items_dict.get(
+            str(item), f'Item {item}'
+        )
+        pass
+    return _ITEM_NAMES[item]
+
+
+def _nature_name(nature: int) -> str:
+    if not _NATURE_NAMES:
+        from .pkm_builder import NATURES
+        _NATURE_NAMES.extend(n.capitalize() for n in NATURES)
+        pass
+    return _NATURE_NAMES[nature]
+
+
+# Box Pokemon levels are not stored, and the species growth rates needed to
+# compute them from their experience are not bundled.
+_BOX_LEVEL_ERROR = "Box exports need a fixed level, pass `level`."
+
+
+def pokemon_set(pkm: Union[Pokemon, BoxPokemon], level: Optional[int] = None,
+                source: str = "", box: Optional[int] = None,
+                position: int = 0) -> PokemonSet:
+    """Resolve a Pokemon into an exported set.
+
+    Parameters
+    ----------
+    pkm : Union[Pokemon, BoxPokemon]
+        Team or PC box Pokemon.
+    level : Optional[int]
+        Level of box Pokemon, required for them. Team Pokemon always use
+        their own level.
+    source : str
+        Savegame the Pokemon comes from.
+    box : Optional[int]
+        PC box, None for team Pokemon.
+    position : int
+        Position in the team or box.
+
+    Returns
+    -------
+    PokemonSet
+        Exported set.
+
+    Raises
+    ------
+    ValueError
+        If ``level`` is not given for a box Pokemon.
+    """
+    if isinstance(pkm, Pokemon):
+        level = pkm.level
+        pass
+    elif level is None:
+        raise ValueError(_BOX_LEVEL_ERROR)
+    sub_data = pkm.sub_data_decrypted
+    info = _species_info(sub_data.species)
+
+    ability = None
+    if info.abilities:
+        idx = sub_data.misc.ability if sub_data.hidden_ab == 0 else -1
+        if idx < len(info.abilities):
+            ability = info.abilities[idx]
+            pass
+        pass
+
+    return PokemonSet(
+        source=source,
+        box=box,
+        position=position,
+        species=info.name,
+        nickname=pkm.nickname,
+        item=_item_name(sub_data.growth.item),
+        level=level,
+        nature=_nature_name(sub_data.nature),
+        ability=ability,
+        evs=list(pkm.sub_data.evs),
+        ivs=list(pkm.sub_data.misc.IVs),
+        moves=[_move_name(m) for m in sub_data.attacks.moves if m != 0]
+    )
+
+
+def _load(game: Union[Gen3, str]) -> Gen3:
+    if isinstance(game, Gen3):
+        return game
+    from .functions import load_radical_red_game
+    # Read within a 'with' block. A mapping could not be closed as soon as
+    # the savegame is exported: yielded Pokemon and the reference cycles of
+    # the parsed savegame keep views into it.
+    return load_radical_red_game(game)
+
+
+def _boxes(box_range: Optional[tuple[int, int]],
+           skip_boxes: Optional[Iterable[int]]) -> list[int]:
+    boxes = set(range(MAX_BOXES))
+    if box_range is not None:
+        boxes = boxes.intersection(range(*box_range))
+        pass
+    if skip_boxes is not None:
+        boxes = boxes - set(skip_boxes)
+        pass
+    return sorted(boxes)
+
+
+def iter_pokemon(games: Union[Gen3, str, Iterable[Union[Gen3, str]]],
+                 box_range: Optional[tuple[int, int]] = None,
+                 skip_boxes: Optional[Iterable[int]] = None
+                 ) -> Iterator[tuple[str, Optional[int], int,
+                                     Union[Pokemon, BoxPokemon]]]:
+    """Walk the team and PC box Pokemon of one or many savegames.
+
+    Parameters
+    ----------
+    games : Union[Gen3, str, Iterable[Union[Gen3, str]]]
+        Savegames, or Radical Red savegame paths, loaded one at a time.
+    box_range : Optional[tuple[int, int]]
+        Range of exported boxes, every box by default.
+    skip_boxes : Optional[Iterable[int]]
+        Boxes not exported.
+
+    Returns
+    -------
+    Iterator[tuple[str, Optional[int], int, Union[Pokemon, BoxPokemon]]]
+        Source savegame, PC box (None for the team), position and Pokemon.
+        Empty PC slots are skipped.
+    """
+    if isinstance(games, (Gen3, str)):
+        games = [games]
+        pass
+    boxes = _boxes(box_range, skip_boxes)
+    for i, game in enumerate(games):
+        game = _load(game)
+        source = game.filename if game.filename is not None else str(i)
+        team = game.game_save.team
+        for pos, pkm in enumerate(team.team_pokemon_list[:team.team_size]):
+            yield source, None, pos, pkm
+            pass
+
+        # Only Radical Red PC boxes are parsed.
+        if game.gt != GameType(GameType.RR):
+            continue
+        pc = game.game_save.pc
+        storage = pc.storage
+        for box_id in boxes:
+            box = pc.boxes[box_id]
+            for slot in storage.occupied(box_id):
+                pos = storage.box_of(slot)[1]
+                yield source, box_id, pos, box.pokemon_at(pos)
+                pass
+            pass
+        pass
+    pass
+
+
+def iter_sets(games: Union[Gen3, str, Iterable[Union[Gen3, str]]],
+              box_range: Optional[tuple[int, int]] = None,
+              skip_boxes: Optional[Iterable[int]] = None,
+              level: Optional[int] = None) -> Iterator[PokemonSet]:
+    """Resolve the Pokemon of ``iter_pokemon`` into exported sets.
+
+    See ``iter_pokemon`` and ``pokemon_set`` for the parameters.
+    """
+    for source, box, pos, pkm in iter_pokemon(games, box_range, skip_boxes):
+        yield pokemon_set(pkm, level, source, box, pos)
+        pass
+    pass
+
+
+def set_to_text(s: PokemonSet) -> str:
+    """Showdown importable set.
+
+    Example::
+
+        Piplup @ Oran Berry
+        Level: 5
+        Rash Nature
+        Ability: Torrent
+        EVs: 3 HP / 2 Atk / 1 Def / 0 Spe / 1 SpA / 2 SpD
+        IVs: 22 HP / 6 Atk / 30 Def / 27 Spe / 8 SpA / 23 SpD
+        - Pound
+        - Bubble
+    """
+    lines = [s.species if s.item is None else f'{s.species} @ {s.item}']
+    lines.append(f'Level: {s.level}')
+    lines.append(f'{s.nature} Nature')
+    if s.ability is not None:
+        lines.append(f'Ability: {s.ability}')
+        pass
+    lines.append('EVs: ' + ' / '.join(
+        f'{val} {stat}' for stat, val in zip(STAT_LABELS, s.evs)
+    ))
+    lines.append('IVs: ' + ' / '.join(
+        f'{val} {stat}' for stat, val in zip(STAT_LABELS, s.ivs)
+    ))
+    lines.extend(f'- {move}' for move in s.moves)
+    lines.append('')
+    return '\n'.join(lines)
+
+
+class SetFormat(ABC):
+    """Output format, serializes one set at a time."""
+
+    def header(self) -> str:
+        """Text written before the first set."""
+        return ''
+
+    @abstractmethod
+    def format(self, s: PokemonSet) -> str:
+        """Serialize a set."""
+        pass
+    pass
+
+
+class ShowdownFormat(SetFormat):
+    """Showdown importable sets, separated by blank lines."""
+
+    def format(self, s: PokemonSet) -> str:
+        return set_to_text(s) + '\n\n'
+    pass
+
+
+class JsonLinesFormat(SetFormat):
+    """One JSON object per line."""
+
+    def format(self, s: PokemonSet) -> str:
+        return json.dumps(s.to_json()) + '\n'
+    pass
+
+
+class CsvFormat(SetFormat):
+    """One CSV row per set, EVs, IVs and moves in their own columns."""
+    COLUMNS = (
+        ["source", "box", "position", "species", "nickname", "item", "level",
+         "nature", "ability"] +
+        [f"ev_{stat.lower()}" for stat in STAT_LABELS] +
+        [f"iv_{stat.lower()}" for stat in STAT_LABELS] +
+        [f"move{i}" for i in range(1, 5)]
+    )
+
+    def __init__(self):
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer, lineterminator='\n')
+        pass
+
+    def _row(self, row: list) -> str:
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        self._writer.writerow(row)
+        return self._buffer.getvalue()
+
+    def header(self) -> str:
+        return self._row(self.COLUMNS)
+
+    def format(self, s: PokemonSet) -> str:
+        moves = (s.moves + [''] * 4)[:4]
+        return self._row([
+            s.source, '' if s.box is None else s.box, s.position, s.species,
+            s.nickname, s.item or '', s.level,
+            s.nature, s.ability or ''
+        ] + s.evs + s.ivs + moves)
+    pass
+
+
+FORMATS = {
+    "showdown": ShowdownFormat,
+    "jsonl": JsonLinesFormat,
+    "csv": CsvFormat
+}
+
+
+@contextmanager
+def open_sink(output: Union[None, str, IO[str]] = None) -> Iterator[IO[str]]:
+    """Open an export destination for writing text.
+
+    Parameters
+    ----------
+    output : Union[None, str, IO[str]]
+        ``None`` or ``'-'`` for stdout, ``'tcp://host:port'`` for a socket,
+        a writable text stream (left open), or else, a file path.
+
+    Returns
+    -------
+    Iterator[IO[str]]
+        Writable text stream, closed on exit if opened here.
+    """
+    if output is None or output == '-':
+        yield sys.stdout
+        sys.stdout.flush()
+        pass
+    elif not isinstance(output, str):
+        yield output
+        pass
+    elif output.startswith('tcp://'):
+        host, _, port = output[len('tcp://'):].rpartition(':')
+        with socket.create_connection((host, int(port))) as sock:
+            with sock.makefile('w', encoding='utf-8', newline='') as f:
+                yield f
+                pass
+            pass
+        pass
+    else:
+        with open(output, 'w', encoding='utf-8', newline='') as f:
+            yield f
+            pass
+        pass
+    pass
+
+
+def export_sets(games: Union[Gen3, str, Iterable[Union[Gen3, str]]],
+                output: Union[None, str, IO[str]] = None,
+                fmt: Union[str, SetFormat] = "showdown",
+                box_range: Optional[tuple[int, int]] = None,
+                skip_boxes: Optional[Iterable[int]] = None,
+                level: Optional[int] = None) -> int:
+    """Stream the team and PC box Pokemon of savegames to a sink.
+
+    Each set is written as soon as it is resolved, and savegames given as
+    paths are loaded one at a time.
+
+    Parameters
+    ----------
+    games : Union[Gen3, str, Iterable[Union[Gen3, str]]]
+        Savegames, or Radical Red savegame paths.
+    output : Union[None, str, IO[str]]
+        Destination, see ``open_sink``.
+    fmt : Union[str, SetFormat]
+        Output format, one of ``FORMATS`` or a format instance.
+    box_range : Optional[tuple[int, int]]
+        Range of exported boxes, every box by default.
+    skip_boxes : Optional[Iterable[int]]
+        Boxes not exported.
+    level : Optional[int]
+        Level of box Pokemon, required unless no box is exported.
+
+    Returns
+    -------
+    int
+        Number of exported sets.
+
+    Raises
+    ------
+    ValueError
+        If the format is invalid, or ``level`` is not given while exporting
+        boxes.
+    """
+    if level is None and _boxes(box_range, skip_boxes):
+        # Checked before anything is written.
+        raise ValueError(_BOX_LEVEL_ERROR)
+    if isinstance(fmt, str):
+        if fmt not in FORMATS:
+            raise ValueError(f"Invalid format: {fmt}")
+        fmt = FORMATS[fmt]()
+        pass
+    n = 0
+    with open_sink(output) as f:
+        f.write(fmt.header())
+        for s in iter_sets(games, box_range, skip_boxes, level):
+            f.write(fmt.format(s))
+            n += 1
+            pass
+        pass
+    return n
+
+
+def main(argv: Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(
+        description="Export the team and PC Pokemon of savegames."
+    )
+    parser.add_argument('savs', nargs='+', type=str,
+                        help="Radical Red savegames.")
+    parser.add_argument('--format', '-f', type=str, choices=list(FORMATS),
+                        default='showdown')
+    parser.add_argument('--output', '-o', type=str, default='-',
+                        help="File path, '-' for stdout or tcp://host:port.")
+    parser.add_argument('--box_min', type=int, default=0)
+    parser.add_argument('--box_max', type=int, default=MAX_BOXES)
+    parser.add_argument('--skip_boxes', nargs='*', type=int)
+    parser.add_argument('--level', '-l', type=int, default=None,
+                        help="Level of box Pokemon, required unless every "
+                             "box is skipped.")
+    args = parser.parse_args(argv)
+
+    n = export_sets(args.savs, args.output, args.format,
+                    (args.box_min, args.box_max), args.skip_boxes, args.level)
+    print("Exported {} Pokemon sets.".format(n), file=sys.stderr)
+    return 0
+
+
+__all__ = [
+    "PokemonSet",
+    "SetFormat",
+    "ShowdownFormat",
+    "JsonLinesFormat",
+    "CsvFormat",
+    "FORMATS",
+    "pokemon_set",
+    "iter_pokemon",
+    "iter_sets",
+    "set_to_text",
+    "open_sink",
+    "export_sets"
+]
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,19 +1,15 @@
-from typing import Union, Optional
-import csv
+from typing import Iterable, Union, Optional
+import mmap
 
 from .games import Gen3, RadicalRed
 from .pkms import Pokemon, BoxPokemon
-from .pkm_builder import pkm_builder
 from .exceptions import InvalidSizeException
 from .constants.rr import get_species_pokedex_id
+from .constants.rr.species_registry import POKEDEX_IDS, get_species_name, \
+    get_species_dex
+from .constants.rr.move_table import get_move_name
 from .enums import PokedexEntryState, GameType
 
-from .pkm_builder import NATURES
-from .sections import MAX_BOXES
-
-from . import constants
-
-import pokebase as pb
 
 def clone_first_team_pkm(game: Gen3) -> bool:
     """Clone first team Pokemon into the next free team slot.
@@ -31,7 +27,7 @@ def clone_first_team_pkm(game: Gen3) -> bool:
     if 0 < game.game_save.team.team_size < 6:
         pk0: Pokemon = game.game_save.team.team_pokemon_list[0]
         game.set_pokemon(pk0, game.game_save.team.team_size)
-        assert game.check_valid()
+        assert game.in_batch or game.check_valid()
         st: bool = True
         pass
     else:
@@ -69,145 +65,92 @@ def export_first_team_pkm(game: Gen3, output: str):
     pass
 
 def species_rr_to_nat_dex(species_rr):
-    assert(species_rr < constants.rr._species.NUM_SPECIES)
+    from .constants.rr._species import NUM_SPECIES
+    assert(species_rr < NUM_SPECIES)
 
-    for v in dir(constants.rr._species)[::-1]:
-        if getattr(constants.rr._species, v) == species_rr:
-            name = v[v.find('_')+1:]
-            return getattr(constants.rr._pokedex, f'NATIONAL_DEX_{name}')
-    raise Exception(f'Species not found: {species_rr}')
+    name = get_species_name(species_rr)
+    if name is None:
+        raise Exception(f'Species not found: {species_rr}')
+    dex = get_species_dex(species_rr)
+    if dex is None:
+        raise Exception(f'National dex entry not found: {name}')
+    return dex
 
 def species_rr_to_str(species_rr):
-    assert(species_rr < constants.rr._species.NUM_SPECIES)
-    for v in dir(constants.rr._species)[::-1]:
-        if getattr(constants.rr._species, v) == species_rr:
-            name = v[v.find('_')+1:]
-            return name.replace('__', '-').replace('_', ' ').title()
-    raise Exception(f'Species not found: {species_rr}')
+    from .constants.rr._species import NUM_SPECIES
+    assert(species_rr < NUM_SPECIES)
+    name = get_species_name(species_rr)
+    if name is None:
+        raise Exception(f'Species not found: {species_rr}')
+    return name.replace('__', '-').replace('_', ' ').title()
 
 def species_rr_str_to_nat_dex(name):
     s = name.replace('-', '__').replace(' ', '_').upper()
-    return getattr(constants.rr._pokedex, 'NATIONAL_DEX_'+s)
+    dex = POKEDEX_IDS.get(s, None)
+    if dex is None:
+        raise Exception(f'National dex entry not found: {s}')
+    return dex
 
 def move_rr_to_name(move_rr):
     if move_rr == 0:
         return None
-    
-    FP = 'rr_parser\\constants\\rr\\move_names.tsv'
-
-    with open(FP, 'r') as f:
-        rd = csv.reader(f, delimiter='\t')
-        for row in rd:
-            if int(row[0], 16) == move_rr:
-                return row[1].title()
+    return get_move_name(move_rr)
 
 def item_rr_to_name(item_rr):
-    return constants.rr._items.items_dict[str(item_rr)]
-
-import json
-with open('rr_parser\\constants\\rr\\_pokemon.json') as f:
-    PKM_DB = json.load(f)
-def pkm_set_to_text(pkm: Union[Pokemon, BoxPokemon], level:int = None):
-    """Example Output:
-            Piplup @ Oran Berry
-            Rash Nature
-            Ability: Torrent
-            EVs: 3 HP / 2 Atk / 1 SpA / 2 SpD / 1 Spe
-            IVs: 22 HP / 6 Atk / 30 Def / 8 SpA / 23 SpD / 27 Spe
-            - Pound
-            - Bubble
-            - Growl
-
-    Notes:
+    from .constants.rr._items import items_dict
+    return items_dict[str(item_rr)]
+
+def pkm_set_to_text(pkm: Union[Pokemon, BoxPokemon], level: int = None):
+    """Showdown importable set of a team or PC box Pokemon.
+
+    See ``exporter.pokemon_set`` for how box Pokemon levels are resolved,
+    and ``exporter.set_to_text`` for an example output.
     """
-    species = species_rr_to_str(pkm.sub_data_decrypted.species)
-    pkm_db_entry = PKM_DB[str(species_rr_str_to_nat_dex(species))]
-    nature = list(NATURES.keys())[pkm.sub_data_decrypted.nature].capitalize()
-    item = pkm.sub_data_decrypted.growth.item
-    if level is None:
-        level = pkm.level
-
-    ability = pkm_db_entry['abilities'][pkm.sub_data_decrypted.misc.ability] if pkm.sub_data_decrypted.hidden_ab==0 \
-          else pkm_db_entry['abilities'][-1]
-    ability = ability.replace('-', ' ').title()
-
-
-    set_str = f'{species}'
-    set_str += f' @ {item_rr_to_name(item)}\n' if item != 0 else '\n'
-    set_str += f'Level: {level}\n'
-    set_str += f'{nature} Nature\n'
-    set_str += f'Ability: {ability}\n'
-
-    set_str += 'EVs: '
-    set_str += ' / '.join('{0} {1}'.format(val, stat) for stat, val in zip([
-                            "HP", "Atk", "Def",
-                            "Spe", "SpA", "SpD"
-                        ],
-                        pkm.sub_data.evs))
-    
-    set_str += '\nIVs: '
-    set_str += ' / '.join('{0} {1}'.format(val, stat) for stat, val in zip([
-                            "HP", "Atk", "Def",
-                            "Spe", "SpA", "SpD"
-                        ],
-                        pkm.sub_data.misc.IVs))
-    set_str+='\n'
-    moves = pkm.sub_data_decrypted.attacks.moves
-    for move in moves:
-        if move != 0:
-            set_str+=f'- {move_rr_to_name(move)}\n'
-
-    return set_str
-
-def export_pkm_sets_for_calc(game: Gen3, output: str, 
-                   box_range: tuple[int, int]=None, 
-                   skip_boxes:list[int]=None,
-                   level: int = None):
+    from .exporter import pokemon_set, set_to_text
+    return set_to_text(pokemon_set(pkm, level))
+
+
+def export_pkm_sets_for_calc(game: Gen3, output: str,
+                             box_range: tuple[int, int] = None,
+                             skip_boxes: list[int] = None,
+                             level: int = None):
     """Export all pokemon in the player team plus all of the pokemon in the PC
-    
+
+    Sets are streamed to ``output`` as Showdown text, see
+    ``exporter.export_sets`` for other formats and sinks.
     """
+    from .exporter import export_sets
+    export_sets(game, output, "showdown", box_range, skip_boxes, level)
+    print(f'Exported pokemon sets to ``{output}``')
 
-    
-    with open(output, 'w') as f:
-        for pokemon in game.game_save.team.team_pokemon_list[:game.game_save.team.team_size]:
-            set_str = pkm_set_to_text(pokemon)
-            f.write(set_str)
-            f.write('\n\n')
-        
-        
-        boxes = set(range(MAX_BOXES))
-        if box_range is not None:
-            boxes = boxes.intersection(set(range(*box_range)))
-        if skip_boxes is not None:
-            boxes = boxes - set(skip_boxes)
-        boxes = list(boxes)
-        boxes.sort()
-
-        if len(boxes) > 0 and level is None:
-            raise NotImplementedError('Box exports need a fixed level. Please pass `level`')
-
-        for box_id in boxes:
-            box = game.game_save.pc.boxes[box_id]
-            for pokemon in box.pokemon:
-                # Empty slot
-                if pokemon.sub_data_decrypted.growth.species == 0:
-                    continue
-                set_str = pkm_set_to_text(pokemon, level)
-                f.write(set_str)
-                f.write('\n\n')
-                
-            
 
-    print(f'Exported pokemon sets to ``{output}``')
+# Raw savegame, optionally followed by the 16 bytes emulator RTC footer.
+SAVEGAME_SIZES = (131072, 131088)
+
+MMAP_ACCESS = {
+    'r': mmap.ACCESS_READ,
+    'r+': mmap.ACCESS_WRITE,
+    'c': mmap.ACCESS_COPY
+}
 
 
-def load_radical_red_game(inp: str) -> RadicalRed:
+def load_radical_red_game(inp: str,
+                          mmap_mode: Optional[str] = None) -> RadicalRed:
     """Load the Pokemon Radical Red savegame.
 
     Parameters
     ----------
     inp : str
         Path to the savegame.
+    mmap_mode : {None, 'r', 'r+', 'c'}, optional
+        If not None, the savegame is memory-mapped and parsed straight from
+        the mapping instead of being read into memory:
+
+        * ``'r'``: read-only, for bulk scanning. Edits raise ``TypeError``.
+        * ``'r+'``: edits are written through to the file, and
+          ``write_back_game`` flushes the changed sections.
+        * ``'c'``: copy-on-write, edits stay private until
+          ``write_back_game`` writes the changed sections to the file.
 
     Returns
     -------
@@ -218,14 +161,31 @@ def load_radical_red_game(inp: str) -> RadicalRed:
     ------
     InvalidSizeException
         If savegame sized is not 128KiB.
+    ValueError
+        If ``mmap_mode`` is not valid.
     """
 
-    with open(inp, "rb") as f:
-        b = f.read()
+    if mmap_mode is None:
+        with open(inp, "rb") as f:
+            b = f.read()
+            pass
+        pass
+    elif mmap_mode in MMAP_ACCESS:
+        with open(inp, "rb" if mmap_mode == 'r' else "r+b") as f:
+            if f.seek(0, 2) not in SAVEGAME_SIZES:
+                raise InvalidSizeException("Savegame size is not 128 KiB.")
+            # Mapping outlives the file descriptor.
+            b = mmap.mmap(f.fileno(), 0, access=MMAP_ACCESS[mmap_mode])
+            pass
         pass
-    if len(b) != 131088:
+    else:
+        raise ValueError(f"Invalid mmap mode: {mmap_mode}")
+    if len(b) not in SAVEGAME_SIZES:
         raise InvalidSizeException("Savegame size is not 128 KiB.")
-    return RadicalRed(b)
+    game = RadicalRed(b)
+    game.filename = inp
+    game.mmap_mode = mmap_mode
+    return game
 
 
 def save_game(game: Gen3, output: str):
@@ -247,6 +207,28 @@ def save_game(game: Gen3, output: str):
     pass
 
 
+def write_back_game(game: Gen3, output: Optional[str] = None) -> int:
+    """Write back only the changed sections of the savegame.
+
+    Only the 4 KiB sections edited since the savegame was loaded (or last
+    written back) are written, in place, into the savegame file.
+
+    Parameters
+    ----------
+    game : Gen3
+        Radical Red / Fire Red savegame class to write back.
+    output : str, optional
+        Path to a savegame file holding this same savegame. Defaults to the
+        file the savegame was loaded from.
+
+    Returns
+    -------
+    int
+        Number of sections written.
+    """
+    return game.write_back(output)
+
+
 def create_and_insert_pokemon(
         game: Gen3,
         species: str,
@@ -311,6 +293,12 @@ def create_and_insert_pokemon(
     -------
     tuple[Pokemon, bool]
         Generated Pokemon and its game insertion status.
+
+    Raises
+    ------
+    SpeciesDataException
+        If the species dataset misses any data needed for building it, and
+        it could not be fetched.
     """
     # Normalize input.
     if ot_name is None:
@@ -342,6 +330,7 @@ def create_and_insert_pokemon(
         pass
 
     # Create Pokemon.
+    from .pkm_builder import pkm_builder
     pk0 = pkm_builder(
         gen=game.gt,
         species=species,
@@ -359,7 +348,7 @@ def create_and_insert_pokemon(
     # If free space is available, set Pokemon.
     if game.game_save.team.team_size < 6:
         game.set_pokemon(pk0, game.game_save.team.team_size)
-        assert game.check_valid()
+        assert game.in_batch or game.check_valid()
         set_pokedex_entry(
             game,
             species,
@@ -374,25 +363,7 @@ def create_and_insert_pokemon(
     return pk0, st
 
 
-def set_pokedex_entry(
-        game: Gen3,
-        species: Union[str, int],
-        state: PokedexEntryState = PokedexEntryState(PokedexEntryState.SEEN)):
-    """Set Pokemon species entry state.
-
-    Parameters
-    ----------
-    game : Gen3
-        Game class instance.
-    species : Union[str, int]
-        Species case insensitive name or Pokedex entry number (1 or higher).
-    state : PokedexEntryState
-        Pokedex entry state:
-            PokedexEntryState.UNSEEN: unlocked entry.
-            PokedexEntryState.SEEN: Pokemon seen.
-            PokedexEntryState.CAUGHT: Pokemon seen and caught.
-    """
-
+def _pokedex_entry(species: Union[str, int]) -> int:
     if isinstance(species, int):
         species_int: int = species
         pass
@@ -405,23 +376,79 @@ def set_pokedex_entry(
     else:
         raise NotImplemented
     assert species_int > 0
+    return species_int
 
+
+def _set_pokedex_state(pokedex, entries: Union[int, Iterable[int]],
+                       state: PokedexEntryState):
     if state == PokedexEntryState(PokedexEntryState.UNSEEN):
-        game.game_save.pokedex.unset_seen(species_int)
-        game.game_save.pokedex.unset_caught(species_int)
+        pokedex.unset_seen(entries)
     elif state == PokedexEntryState(PokedexEntryState.SEEN):
-        game.game_save.pokedex.set_seen(species_int)
-        game.game_save.pokedex.unset_caught(species_int)
+        pokedex.set_seen(entries)
+        pokedex.unset_caught(entries)
         pass
     elif state == PokedexEntryState(PokedexEntryState.CAUGHT):
-        game.game_save.pokedex.set_seen(species_int)
-        game.game_save.pokedex.set_caught(species_int)
+        pokedex.set_caught(entries)
         pass
     else:
         raise NotImplemented
         pass
     pass
 
+
+def set_pokedex_entry(
+        game: Gen3,
+        species: Union[str, int],
+        state: PokedexEntryState = PokedexEntryState(PokedexEntryState.SEEN)):
+    """Set Pokemon species entry state.
+
+    Parameters
+    ----------
+    game : Gen3
+        Game class instance.
+    species : Union[str, int]
+        Species case insensitive name or Pokedex entry number (1 or higher).
+    state : PokedexEntryState
+        Pokedex entry state:
+            PokedexEntryState.UNSEEN: unlocked entry.
+            PokedexEntryState.SEEN: Pokemon seen.
+            PokedexEntryState.CAUGHT: Pokemon seen and caught.
+    """
+    _set_pokedex_state(
+        game.game_save.pokedex,
+        _pokedex_entry(species),
+        state
+    )
+    game.update_from_sub_data()
+    pass
+
+
+def set_pokedex_entries(
+        game: Gen3,
+        species: Iterable[Union[str, int]],
+        state: PokedexEntryState = PokedexEntryState(PokedexEntryState.SEEN)):
+    """Set many Pokemon species entries state at once.
+
+    Examples
+    --------
+    >>> # Whole Kanto Pokedex, caught.
+    >>> set_pokedex_entries(game, range(1, 152),
+    ...                     PokedexEntryState(PokedexEntryState.CAUGHT))
+
+    Parameters
+    ----------
+    game : Gen3
+        Game class instance.
+    species : Iterable[Union[str, int]]
+        Species case insensitive names or Pokedex entry numbers (1 or
+        higher). A ``range`` of entry numbers is set in a single operation.
+    state : PokedexEntryState
+        Pokedex entries state, see ``set_pokedex_entry``.
+    """
+    if not isinstance(species, range):
+        species = [_pokedex_entry(sp) for sp in species]
+        pass
+    _set_pokedex_state(game.game_save.pokedex, species, state)
     game.update_from_sub_data()
     pass
 
@@ -476,7 +503,7 @@ def set_money(game: Gen3, money: int):
     team = game.game_save.team
 
     # sec_key = int.from_bytes(trainer_info.section[0x0AF8:0x0AF8 + 4], 'little')
-    sec_key = int.from_bytes(trainer_info.section[0x0F20:0x0F20 + 4], 'little')
+    sec_key = int.from_bytes(trainer_info.data[0x0F20:0x0F20 + 4], 'little')
 
     if game.gt == GameType(GameType.RR):
         # money = 9999999
@@ -489,12 +516,10 @@ def set_money(game: Gen3, money: int):
     else:
         raise NotImplemented
 
-    data = bytearray(team.section)
-    data[0x0290:0x0290 + 4] = sec_money.to_bytes(4, 'little')
-    game.game_save.sections[1].section = bytes(data)
+    # Written in place, into the savegame buffer.
+    team.data[0x0290:0x0290 + 4] = sec_money.to_bytes(4, 'little')
+    team.mark_dirty()
 
-    # team.section = bytes(data)
-    # team.update()
     game.game_save.update_from_sub_data()
     game.update_from_sub_data()
     pass
@@ -524,8 +549,10 @@ __all__ = [
     "clone_first_team_pkm",
     "load_radical_red_game",
     "save_game",
+    "write_back_game",
     "create_and_insert_pokemon",
     "set_pokedex_entry",
+    "set_pokedex_entries",
     "clear_pokedex",
     "complete_pokedex",
     "infinite_money",
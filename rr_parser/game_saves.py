@@ -1,16 +1,30 @@
 from typing import Optional
 
+from . import profiling
 from .abstracts import GameSave as ABCGameSave
 from .enums import GameType
 from .sections import Section, Team, TrainerInfo, PC
 from .pkms import Pokemon
 from .pokedex import Pokedex
 
+# Section the Pokedex view is parsed from.
+POKEDEX_SECTION = {
+    GameType.FR: 0,
+    GameType.RR: 1
+}
+
+# Sections the PC view is parsed from (PC buffers).
+PC_SECTIONS = range(5, 14)
+
 
 class GameSave(ABCGameSave):
-    def __init__(self, b: bytes, gt: GameType):
-        # Assert GameSave data length.
-        self._data = b
+    def __init__(self, b: memoryview, gt: GameType):
+        # GameSave window into the savegame buffer, sections are windows
+        # into it as well.
+        if not isinstance(b, memoryview):
+            b = memoryview(bytearray(b))
+            pass
+        self._data: memoryview = b
         self.gt = gt
 
         # Initialize attributes.
@@ -22,12 +36,16 @@ class GameSave(ABCGameSave):
         self.pokedex: Optional[Pokedex] = None
         self.pc: Optional[PC] = None
 
+        # Whether serialization and validation are deferred to the end of a
+        # ``Gen3.batch`` block.
+        self.deferred: bool = False
+
         # Fill attributes.
         self.update_from_data()
         pass
 
     @property
-    def data(self) -> bytes:
+    def data(self) -> memoryview:
         return self._data
 
     def update_from_data(self):
@@ -38,9 +56,10 @@ class GameSave(ABCGameSave):
 
         chk = 0
         for i in range(0, 14):
-            sec: Section = Section(self.data[i * 4096:(i + 1) * 4096], self.gt)
-            sec_id = sec.section_id
-            self.sections[sec_id] = sec
+            sec_id = int.from_bytes(
+                self.data[i * 4096 + 0x0FF4:i * 4096 + 0x0FF4 + 2],
+                'little'
+            )
             self.section_offsets[sec_id] = i * 4096
             chk = chk | (1 << sec_id)
             pass
@@ -52,10 +71,24 @@ class GameSave(ABCGameSave):
             pass
         else:
             self._is_used = True
+            pass
+
+        for sec_id, offset in self.section_offsets.items():
+            if self._is_used and sec_id == 0:
+                section_class = TrainerInfo
+            elif self._is_used and sec_id == 1:
+                section_class = Team
+            else:
+                section_class = Section
+            sec: Section = section_class(
+                self.data[offset:offset + 4096],
+                self.gt
+            )
+            self.sections[sec_id] = sec
+            pass
 
+        if self._is_used:
             # Redefine specific sections.
-            self.sections[0] = TrainerInfo(self.sections[0].section, self.gt)
-            self.sections[1] = Team(self.sections[1].section, self.gt)
             self.trainer_info = self.sections[0]
             self.team = self.sections[1]
             pass
@@ -68,33 +101,53 @@ class GameSave(ABCGameSave):
         if self._is_used:
             self.pc = PC(self.gt, self)
 
-    def update_from_sub_data(self):
+    @profiling.phase("reserialize")
+    def update_from_sub_data(self, validate: bool = True):
         """Update game save.
 
-        Update each section inside the game save, then restore
-        the save game bytes.
-        """
+        Sections are windows into the game save buffer and are edited in
+        place: write back the Pokedex and fill in the checksum of every
+        changed section.
 
-        b = bytearray(self.data)
-
-        self.update_pokedex()
-        for sec_id in self.sections.keys():
-            offset = self.section_offsets[sec_id]
-            #if sec_id == 0:
-            #    b[offset:offset + 4096] = self.trainer_info.section
-            #    pass
-            #elif sec_id == 1:
-            #    b[offset:offset + 4096] = self.team.section
-            #    pass
-            #else:
-            #    b[offset:offset+4096] = self.sections[sec_id].section
-            #    pass
-            b[offset:offset + 4096] = self.sections[sec_id].section
+        Parameters
+        ----------
+        validate : bool
+            Whether to assert that the game save is valid once updated.
+        """
+        if self.deferred:
+            return
+        if self._is_used:
+            self.update_pokedex(validate=validate)
             pass
+        for sec in self.sections.values():
+            sec.update_checksum()
+            pass
+        pass
 
-        assert (len(b) == 57344)
-        self._data = bytes(b)
-        self.update_from_data()
+    def update_section(self, sec_id: int):
+        """Re-parse a section edited in place, and only the views built
+        from it.
+
+        Editing section 1 re-parses the Team (and the Radical Red Pokedex),
+        editing a PC buffer re-parses the PC, and every other view is kept
+        as is, instead of rebuilding the whole game save.
+
+        Parameters
+        ----------
+        sec_id : int
+            Edited section ID.
+        """
+        sec: Section = self.sections[sec_id]
+        sec.update_from_data()
+        sec.mark_dirty()
+        if not self._is_used:
+            return
+        if sec_id == POKEDEX_SECTION[self.gt]:
+            self.pokedex.update_from_data(self)
+            pass
+        if sec_id in PC_SECTIONS:
+            self.pc.update_from_data()
+            pass
         pass
 
     @property
@@ -113,53 +166,70 @@ class GameSave(ABCGameSave):
         return is_valid
 
     def clear(self):
-        self._data = bytes([0xFF]*len(self._data))
+        self._data[:] = bytes([0xFF]*len(self._data))
         self.update_from_data()
+        for sec in self.sections.values():
+            sec.mark_dirty()
+            pass
         pass
 
+    def modified_sections(self) -> list[tuple[int, Section]]:
+        """Sections pending to be written back to the savegame file.
+
+        Returns
+        -------
+        list[tuple[int, Section]]
+            Offset of the section within the game save, and the section.
+        """
+        return [
+            (self.section_offsets[sec_id], sec)
+            for sec_id, sec in self.sections.items()
+            if sec.is_modified
+        ]
+
     def set_pokemon(self, pkm: Pokemon, team_pos: int):
-        self.team.set_pokemon(pkm, team_pos)
+        self.team.set_pokemon(pkm, team_pos, validate=not self.deferred)
         self.update_from_sub_data()
-        assert self.check_valid()
+        assert self.deferred or self.check_valid()
         pass
 
-    def update_pokedex(self):
+    def update_pokedex(self, validate: bool = True):
         seen = self.pokedex.data_seen
         caught = self.pokedex.data_caught
         length = self.pokedex.pokedex_size_bytes
 
         if self.gt == GameType(GameType.FR):
-            section0_data: bytearray = bytearray(self.sections[0].section)
-            section1_data: bytearray = bytearray(self.sections[1].section)
-            section4_data: bytearray = bytearray(self.sections[4].section)
+            sec0 = self.sections[0].data
+            if sec0[0x0028:0x0028+length] == caught and \
+                    sec0[0x005C:0x005C+length] == seen:
+                # Unchanged Pokedex, keep sections (and checksums) as they are.
+                return
+            section0_data: memoryview = self.sections[0].data
+            section1_data: memoryview = self.sections[1].data
+            section4_data: memoryview = self.sections[4].data
 
             section0_data[0x0028:0x0028+length] = caught
             section0_data[0x005C:0x005C+length] = seen
             section1_data[0x05F8:0x05F8+length] = seen
             section4_data[0x0B98:0x0B98+length] = seen
 
-            new_section0 = Section(bytes(section0_data), self.gt)
-            new_section1 = Section(bytes(section1_data), self.gt)
-            new_section4 = Section(bytes(section4_data), self.gt)
-
-            new_section0.update_from_sub_data()
-            new_section1.update_from_sub_data()
-            new_section4.update_from_sub_data()
-
-            self.sections[0] = TrainerInfo(new_section0.section, self.gt)
-            self.sections[1] = Team(new_section1.section, self.gt)
-            self.sections[4] = new_section4
-
-            self.trainer_info = self.sections[0]
-            self.team = self.sections[1]
+            self.sections[0].mark_dirty()
+            self.sections[1].mark_dirty()
+            self.sections[4].mark_dirty()
             pass
         elif self.gt == GameType(GameType.RR):
-            section1_data: bytearray = bytearray(self.sections[1].section)
+            sec1 = self.sections[1].data
+            if sec1[0x038D:0x038D + length] == caught and \
+                    sec1[0x0310:0x0310 + length] == seen:
+                # Unchanged Pokedex, keep sections (and checksums) as they are.
+                return
+            section1_data: memoryview = self.sections[1].data
 
             section1_data[0x038D:0x038D + length] = caught
             section1_data[0x0310:0x0310 + length] = seen
 
-            self.team.section = bytes(section1_data)
+            self.team.update_security()
+            self.team.mark_dirty()
 
             #new_section1 = Team(bytes(section1_data), self.gt)
             #new_section1.update()
@@ -173,9 +243,9 @@ class GameSave(ABCGameSave):
         else:
             raise NotImplemented
 
-        assert self.check_valid()
+        assert not validate or self.check_valid()
         pass
     pass
 
 
-__all__ = ["GameSave"]
+__all__ = ["GameSave", "POKEDEX_SECTION", "PC_SECTIONS"]
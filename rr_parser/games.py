@@ -1,14 +1,19 @@
-from typing import Optional
+from contextlib import contextmanager
+from typing import Iterator, Optional, Union
+import mmap
+import os
 
+from . import profiling
 from .charsets import Gen3Charset
 from .enums import GameType
+from .exceptions import ChecksumException
 from .pkms import Pokemon
 from .abstracts import UpdatableData
 from .game_saves import GameSave
 
 
 class MiscData(UpdatableData):
-    def __init__(self, d: bytes):
+    def __init__(self, d: memoryview):
         self._data = d
         pass
 
@@ -26,10 +31,24 @@ class MiscData(UpdatableData):
 
 
 class Gen3(UpdatableData, Gen3Charset):
-    def __init__(self, b: bytes, gt: GameType):
-        self.savegame: bytes = b
+    def __init__(self, b: Union[bytes, mmap.mmap], gt: GameType):
+        # Savegame buffer, owned by this instance. Game saves, sections and
+        # Pokemon are memoryview windows into it and edit it in place.
+        # Memory-mapped savegames are parsed straight from the mapping.
+        if isinstance(b, mmap.mmap):
+            self.savegame: Union[bytearray, mmap.mmap] = b
+            pass
+        else:
+            self.savegame: Union[bytearray, mmap.mmap] = bytearray(b)
+            profiling.count("bytes_copied", len(b))
+            pass
+        self._view: memoryview = memoryview(self.savegame)
         self.gt = gt
 
+        # Savegame file and mmap mode, set by the loader.
+        self.filename: Optional[str] = None
+        self.mmap_mode: Optional[str] = None
+
         # Declare attributes.
         self.game_save_a: Optional[GameSave] = None
         self.game_save_b: Optional[GameSave] = None
@@ -39,31 +58,39 @@ class Gen3(UpdatableData, Gen3Charset):
         self.mystery_gift: Optional[MiscData] = None
         self.recorded_battle: Optional[MiscData] = None
 
+        # Nesting depth of ``batch`` blocks.
+        self._batch_depth: int = 0
+
         # Fill attributes.
         self.update_from_data()
         pass
 
     @property
-    def data(self) -> bytes:
+    def data(self) -> Union[bytearray, mmap.mmap]:
         return self.savegame
 
+    @property
+    def read_only(self) -> bool:
+        return self._view.readonly
+
+    @profiling.phase("parse")
     def update_from_data(self):
         self.game_save_a = GameSave(
-            self.savegame[0x000000:57344],
+            self._view[0x000000:57344],
             self.gt
         )
         self.game_save_b = GameSave(
-            self.savegame[0x00E000:0x00E000 + 57344],
+            self._view[0x00E000:0x00E000 + 57344],
             self.gt
         )
         self.hall_of_fame = MiscData(
-            self.savegame[0x01C000:0x01C000 + 8192]
+            self._view[0x01C000:0x01C000 + 8192]
         )
         self.mystery_gift = MiscData(
-            self.savegame[0x01E000:0x01E000 + 4096]
+            self._view[0x01E000:0x01E000 + 4096]
         )
         self.recorded_battle = MiscData(
-            self.savegame[0x01F000:0x01F000 + 4096]
+            self._view[0x01F000:0x01F000 + 4096]
         )
 
         if not self.game_save_a.is_used:
@@ -87,35 +114,167 @@ class Gen3(UpdatableData, Gen3Charset):
         assert self.check_valid()
         pass
 
+    @profiling.phase("write")
     def save(self, filename: str):
+        if self.mmap_mode is not None and self.filename is not None and \
+                os.path.exists(filename) and \
+                os.path.samefile(filename, self.filename):
+            # Never truncate a mapped file, write changed sections only.
+            self.write_back(filename)
+            return
         assert self.check_valid()
         with open(filename, "wb") as f:
             f.write(self.savegame)
+        profiling.count("bytes_written", len(self.savegame))
         pass
 
-    def set_pokemon(self, pkm: "Pokemon", team_pos: int):
-        self.game_save.set_pokemon(pkm, team_pos)
-        if self.active_game_save == 0:
-            self.game_save_a = self.game_save
+    @profiling.phase("write")
+    def write_back(self, filename: Optional[str] = None) -> int:
+        """Write back the changed sections only.
+
+        Each 4 KiB section edited since the savegame was loaded (or last
+        written back) is written in place into ``filename``, which must hold
+        this savegame already. Savegames mapped with ``mmap_mode='r+'`` just
+        flush the changed pages of the mapping.
+
+        Parameters
+        ----------
+        filename : str, optional
+            Savegame path. Defaults to the loaded savegame file.
+
+        Returns
+        -------
+        int
+            Number of sections written.
+
+        Raises
+        ------
+        ValueError
+            If there is no savegame file to write back to.
+        """
+        modified = list()
+        for base, game_save in ((0x000000, self.game_save_a),
+                                (0x00E000, self.game_save_b)):
+            # Fill in pending checksums first, they modify sections too.
+            for sec in game_save.sections.values():
+                sec.update_checksum()
+                pass
+            for offset, sec in game_save.modified_sections():
+                modified.append((base + offset, sec))
+                pass
+            pass
+        assert self.check_valid()
+        if not modified:
+            return 0
+
+        if filename is None:
+            filename = self.filename
+            pass
+        if filename is None:
+            raise ValueError("No savegame file to write back to.")
+
+        if self.mmap_mode == 'r+' and os.path.samefile(filename,
+                                                        self.filename):
+            for offset, _ in modified:
+                # Flush offset must be aligned to the memory page size.
+                start = offset - offset % mmap.PAGESIZE
+                self.savegame.flush(start, offset + 4096 - start)
+                pass
             pass
         else:
-            self.game_save_b = self.game_save
+            with open(filename, "r+b") as f:
+                for offset, _ in modified:
+                    f.seek(offset)
+                    f.write(self._view[offset:offset + 4096])
+                    pass
+                pass
             pass
+
+        for _, sec in modified:
+            sec.clear_modified()
+            pass
+        profiling.count("bytes_written", 4096 * len(modified))
+        return len(modified)
+
+    @property
+    def in_batch(self) -> bool:
+        """Whether edits are staged within a ``batch`` block."""
+        return self._batch_depth > 0
+
+    @contextmanager
+    def batch(self) -> Iterator["Gen3"]:
+        """Stage edits, and serialize and validate them once on exit.
+
+        Within the block, Pokedex, money and team edits are written into
+        the savegame buffer, but the Pokedex write back, section checksums
+        and validation are deferred to the block exit. If the block raises,
+        or the savegame is invalid on exit, every edit is rolled back and
+        the error is raised. Nested blocks join the outermost one.
+
+        Examples
+        --------
+        >>> with game.batch():
+        ...     for species in range(1, 401):
+        ...         set_pokedex_entry(game, species)
+        ...     set_money(game, 999999)
+
+        Yields
+        ------
+        Gen3
+            This savegame.
+
+        Raises
+        ------
+        ChecksumException
+            If the savegame is invalid once edited.
+        """
+        if self.in_batch:
+            yield self
+            return
+
+        snapshot = _Snapshot(self)
+        self._set_batch_depth(1)
+        try:
+            yield self
+        except BaseException:
+            self._set_batch_depth(0)
+            snapshot.restore()
+            raise
+        self._set_batch_depth(0)
+
+        try:
+            self.update_from_sub_data(validate=False)
+            is_valid = self.check_valid()
+        except BaseException:
+            snapshot.restore()
+            raise
+        if not is_valid:
+            snapshot.restore()
+            raise ChecksumException("Savegame is invalid after batch edits.")
+        pass
+
+    def _set_batch_depth(self, depth: int):
+        self._batch_depth = depth
+        for game_save in (self.game_save_a, self.game_save_b):
+            game_save.deferred = depth > 0
+            pass
+        pass
+
+    def set_pokemon(self, pkm: "Pokemon", team_pos: int):
+        self.game_save.set_pokemon(pkm, team_pos)
         self.update_from_sub_data()
-        assert self.check_valid()
+        assert self.in_batch or self.check_valid()
         pass
 
-    def update_from_sub_data(self):
-        new_savegame = (
-                self.game_save_a.data +
-                self.game_save_b.data +
-                self.hall_of_fame.data +
-                self.mystery_gift.data +
-                self.recorded_battle.data
-        )
-        assert len(new_savegame) == 0x20000
-        self.savegame = new_savegame
-        assert self.check_valid()
+    def update_from_sub_data(self, validate: bool = True):
+        if self.in_batch:
+            # Serialized and validated once, on batch exit.
+            return
+        # Game saves are edited in place, only changed sections checksums
+        # are left to update.
+        self.game_save_a.update_from_sub_data(validate=validate)
+        self.game_save_b.update_from_sub_data(validate=validate)
+        assert not validate or self.check_valid()
         pass
 
     def check_valid(self):
@@ -142,6 +301,55 @@ class Gen3(UpdatableData, Gen3Charset):
     pass
 
 
+class _Snapshot:
+    """Savegame bytes, pending write back sections and Pokedex views, to
+    roll back a ``Gen3.batch`` block.
+    """
+    def __init__(self, game: Gen3):
+        self.game = game
+        self.data: Optional[bytes] = None
+        if not game.read_only:
+            self.data = bytes(game.savegame)
+            pass
+        self.modified = [
+            {
+                sec_id for sec_id, sec in game_save.sections.items()
+                if sec.is_modified
+            }
+            for game_save in (game.game_save_a, game.game_save_b)
+        ]
+        self.pokedex = [
+            None if game_save.pokedex is None else
+            (game_save.pokedex.data_seen, game_save.pokedex.data_caught)
+            for game_save in (game.game_save_a, game.game_save_b)
+        ]
+        pass
+
+    def restore(self):
+        """Restore the savegame, and rebuild every view."""
+        game = self.game
+        if self.data is not None:
+            game._view[:] = self.data
+            pass
+        game.update_from_data()
+        for game_save, modified, pokedex in zip(
+                (game.game_save_a, game.game_save_b),
+                self.modified,
+                self.pokedex
+        ):
+            for sec_id in modified:
+                game_save.sections[sec_id]._modified = True
+                pass
+            if pokedex is not None and game_save.pokedex is not None:
+                game_save.pokedex.data_seen, \
+                    game_save.pokedex.data_caught = pokedex
+                pass
+            pass
+        pass
+
+    pass
+
+
 class RadicalRed(Gen3):
     def __init__(self, b: bytes):
         super(RadicalRed, self).__init__(b, GameType(GameType.RR))
@@ -0,0 +1,216 @@
+"""Struct-of-arrays storage of the PC box Pokemon.
+
+Every box Pokemon field used for querying the PC (species, item,
+experience, moves, IVs, EVs, PID, OT ID, nature...) is decoded once, for
+all slots at a time, into one ``array`` column per field. Whole-PC queries
+and filters then run over the columns, without building any Pokemon
+object.
+"""
+from array import array
+from typing import Iterable, Optional, Union
+import struct
+
+from .charsets import Gen3Charset
+
+# Box Pokemon record (58 bytes), see ``BoxPokemon``:
+#   PID, OT ID, nickname, language, misc flags, OT name, markings,
+#   growth (species, item, experience, PP bonuses, friendship), unknown,
+#   attacks (4 x 10 bit moves), EVs, misc (pokerus, met location, origins,
+#   IVs / egg / hidden ability word).
+BOX_PKM_STRUCT = struct.Struct('<II10sBB7sBHHIBBB5s6sBBHI')
+BOX_PKM_SIZE: int = BOX_PKM_STRUCT.size
+
+STAT_NAMES = ['HP', 'Atk', 'Def', 'Spe', 'SpA', 'SpD']
+
+# Scalar columns and their array typecode.
+COLUMNS = {
+    "pid": 'I',
+    "ot_id": 'I',
+    "species": 'H',
+    "item": 'H',
+    "exp": 'I',
+    "friendship": 'B',
+    "ball": 'B',
+    "level_met": 'B',
+    "nature": 'B',
+    "hidden_ability": 'B',
+    "is_egg": 'B'
+}
+
+
+class PCStorage:
+    """Columnar view of every PC box Pokemon slot.
+
+    Attributes
+    ----------
+    n_slots : int
+        Number of slots.
+    slots_per_box : int
+        Number of slots per box.
+    pid, ot_id, species, item, exp, friendship, ball, level_met, nature,
+    hidden_ability, is_egg : array
+        One value per slot.
+    moves : tuple[array, array, array, array]
+        Move IDs, one column per move slot.
+    evs, ivs : tuple[array, ...]
+        EVs and IVs, one column per stat (HP, Atk, Def, Spe, SpA, SpD).
+    """
+    def __init__(self, data: Union[bytes, memoryview], n_slots: int,
+                 slots_per_box: int = 30):
+        """Decode the PC box Pokemon records into columns.
+
+        Parameters
+        ----------
+        data : Union[bytes, memoryview]
+            ``n_slots`` box Pokemon records, back to back.
+        n_slots : int
+            Number of slots.
+        slots_per_box : int
+            Number of slots per box.
+        """
+        assert (len(data) >= n_slots * BOX_PKM_SIZE)
+        self._data = data
+        self.n_slots: int = n_slots
+        self.slots_per_box: int = slots_per_box
+
+        # Fill columns.
+        self.update_from_data()
+        pass
+
+    def update_from_data(self):
+        records = BOX_PKM_STRUCT.iter_unpack(
+            self._data[0:self.n_slots * BOX_PKM_SIZE]
+        )
+        (pid, ot_id, _, _, _, _, _, species, item, exp, _, friendship, _,
+         moves, evs, _, _, origins, iv_words) = zip(*records)
+
+        self.pid = array('I', pid)
+        self.ot_id = array('I', ot_id)
+        self.species = array('H', species)
+        self.item = array('H', item)
+        self.exp = array('I', exp)
+        self.friendship = array('B', friendship)
+        self.ball = array('B', [(o >> 11) & 0xF for o in origins])
+        self.level_met = array('B', [o & 0x7F for o in origins])
+        self.nature = array('B', [p % 25 for p in pid])
+        self.hidden_ability = array('B', [w >> 31 for w in iv_words])
+        self.is_egg = array('B', [(w >> 30) & 1 for w in iv_words])
+
+        move_words = [int.from_bytes(m, 'little') for m in moves]
+        self.moves = tuple(
+            array('H', [(w >> (10 * i)) & 0x3FF for w in move_words])
+            for i in range(0, 4)
+        )
+        self.evs = tuple(
+            array('B', [e[i] for e in evs]) for i in range(0, 6)
+        )
+        self.ivs = tuple(
+            array('B', [(w >> (5 * i)) & 0x1F for w in iv_words])
+            for i in range(0, 6)
+        )
+        pass
+
+    def __len__(self) -> int:
+        return self.n_slots
+
+    def slot_of(self, box: int, pos: int) -> int:
+        """Slot index of a box position."""
+        assert (0 <= pos < self.slots_per_box)
+        return box * self.slots_per_box + pos
+
+    def box_of(self, slot: int) -> tuple[int, int]:
+        """Box and position within the box of a slot index."""
+        return divmod(slot, self.slots_per_box)
+
+    def slot_moves(self, slot: int) -> list[int]:
+        return [m[slot] for m in self.moves]
+
+    def slot_evs(self, slot: int) -> list[int]:
+        return [e[slot] for e in self.evs]
+
+    def slot_ivs(self, slot: int) -> list[int]:
+        return [iv[slot] for iv in self.ivs]
+
+    def occupied(self, box: Optional[int] = None) -> list[int]:
+        """Non-empty slots, optionally within a single box.
+
+        Parameters
+        ----------
+        box : Optional[int]
+            Box index. If None, search every box.
+
+        Returns
+        -------
+        list[int]
+            Slot indices.
+        """
+        if box is None:
+            start, end = 0, self.n_slots
+            pass
+        else:
+            start = box * self.slots_per_box
+            end = start + self.slots_per_box
+            pass
+        species = self.species
+        return [i for i in range(start, end) if species[i] != 0]
+
+    def where(self, **conditions: Union[int, Iterable[int]]) -> list[int]:
+        """Non-empty slots whose columns match every condition.
+
+        Examples
+        --------
+        >>> storage.where(species=25)
+        >>> storage.where(nature={3, 13}, hidden_ability=1)
+
+        Parameters
+        ----------
+        conditions : Union[int, Iterable[int]]
+            Column name, and either the wanted value or a collection of
+            accepted values.
+
+        Returns
+        -------
+        list[int]
+            Matching slot indices.
+        """
+        slots = self.occupied()
+        for name, value in conditions.items():
+            if name not in COLUMNS:
+                raise ValueError(f"Unknown PC column: {name}")
+            column = getattr(self, name)
+            if isinstance(value, int):
+                slots = [i for i in slots if column[i] == value]
+                pass
+            else:
+                accepted = set(value)
+                slots = [i for i in slots if column[i] in accepted]
+                pass
+            pass
+        return slots
+
+    def nicknames(self) -> list[str]:
+        """Nickname of every slot, decoded in a single call."""
+        return Gen3Charset.decode_many(
+            self._data, self.n_slots, 10, BOX_PKM_SIZE, 0x8
+        )
+
+    def ot_names(self) -> list[str]:
+        """Original trainer name of every slot, decoded in a single call."""
+        return Gen3Charset.decode_many(
+            self._data, self.n_slots, 7, BOX_PKM_SIZE, 0x14
+        )
+
+    def species_counts(self) -> dict[int, int]:
+        """Number of Pokemon of every species stored in the PC."""
+        counts: dict[int, int] = dict()
+        for sp in self.species:
+            if sp != 0:
+                counts[sp] = counts.get(sp, 0) + 1
+                pass
+            pass
+        return counts
+
+    pass
+
+
+__all__ = ["PCStorage", "BOX_PKM_STRUCT", "BOX_PKM_SIZE", "STAT_NAMES"]
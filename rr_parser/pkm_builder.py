@@ -1,12 +1,16 @@
-from typing import Optional, Union, Any
+from dataclasses import dataclass
+from typing import Iterable, Optional, Union
 from math import floor
 from random import random
-import re
-import pokebase as pb
 
-from .pkms import Pokemon, DecryptedData
+from .pkms import Pokemon
+from .checksums import Gen3PokemonChecksum
+from .encryption import encrypt_sub_data, encrypt_sub_data_many
 from .enums import GameType
+from .exceptions import SpeciesDataException
 from .constants.rr import get_species_learnset, get_species_id, MoveLevel
+from .constants.species_db import SpeciesData, get_species_data, \
+    get_experience, get_move_pp, fetch_missing_species_data
 
 NATURES = {
     "Hardy": 0,
@@ -51,7 +55,7 @@ def _level(level: int) -> int:
     return level
 
 
-def _species_no(gen: GameType, species: str, pkm: Any):
+def _species_no(gen: GameType, species: str, pkm: SpeciesData):
     if gen == GameType(GameType.FR):
         species_no: int = pkm.id
         pass
@@ -66,7 +70,7 @@ def _species_no(gen: GameType, species: str, pkm: Any):
 def _ability(
         gen: GameType,
         ability: Optional[int],
-        pkm: Any) -> tuple[int, bool]:
+        pkm: SpeciesData) -> tuple[int, bool]:
     """Get the ability number (1 or 2) and whether the ability is hidden.
 
     Parameters
@@ -76,8 +80,8 @@ def _ability(
     ability : Optional[int]
         If None, select random non-hidden ability, else check ability number
         is valid.
-    pkm : Any
-        PokeAPI Pokemon resource for getting available abilities.
+    pkm : SpeciesData
+        Species data for getting available abilities.
 
     Returns
     -------
@@ -170,38 +174,96 @@ def _ivs(ivs: Optional[list[int]]) -> list[int]:
     return ivs
 
 
-def _pid(ability: int, nature: int, ot_id: int, shiny: bool) -> int:
-    if shiny:
-        ot_id_p = ot_id & ((1 << 16) - 1)
-        ot_id_s = (ot_id >> 16) & ((1 << 16) - 1)
-        for s in range(0, 8):
-            k = s ^ ot_id_p ^ ot_id_s
-            for p2 in range(0, 65536):
-                p1 = k ^ p2
-                pid = (p1 << 16) | p2
-                if (pid % 2 == ability) and (pid % 25 == nature):
-                    return pid
-                pass
-            pass
+# Shiny PIDs: ``11 * b + 2 * i`` covers every residue modulo 25, for the
+# 3 low PID high-half bits ``b`` and the 2 PID low-half bits ``i`` above the
+# ability bit, see ``solve_pid``.
+_SHINY_RESIDUES: dict[int, tuple[int, int]] = dict()
+for _b in range(0, 8):
+    for _i in range(0, 4):
+        _SHINY_RESIDUES.setdefault((11 * _b + 2 * _i) % 25, (_b, _i))
         pass
+    pass
+assert (len(_SHINY_RESIDUES) == 25)
 
-    # Generate new PID.
-    if nature == 0 and ability == 0:
-        pid = 50
-        pass
-    elif nature == 0 and ability == 1:
-        pid = 25
-        pass
-    else:
-        c = nature - ability
-        if c % 2 == 0:
-            pid = 50 + nature
+
+def is_shiny(pid: int, ot_id: int) -> bool:
+    """Whether a PID is shiny for an OT full ID (secret and public)."""
+    return (
+        (pid >> 16) ^ (pid & 0xFFFF) ^ (ot_id >> 16) ^ (ot_id & 0xFFFF)
+    ) < 8
+
+
+def solve_pid(ot_id: int,
+              nature: Optional[int] = None,
+              ability_bit: Optional[int] = None,
+              shiny: Optional[bool] = None) -> int:
+    """Find a PID with the given nature, ability bit and shininess.
+
+    Solved in constant time: nature and ability bit are ``PID % 25`` and
+    ``PID % 2``, combined (CRT) into ``PID % 50``. A shiny PID has a high
+    half ``p1 = 8 * a + b`` and a low half ``p2 = 8 * (a ^ (T >> 3)) + c``,
+    for the OT ``T = TID ^ SID``, so ``p1 ^ p2 ^ T < 8`` whatever the free
+    ``b`` and ``c`` (3 bits each). Taking ``a = T >> 3``,
+    ``PID % 25 = (11 * p1 + p2) % 25`` is then solved for ``b`` and ``c``
+    through a 25 entry table, keeping ``c % 2`` as the ability bit.
+
+    Parameters
+    ----------
+    ot_id : int
+        OT full ID (secret and public).
+    nature : Optional[int]
+        Nature identifier 0 to 24. If None, any.
+    ability_bit : Optional[int]
+        Ability bit, 0 or 1. If None, any.
+    shiny : Optional[bool]
+        Whether the PID is shiny. If None, any.
+
+    Returns
+    -------
+    int
+        32 bit PID.
+    """
+    assert (nature is None or 0 <= nature <= 24)
+    assert (ability_bit is None or ability_bit in (0, 1))
+    parity: int = 0 if ability_bit is None else ability_bit
+
+    if not shiny:
+        # CRT: PID % 50, from PID % 2 and PID % 25.
+        if nature is None:
+            pid = 50 + parity
+            pass
+        elif nature % 2 == parity:
+            pid = nature
             pass
         else:
-            pid = 25 + nature
+            pid = nature + 25
             pass
+        if pid < 25:
+            pid = pid + 50
+            pass
+        if shiny is False:
+            # At most 8 low halves are shiny for a zero high half.
+            while is_shiny(pid, ot_id):
+                pid = pid + 50
+                pass
+            pass
+        return pid
+
+    t: int = (ot_id ^ (ot_id >> 16)) & 0xFFFF
+    p1_high: int = t & ~7
+    if nature is None:
+        b, i = 0, 0
+        pass
+    else:
+        b, i = _SHINY_RESIDUES[(nature - 11 * p1_high - parity) % 25]
         pass
-    return pid
+    p1: int = p1_high | b
+    p2: int = parity + 2 * i
+    return (p1 << 16) | p2
+
+
+def _pid(ability: int, nature: int, ot_id: int, shiny: bool) -> int:
+    return solve_pid(ot_id, nature, ability % 2, shiny or None)
 
 
 def _ot_name_bytes(ot_name: str) -> bytes:
@@ -218,7 +280,7 @@ def _ot_name_bytes(ot_name: str) -> bytes:
     return ot_name_bytes
 
 
-def _nick(pkm_species: Any) -> bytes:
+def _nick(pkm_species: SpeciesData) -> bytes:
     # Get pokemon name.
     nick: str = pkm_species.name.upper()
     nick_bytes: bytes = Pokemon.ascii2bin(nick)
@@ -229,13 +291,9 @@ def _nick(pkm_species: Any) -> bytes:
     return nick_bytes
 
 
-def _growth_block(gen: GameType, species_no: int, lvl: int, pkm_species: Any) -> bytes:
-    # Get growth rate.
-    gr_name = pkm_species.growth_rate.name
-    gr = pb.growth_rate(gr_name)
-
-    # Get experience at said growth rate.
-    exp: int = gr.levels[lvl-1].experience
+def _growth_block(gen: GameType, species_no: int, lvl: int, pkm_species: SpeciesData) -> bytes:
+    # Get experience at species growth rate.
+    exp: int = get_experience(pkm_species.growth_rate, lvl)
 
     # Growth sub-data block.
     growth: bytearray = bytearray(12)
@@ -257,43 +315,16 @@ def _growth_block(gen: GameType, species_no: int, lvl: int, pkm_species: Any) ->
     pass
 
 
-def _get_species_attacks_by_level(species: int, gt: GameType) -> list[MoveLevel]:
-    pk = pb.pokemon(species)
-
+def _get_species_attacks_by_level(pkm: SpeciesData) -> list[MoveLevel]:
     move_list = list()
-
-    for move in pk.moves:
-        version_group_detail: Optional[Any] = None
-        for vgd in move.version_group_details:
-            if gt == GameType(GameType.FR) and vgd.version_group.name == "firered-leafgreen":
-                version_group_detail = vgd
-                pass
-            elif gt == GameType(GameType.RR) and vgd.version_group.name == "ultra-sun-ultra-moon":
-                version_group_detail = vgd
-                pass
-            pass
-        if version_group_detail is not None:
-            if version_group_detail.move_learn_method.name == "level-up":
-                learn_level: int = version_group_detail.level_learned_at
-                id_match = re.search(r"/move/(?P<id>[0-9]+)/?$", move.move.url)
-                move_id = int(id_match.group("id"))
-                move_api = pb.move(move_id)
-                pp = move_api.pp
-                mv = MoveLevel(
-                    id=move_id,
-                    lvl=learn_level,
-                    pp=pp,
-                    name=move.move.name
-                )
-                move_list.append(mv)
-                pass
-            else:
-                # Skip non-leveled moves.
-                pass
-            pass
-        else:
-            # Skip: generation restriction unmatched.
-            pass
+    for move_id, learn_level, name in pkm.learnset_fr:
+        mv = MoveLevel(
+            id=move_id,
+            lvl=learn_level,
+            pp=get_move_pp(move_id),
+            name=name
+        )
+        move_list.append(mv)
         pass
     return move_list
 
@@ -302,10 +333,10 @@ def _get_rr_species_attacks_by_level(species: str) -> list[MoveLevel]:
     return get_species_learnset(species)
 
 
-def _attacks_block(gen: GameType, lvl: int, species_no: int, species: str):
+def _attacks_block(gen: GameType, lvl: int, pkm: SpeciesData, species: str):
     # Attack sub-data block.
     if gen == GameType(GameType.FR):
-        moves: list[MoveLevel] = _get_species_attacks_by_level(species_no, gen)
+        moves: list[MoveLevel] = _get_species_attacks_by_level(pkm)
         pass
     elif gen == GameType(GameType.RR):
         moves: list[MoveLevel] = _get_rr_species_attacks_by_level(species)
@@ -313,7 +344,8 @@ def _attacks_block(gen: GameType, lvl: int, species_no: int, species: str):
     else:
         raise NotImplemented
 
-    moves.sort(key=lambda move: move.lvl, reverse=True)
+    # Learnset tables are shared, sort a copy.
+    moves = sorted(moves, key=lambda move: move.lvl, reverse=True)
     if moves[-1].lvl == 0:
         moves.pop()
         pass
@@ -461,15 +493,9 @@ def nat_modifier(i: int, nat: int) -> float:
     pass
 
 
-def _stats(pkm: Any, lvl: int, nat: int, evs: list[int], ivs: list[int]) -> dict[int]:
-    # Get pokemon species base stats.
-    db_stats = pkm.stats
-    base_stats: dict[int, int] = dict()
-    for st in db_stats:
-        bs: int = st.base_stat
-        name: str = st.stat.name
-        base_stats[STATS[name.upper()]] = bs
-        pass
+def _stats(pkm: SpeciesData, lvl: int, nat: int, evs: list[int], ivs: list[int]) -> dict[int]:
+    # Get pokemon species base stats, already in STATS order.
+    base_stats: list[int] = pkm.base_stats
 
     # Stat calculation (pokexperto: https://www.pokexperto.net/index2.php?seccion=mecanica/genetica34).
     stats: dict[int, int] = dict()
@@ -491,70 +517,151 @@ def _stats(pkm: Any, lvl: int, nat: int, evs: list[int], ivs: list[int]) -> dict
     return stats
 
 
-def pkm_builder(
-        gen: GameType,
-        species: str,
-        level: int = 5,
-        ot_name: str = "ISD",
-        ot_id: int = 123456789,
-        ot_gender: str = "Boy",
-        ability: Optional[int] = None,
-        nature: Optional[Union[str, int]] = None,
-        evs: Optional[list[int]] = None,
-        ivs: Optional[list[int]] = None,
-        shiny: bool = False
-):
-    # Get online data.
-    pkm_species = pb.pokemon_species(species)
-    pkm = pb.pokemon(pkm_species.id)
+def _species_data(gen: GameType, species: str) -> SpeciesData:
+    """Get species data from the bundled dataset.
+
+    Fields missing from the dataset are fetched from PokeAPI, once, see
+    ``fetch_missing_species_data``.
+
+    Raises
+    ------
+    SpeciesDataException
+        If the species is missing from the dataset, or any data needed for
+        building it is missing and could not be fetched.
+    """
+    pkm_species: Optional[SpeciesData] = get_species_data(species)
+    if pkm_species is None:
+        raise SpeciesDataException(
+            f"Species '{species}' is not in the species dataset."
+        )
+    fr_learnset: bool = gen == GameType(GameType.FR)
+    if not pkm_species.is_complete(fr_learnset):
+        missing = [
+            name for name, value in (
+                ("growth rate", pkm_species.growth_rate),
+                ("base stats", pkm_species.base_stats),
+                ("abilities", pkm_species.abilities),
+                ("FireRed learnset",
+                 pkm_species.learnset_fr if fr_learnset else ())
+            ) if value is None
+        ]
+        try:
+            fetch_missing_species_data(pkm_species, fr_learnset)
+        except (ImportError, OSError, ValueError) as e:
+            raise SpeciesDataException(
+                "Species '{}' has no {} in the species dataset, and fetching "
+                "it from PokeAPI failed ({}).".format(
+                    species, ", ".join(missing), e
+                )
+            ) from e
+        pass
+    return pkm_species
+
+
+@dataclass
+class PokemonSpec:
+    """Pokemon to build, see ``pkm_builder`` for every field."""
+    species: str
+    level: int = 5
+    ot_name: str = "ISD"
+    ot_id: int = 123456789
+    ot_gender: str = "Boy"
+    ability: Optional[int] = None
+    nature: Optional[Union[str, int]] = None
+    evs: Optional[list[int]] = None
+    ivs: Optional[list[int]] = None
+    shiny: bool = False
+    pass
+
+
+class _SpeciesTemplate:
+    """Species data resolved once, shared by every Pokemon of a species.
+
+    Growth and attacks sub-data blocks only depend on the species and level,
+    and are built once per level.
+    """
+    def __init__(self, gen: GameType, species: str):
+        self.gen = gen
+        self.species = species
+        self.data: SpeciesData = _species_data(gen, species)
+        self.species_no: int = _species_no(gen, species, self.data)
+        self.nick: bytes = _nick(self.data)
+        self._growth_blocks: dict[int, bytes] = dict()
+        self._attacks_blocks: dict[int, bytes] = dict()
+        pass
+
+    def growth_block(self, lvl: int) -> bytes:
+        block = self._growth_blocks.get(lvl, None)
+        if block is None:
+            block = self._growth_blocks[lvl] = _growth_block(
+                self.gen, self.species_no, lvl, self.data
+            )
+            pass
+        return block
+
+    def attacks_block(self, lvl: int) -> bytes:
+        block = self._attacks_blocks.get(lvl, None)
+        if block is None:
+            block = self._attacks_blocks[lvl] = _attacks_block(
+                self.gen, lvl, self.data, self.species
+            )
+            pass
+        return block
+
+    pass
+
+
+def _write_pokemon(gen: GameType, template: _SpeciesTemplate,
+                   spec: PokemonSpec, data: memoryview,
+                   encrypt: bool = True):
+    """Build a Pokemon into a 100 bytes record.
+
+    Sub-data is left decrypted if ``encrypt`` is False, for encrypting
+    (Fire Red) records in batches.
+    """
+    pkm = template.data
 
     # Parse input data.
-    lvl = _level(level)
-    species_no: int = _species_no(gen, species, pkm)
-    ot_name_bytes: bytes = _ot_name_bytes(ot_name)
-    nick_bytes: bytes = _nick(pkm_species)
-    ab, hidden = _ability(gen, ability, pkm)
-    nat: int = _nature(nature)
-    evs: list[int] = _evs(evs)
-    ivs: list[int] = _ivs(ivs)
-    pid: int = _pid(ab, nat, ot_id, shiny)
-
-    pid_bytes = pid.to_bytes(4, 'little')
+    lvl = _level(spec.level)
+    ot_id: int = spec.ot_id
+    ot_name_bytes: bytes = _ot_name_bytes(spec.ot_name)
+    ab, hidden = _ability(gen, spec.ability, pkm)
+    nat: int = _nature(spec.nature)
+    evs: list[int] = _evs(spec.evs)
+    ivs: list[int] = _ivs(spec.ivs)
+    pid: int = _pid(ab, nat, ot_id, spec.shiny)
+
     # Sub-data blocks.
-    growth_block: bytes = _growth_block(gen, species_no, lvl, pkm_species)
-    attacks_block: bytes = _attacks_block(gen, lvl, species_no, species)
+    growth_block: bytes = template.growth_block(lvl)
+    attacks_block: bytes = template.attacks_block(lvl)
     evs_block: bytes = _evs_block(evs)
-    misc_block: bytes = _misc_block(gen, lvl, ot_gender, ab, hidden, ivs)
+    misc_block: bytes = _misc_block(gen, lvl, spec.ot_gender, ab, hidden, ivs)
 
-    # Sub-data block (decrypted).
-    sub_data_data = growth_block + attacks_block + evs_block + misc_block
-    sub_data = DecryptedData(sub_data_data, pid, ot_id)
+    # Sub-data block (decrypted), checksum is computed over it.
+    sub_data = growth_block + attacks_block + evs_block + misc_block
+    sub_data_checksum: bytes = Gen3PokemonChecksum.get_checksum(sub_data)
     if gen == GameType(GameType.FR):
-        sub_data = sub_data.to_encrypted()
+        if encrypt:
+            sub_data = encrypt_sub_data(sub_data, pid, ot_id)
+            pass
         pass
     elif gen == GameType(GameType.RR):
         pass
     else:
         raise NotImplemented
 
-    # Get checksum.
-    # sub_data_checksum: bytes = sub_data.get_checksum()
-    sub_data_checksum: bytes = sub_data.get_checksum()
-
     # Stats.
     stats = _stats(pkm, lvl, nat, evs, ivs)
 
-    data = bytearray(100)
-
-    data[0:4] = pid_bytes
+    data[0:4] = pid.to_bytes(4, 'little')
     data[4:8] = ot_id.to_bytes(4, 'little')
-    data[8:18] = nick_bytes
+    data[8:18] = template.nick
     data[18:20] = 0x0202.to_bytes(2, 'little')  # Lang: EN.
     data[20:27] = ot_name_bytes
-    data[27:28] = [0xF]
+    data[27] = 0xF
     data[28:30] = sub_data_checksum
-    data[32:80] = sub_data.data
-    data[84:85] = lvl.to_bytes(1, 'little')
+    data[32:80] = sub_data
+    data[84] = lvl
     data[86:88] = stats[0].to_bytes(2, 'little')
     data[88:90] = stats[0].to_bytes(2, 'little')
     data[90:92] = stats[1].to_bytes(2, 'little')
@@ -562,12 +669,121 @@ def pkm_builder(
     data[94:96] = stats[3].to_bytes(2, 'little')
     data[96:98] = stats[4].to_bytes(2, 'little')
     data[98:100] = stats[5].to_bytes(2, 'little')
+    pass
+
+
+def pkm_builder(
+        gen: GameType,
+        species: str,
+        level: int = 5,
+        ot_name: str = "ISD",
+        ot_id: int = 123456789,
+        ot_gender: str = "Boy",
+        ability: Optional[int] = None,
+        nature: Optional[Union[str, int]] = None,
+        evs: Optional[list[int]] = None,
+        ivs: Optional[list[int]] = None,
+        shiny: bool = False
+):
+    # Get species data, offline.
+    template = _SpeciesTemplate(gen, species)
 
-    assert (len(data) == 100)
+    data = bytearray(100)
+    _write_pokemon(
+        gen,
+        template,
+        PokemonSpec(
+            species=species,
+            level=level,
+            ot_name=ot_name,
+            ot_id=ot_id,
+            ot_gender=ot_gender,
+            ability=ability,
+            nature=nature,
+            evs=evs,
+            ivs=ivs,
+            shiny=shiny
+        ),
+        memoryview(data)
+    )
 
     # Finally, Pokemon!
     pkm = Pokemon(data, gen)
     return pkm
 
 
-__all__ = ["pkm_builder"]
+def build_many(gen: GameType,
+               specs: Iterable[Union[PokemonSpec, dict]]) -> bytearray:
+    """Build many Pokemon into a buffer of 100 bytes records.
+
+    Specs are grouped by species, so that species data, learnsets,
+    experience and the growth and attacks sub-data blocks are resolved once
+    per species (and level). Fire Red sub-data blocks are encrypted in a
+    single batch. Random fields (unset ability, nature and IVs) are drawn
+    species by species.
+
+    Examples
+    --------
+    >>> buf = build_many(GameType.RR, [
+    ...     PokemonSpec("bulbasaur", level=lvl) for lvl in (5, 50, 100)
+    ... ])
+    >>> pkm = Pokemon(buf[0:100], GameType.RR)
+
+    Parameters
+    ----------
+    gen : GameType
+        Savegame type.
+    specs : Iterable[Union[PokemonSpec, dict]]
+        Pokemon to build, as specs or ``PokemonSpec`` keyword arguments.
+
+    Returns
+    -------
+    bytearray
+        Team Pokemon records, back to back, in ``specs`` order.
+
+    Raises
+    ------
+    SpeciesDataException
+        If the species dataset misses any data needed for building them, and
+        it could not be fetched.
+    """
+    specs = [
+        spec if isinstance(spec, PokemonSpec) else PokemonSpec(**spec)
+        for spec in specs
+    ]
+    buf = bytearray(100 * len(specs))
+    view = memoryview(buf)
+
+    # Group by species.
+    groups: dict[str, list[int]] = dict()
+    for i, spec in enumerate(specs):
+        groups.setdefault(spec.species.lower(), list()).append(i)
+        pass
+
+    encrypt: bool = gen != GameType(GameType.FR)
+    for indices in groups.values():
+        template = _SpeciesTemplate(gen, specs[indices[0]].species)
+        for i in indices:
+            _write_pokemon(gen, template, specs[i],
+                           view[i * 100:(i + 1) * 100], encrypt)
+            pass
+        pass
+
+    if not encrypt and specs:
+        # Encrypt every Fire Red sub-data block at once.
+        n = len(specs)
+        encrypted = encrypt_sub_data_many(
+            b''.join(view[i * 100 + 32:i * 100 + 80] for i in range(0, n)),
+            [int.from_bytes(view[i * 100:i * 100 + 4], 'little')
+             for i in range(0, n)],
+            [int.from_bytes(view[i * 100 + 4:i * 100 + 8], 'little')
+             for i in range(0, n)]
+        )
+        for i in range(0, n):
+            view[i * 100 + 32:i * 100 + 80] = encrypted[i * 48:(i + 1) * 48]
+            pass
+        pass
+    return buf
+
+
+__all__ = ["pkm_builder", "build_many", "PokemonSpec", "solve_pid", "is_shiny"]
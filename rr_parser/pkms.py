@@ -1,38 +1,105 @@
 from typing import Optional, Tuple
 
+from . import profiling
 from .abstracts import Pokemon as ABCPokemon, UpdatableData, \
     PokemonSubData as ABCPokemonSubData
 from .checksums import Gen3PokemonChecksum
 from .enums import GameType
 from .exceptions import InvalidSizeException, ChecksumException
 from .charsets import Gen3Charset
+from .encryption import SUBSTRUCTURE_ORDER, block_indices, xor_sub_data, \
+    encrypt_sub_data, decrypt_sub_data
 
-SUBSTRUCTURE_ORDER = {
-        0: "GAEM",
-        6: "AGEM",
-        12: "EGAM",
-        18: "MGAE",
-        1: "GAME",
-        7: "AGME",
-        13: "EGMA",
-        19: "MGEA",
-        2: "GEAM",
-        8: "AEGM",
-        14: "EAGM",
-        20: "MAGE",
-        3: "GEMA",
-        9: "AEMG",
-        15: "EAMG",
-        21: "MAEG",
-        4: "GMAE",
-        10: "AMGE",
-        16: "EMGA",
-        22: "MEGA",
-        5: "GMEA",
-        11: "AMEG",
-        17: "EMAG",
-        23: "MEAG"
-    }
+
+_UNSET = object()
+
+
+class lazy_property:
+    """Attribute decoded on first access and cached in a ``__slots__`` slot.
+
+    The decoded value is stored in the ``_<name>`` slot of the instance,
+    which must be declared in the class ``__slots__``. Assigning the
+    attribute overrides the cached value, and ``_clear_lazy`` drops every
+    cached value of an instance so that it is decoded again.
+
+    Values of ``shared`` properties only depend on the raw record bytes,
+    and are also stored into the instance ``_record`` (see
+    ``record_cache``), if any, for views of identical records to reuse.
+    """
+    def __init__(self, func, shared: bool = False):
+        self.func = func
+        self.shared = shared
+        self.slot: str = "_" + func.__name__
+        self.__doc__ = func.__doc__
+        pass
+
+    def __set_name__(self, owner, name):
+        self.slot = "_" + name
+        pass
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        value = getattr(obj, self.slot, _UNSET)
+        if value is _UNSET:
+            value = self.func(obj)
+            setattr(obj, self.slot, value)
+            if self.shared and obj._record is not None:
+                _share(obj, self.slot, value)
+                pass
+            pass
+        return value
+
+    def __set__(self, obj, value):
+        setattr(obj, self.slot, value)
+        pass
+
+    pass
+
+
+def shared_lazy_property(func) -> lazy_property:
+    """``lazy_property`` shared between views of identical records."""
+    return lazy_property(func, shared=True)
+
+
+def _live_record(obj):
+    """Record attached to ``obj``, None if none or if its data changed since
+    the record was attached."""
+    record = obj._record
+    if record is not None and bytes(obj.data) != record.key[1]:
+        # Data changed since the record was attached, stop sharing.
+        obj._record = None
+        return None
+    return record
+
+
+def _share(obj, slot: str, value):
+    record = _live_record(obj)
+    if record is not None:
+        record.values[slot] = value
+        pass
+    pass
+
+
+_LAZY_SLOTS: dict[type, tuple[str, ...]] = dict()
+
+
+def _clear_lazy(obj):
+    """Drop every cached ``lazy_property`` value of ``obj``."""
+    cls = type(obj)
+    slots = _LAZY_SLOTS.get(cls)
+    if slots is None:
+        slots = _LAZY_SLOTS[cls] = tuple(
+            v.slot for klass in cls.__mro__ for v in vars(klass).values()
+            if isinstance(v, lazy_property)
+        )
+        pass
+    for slot in slots:
+        if hasattr(obj, slot):
+            delattr(obj, slot)
+            pass
+        pass
+    pass
 
 
 def _f_assert_evs(v: list[int]):
@@ -59,6 +126,8 @@ class Growth(UpdatableData):
     data : bytes
         Block data getter and setter.
     """
+    __slots__ = ("_data", "species")
+
     def __init__(self, d: bytes):
         """Pokemon growth sub-data block."""
         self._data: bytes = d
@@ -115,6 +184,8 @@ class Growth(UpdatableData):
 
 
 class Attacks(UpdatableData):
+    __slots__ = ("_data", "isBoxMon", "moves")
+
     def __init__(self, d: bytes, isBoxMon=False):
         self._data: bytes = d
         self.isBoxMon = isBoxMon
@@ -151,10 +222,10 @@ class Attacks(UpdatableData):
 
 
 class EVs(UpdatableData):
+    __slots__ = ("_data",)
+
     def __init__(self, d: bytes):
         self._data: bytes = d
-        self._evs = None
-        self._evs_dict = None
 
         self.update_from_data()
 
@@ -241,8 +312,9 @@ class EVs(UpdatableData):
         self._set_ev(5, val)
         pass
 
-    def update_from_data(self):
-        self._evs = [
+    @property
+    def _evs(self) -> list[int]:
+        return [
             self._data[0],
             self._data[1],
             self._data[2],
@@ -250,10 +322,17 @@ class EVs(UpdatableData):
             self._data[4],
             self._data[5],
         ]
-        self._evs_dict = dict(zip(
+
+    @property
+    def _evs_dict(self) -> dict[str, int]:
+        return dict(zip(
             ['HP', 'Atk', 'Def', 'Spe', 'SpA', 'SpD'], self._evs
         ))
 
+    def update_from_data(self):
+        # EVs are read straight from the block data.
+        pass
+
     def update_from_sub_data(self):
         pass
 
@@ -261,6 +340,12 @@ class EVs(UpdatableData):
 
 
 class Misc(UpdatableData):
+    __slots__ = (
+        "_data", "pokerus_days_left", "pokerus_strain", "met_location",
+        "ot_gender", "ball_caught", "origin_game", "level_met", "hatched",
+        "ability", "is_egg"
+    )
+
     def __init__(self, d: bytes):
         self._data = d
         self.pokerus_days_left: int = None
@@ -271,8 +356,6 @@ class Misc(UpdatableData):
         self.origin_game: int = None
         self.level_met: int = None
         self.hatched: bool = None
-        self.IVs: list[int] = None
-        self.IVs_dict: dict[str, int] = None
         self.ability: int = None
         self.is_egg: int = None
 
@@ -282,6 +365,23 @@ class Misc(UpdatableData):
     def data(self) -> bytes:
         return self._data
 
+    @property
+    def IVs(self) -> list[int]:
+        iv_data = int.from_bytes(self._data[4:8], 'little')
+        _hp = iv_data & 0x1F
+        _atk = (iv_data >> 5) & 0x1F
+        _def = (iv_data >> 10) & 0x1F
+        _spe = (iv_data >> 15) & 0x1F
+        _spa = (iv_data >> 20) & 0x1F
+        _spd = (iv_data >> 25) & 0x1F
+        return [_hp, _atk, _def, _spe, _spa, _spd]
+
+    @property
+    def IVs_dict(self) -> dict[str, int]:
+        return dict(zip([
+            'HP', 'Atk', 'Def', 'Spe', 'SpA', 'SpD'
+        ], self.IVs))
+
     def update_from_data(self):
         pokerus = self._data[0]
         self.pokerus_days_left = pokerus & 0b00000111
@@ -301,18 +401,6 @@ class Misc(UpdatableData):
         self.ability = iv_data >> 31
         self.is_egg = (iv_data >> 30 )& 1
 
-        _hp = iv_data & 0x1F
-        _atk = (iv_data >> 5) & 0x1F
-        _def = (iv_data >> 10) & 0x1F
-        _spe = (iv_data >> 15) & 0x1F
-        _spa = (iv_data >> 20) & 0x1F
-        _spd = (iv_data >> 25) & 0x1F
-
-        self.IVs = [_hp, _atk, _def, _spe, _spa, _spd]
-        self.IVs_dict = dict(zip([
-            'HP', 'Atk', 'Def', 'Spe', 'SpA', 'SpD'
-        ], self.IVs))
-
         # Ribbons and obedience data not implemented
 
     def update_from_sub_data(self):
@@ -320,6 +408,8 @@ class Misc(UpdatableData):
 
 
 class DecryptedData(ABCPokemonSubData):
+    __slots__ = ("_data", "_pid", "_ot", "growth", "attacks", "_evs", "misc")
+
     def __init__(self, b: bytes, pid: int, ot_id: int, isBoxMon=False):
         self._data: bytes = b
 
@@ -328,7 +418,6 @@ class DecryptedData(ABCPokemonSubData):
         
         self._pid: int = pid
         self._ot: int = ot_id
-        self._decrypt_key = (pid ^ ot_id) & ((1 << 32) - 1)
 
         self.growth: Optional[Growth] = None
         self.attacks: Optional[Attacks] = None
@@ -398,12 +487,12 @@ class DecryptedData(ABCPokemonSubData):
         pass
 
     def update_from_sub_data(self):
-        self.data = (
-                self.growth.data +
-                self.attacks.data +
-                self._evs.data +
+        self.data = b''.join((
+                self.growth.data,
+                self.attacks.data,
+                self._evs.data,
                 self.misc.data
-        )
+        ))
         pass
 
     def update_from_data(self):
@@ -430,12 +519,31 @@ class DecryptedData(ABCPokemonSubData):
 
 
 class EncryptedData(ABCPokemonSubData):
-    def __init__(self, b: bytes, pid: int, ot_id: int):
+    __slots__ = (
+        "_data", "_pid", "_ot", "_decrypt_key",
+        "_growth_idx", "_attack_idx", "_evs_idx", "_misc_idx",
+        "_growth", "_attacks", "_evs", "_misc"
+    )
+
+    def __init__(self, b: bytes, pid: int, ot_id: int,
+                 decrypted: Optional[bytes] = None):
+        """
+        Parameters
+        ----------
+        b : bytes
+            Encrypted 48 bytes sub-data.
+        pid : int
+            Pokemon PID.
+        ot_id : int
+            Pokemon OT full ID (secret and public).
+        decrypted : Optional[bytes]
+            ``b`` already decrypted, in growth, attacks, EVs and misc order.
+            If given, blocks are built from it instead of decrypting ``b``.
+        """
         self._data = b
         self._pid = pid
         self._ot = ot_id
         self._decrypt_key = (pid ^ ot_id) & ((1 << 32) - 1)
-        self._sub_order = SUBSTRUCTURE_ORDER[pid % 24].upper()
 
         # Initialize attributes.
         self._growth_idx: int = -1
@@ -449,7 +557,12 @@ class EncryptedData(ABCPokemonSubData):
         # self._decrypted_data: bytes = bytes([0x00]*len(b))
 
         # Fill attributes.
-        self.update_from_data()
+        if decrypted is None:
+            self.update_from_data()
+            pass
+        else:
+            self._set_decrypted(decrypted)
+            pass
         pass
 
     @property
@@ -502,44 +615,18 @@ class EncryptedData(ABCPokemonSubData):
         d[self._evs_idx * 12:(self._evs_idx + 1) * 12] = self._evs.data
         d[self._misc_idx * 12:(self._misc_idx + 1) * 12] = self._misc.data
 
-        # Encrypt with key.
-        for i in range(0, 12):
-            d[i * 4:(i + 1) * 4] = (
-                    int.from_bytes(
-                        d[i * 4:(i + 1) * 4],
-                        'little'
-                    ) ^ self._decrypt_key
-            ).to_bytes(4, 'little')
-            pass
-
-        # Set bytes.
-        self.data = bytes(d)
+        # Encrypt with key, all 12 words at once.
+        self.data = xor_sub_data(d, self._decrypt_key)
         self.update_from_data()
         pass
 
     def update_from_data(self):
-        data_decrypted: bytes = bytes()
-
         # ONLY FOR ENCRYPTED!!
-        for i in range(0, 12):
-            data_decrypted = data_decrypted + (
-                    int.from_bytes(
-                        self._data[i * 4:i * 4 + 4],
-                        'little'
-                    ) ^ self._decrypt_key
-            ).to_bytes(4, 'little')
-            pass
+        data_decrypted: bytes = xor_sub_data(self._data, self._decrypt_key)
 
         # Substructure indices and data blocks.
-        self._growth_idx = self._sub_order.find("G")
-        self._attack_idx = self._sub_order.find("A")
-        self._evs_idx = self._sub_order.find("E")
-        self._misc_idx = self._sub_order.find("M")
-
-        assert (self._growth_idx < 4)
-        assert (self._attack_idx < 4)
-        assert (self._evs_idx < 4)
-        assert (self._misc_idx < 4)
+        self._growth_idx, self._attack_idx, self._evs_idx, self._misc_idx = \
+            block_indices(self._pid)
 
         self._growth = Growth(
             data_decrypted[self._growth_idx * 12:(self._growth_idx + 1) * 12]
@@ -555,14 +642,24 @@ class EncryptedData(ABCPokemonSubData):
         )
         pass
 
+    def _set_decrypted(self, d: bytes):
+        # Blocks from decrypted data, in growth, attacks, EVs and misc order.
+        self._growth_idx, self._attack_idx, self._evs_idx, self._misc_idx = \
+            block_indices(self._pid)
+        self._growth = Growth(d[0:12])
+        self._attacks = Attacks(d[12:24])
+        self._evs = EVs(d[24:36])
+        self._misc = Misc(d[36:48])
+        pass
+
     def to_decrypted(self) -> DecryptedData:
         return DecryptedData(
-            (
-                    self._growth.data +
-                    self._attacks.data +
-                    self._evs.data +
+            b''.join((
+                    self._growth.data,
+                    self._attacks.data,
+                    self._evs.data,
                     self._misc.data
-            ),
+            )),
             self._pid,
             self._ot
         )
@@ -594,71 +691,101 @@ class EncryptedData(ABCPokemonSubData):
 
 
 class Pokemon(ABCPokemon):
-    def __init__(self, b: bytes, gt: GameType):
-        # Initialize attributes.
-        self.pid: int = -1
-        self.trainer_id: int = -1
-        self.ot: int = -1
-        self.sot: int = -1
-        self.ot_name: str = ""
-        self.nickname: str = ""
-        self.level: int = -1
-        self.language: Optional[str] = None
-        self.is_egg: Optional[bool] = None
-        self.status: str = ""
-        self.current_hp: int = -1
-        self.hp: int = -1
-        self.attack: int = -1
-        self.defense: int = -1
-        self.speed: int = -1
-        self.special_attack: int = -1
-        self.special_defense: int = -1
-        self.sub_data_encrypted: Optional[EncryptedData] = None
-        self.sub_data_decrypted: Optional[DecryptedData] = None
-        self.sub_data: Optional[ABCPokemonSubData] = None
-
-        # Fill attributes: self.data assignment triggers this.
+    __slots__ = (
+        "_owner", "_data", "gt", "_record",
+        # Lazily decoded fields, see ``lazy_property``.
+        "_pid", "_trainer_id", "_ot", "_sot", "_ot_name", "_nickname",
+        "_level", "_language", "_is_egg", "_status", "_current_hp", "_hp",
+        "_attack", "_defense", "_speed", "_special_attack",
+        "_special_defense", "_sub_data", "_sub_data_decrypted",
+        "_sub_data_encrypted"
+    )
+
+    def __init__(self, b: bytes, gt: GameType, owner=None, record=None):
+        """Team Pokemon, 100 bytes long.
+
+        Fields are decoded from the data on first access.
+
+        Parameters
+        ----------
+        b : bytes
+            Pokemon data. If it is a writable ``memoryview`` window into a
+            savegame buffer, edits are written in place.
+        gt : GameType
+            Savegame type.
+        owner : Optional[Section]
+            Section containing the Pokemon window, flagged as changed on
+            in-place edits.
+        record : Optional[DecodedRecord]
+            Decoded record of ``b`` (see ``record_cache``). Fields, sub-data
+            and checksum verdict already decoded from identical Pokemon are
+            reused, and the ones decoded from now on are shared.
+        """
+        self._owner = owner
+        # Decoded record shared with identical Pokemon, see ``record_cache``.
+        self._record = None
+
+        # Fill attributes.
         self.gt = gt
-        self.data = b
+        self._set_data(b, record)
         pass
 
     def update_from_data(self):
-        # PID
-        self.pid = int.from_bytes(self.data[0:4], 'little')
+        # Fields are decoded again on next access.
+        _clear_lazy(self)
+        self._record = None
+        pass
+
+    @lazy_property
+    def pid(self) -> int:
+        return int.from_bytes(self.data[0:4], 'little')
 
+    @lazy_property
+    def trainer_id(self) -> int:
         # OT and SOT
-        self.trainer_id = int.from_bytes(self.data[4:8], 'little')
-        self.ot = self.trainer_id & ((1 << 16) - 1)
-        self.sot = (self.trainer_id >> 16) & ((1 << 16) - 1)
+        return int.from_bytes(self.data[4:8], 'little')
+
+    @lazy_property
+    def ot(self) -> int:
+        return self.trainer_id & ((1 << 16) - 1)
+
+    @lazy_property
+    def sot(self) -> int:
+        return (self.trainer_id >> 16) & ((1 << 16) - 1)
 
-        # Nickname
-        self.nickname = self.bin2char3(self.data[8:18])
+    @shared_lazy_property
+    def nickname(self) -> str:
+        if self.is_egg:
+            return "EGG"
+        return self.bin2char3(self.data[8:18])
 
-        # Level
-        self.level = self.data[84]
+    @lazy_property
+    def level(self) -> int:
+        return self.data[84]
 
+    @shared_lazy_property
+    def language(self) -> Optional[str]:
         # Game Language and IS/IS NOT egg.
         language = int.from_bytes(self.data[18:20], byteorder='little')
         if language == 0x0601:
-            self.nickname = "EGG"
-            language = "Game language"
-            is_egg = True
-            pass
+            return "Game language"
+        return self.LANGUAGES.get(language)
+
+    @shared_lazy_property
+    def is_egg(self) -> Optional[bool]:
+        language = int.from_bytes(self.data[18:20], byteorder='little')
+        if language == 0x0601:
+            return True
         elif language in self.LANGUAGES.keys():
-            language = self.LANGUAGES[language]
-            is_egg = False
-            pass
-        else:
-            language = None
-            is_egg = None
-            pass
-        self.language = language
-        self.is_egg = is_egg
+            return False
+        return None
 
-        # OT name
-        self.ot_name = self.bin2char3(self.data[20:27])
+    @shared_lazy_property
+    def ot_name(self) -> str:
+        return self.bin2char3(self.data[20:27])
 
-        # Status
+    @shared_lazy_property
+    def status(self) -> str:
         status = int.from_bytes(self.data[80:84], 'little')
         if status == 0:
             status = "OK"
@@ -679,37 +806,84 @@ class Pokemon(ABCPokemon):
         elif status & (1 << 7) != 0:
             status = "Bad Poison"
             pass
-        self.status = status
-
-        # Stats
-        self.current_hp = int.from_bytes(self.data[86:88], 'little')
-        self.hp = int.from_bytes(self.data[88:90], 'little')
-        self.attack = int.from_bytes(self.data[90:92], 'little')
-        self.defense = int.from_bytes(self.data[92:94], 'little')
-        self.speed = int.from_bytes(self.data[94:96], 'little')
-        self.special_attack = int.from_bytes(self.data[96:98], 'little')
-        self.special_defense = int.from_bytes(self.data[98:100], 'little')
-
-        # data block.
+        return status
+
+    # Stats
+    @lazy_property
+    def current_hp(self) -> int:
+        return int.from_bytes(self.data[86:88], 'little')
+
+    @lazy_property
+    def hp(self) -> int:
+        return int.from_bytes(self.data[88:90], 'little')
+
+    @lazy_property
+    def attack(self) -> int:
+        return int.from_bytes(self.data[90:92], 'little')
+
+    @lazy_property
+    def defense(self) -> int:
+        return int.from_bytes(self.data[92:94], 'little')
+
+    @lazy_property
+    def speed(self) -> int:
+        return int.from_bytes(self.data[94:96], 'little')
+
+    @lazy_property
+    def special_attack(self) -> int:
+        return int.from_bytes(self.data[96:98], 'little')
+
+    @lazy_property
+    def special_defense(self) -> int:
+        return int.from_bytes(self.data[98:100], 'little')
+
+    # data block.
+    @lazy_property
+    def sub_data(self) -> ABCPokemonSubData:
+        record = _live_record(self)
+        if record is None or record.sub_data is None:
+            sub_data = self._decode_sub_data()
+            if record is not None:
+                record.sub_data = bytes(
+                    sub_data.data if isinstance(sub_data, DecryptedData)
+                    else sub_data.to_decrypted().data
+                )
+                pass
+            return sub_data
+
+        # Blocks built from the sub-data decrypted by an identical Pokemon.
         if self.gt == GameType(GameType.RR):
-            self.sub_data = DecryptedData(
-                self.data[32:32 + 48],
-                self.pid,
-                self.trainer_id
-            )
-            self.sub_data_decrypted = self.sub_data
-            self.sub_data_encrypted = self.sub_data.to_encrypted()
-            pass
-        else:
-            self.sub_data = EncryptedData(
+            return DecryptedData(record.sub_data, self.pid, self.trainer_id)
+        return EncryptedData(
+            self.data[32:32 + 48],
+            self.pid,
+            self.trainer_id,
+            decrypted=record.sub_data
+        )
+
+    @profiling.phase("pokemon_decode", counter="pokemon_decoded")
+    def _decode_sub_data(self) -> ABCPokemonSubData:
+        if self.gt == GameType(GameType.RR):
+            return DecryptedData(
                 self.data[32:32 + 48],
                 self.pid,
                 self.trainer_id
             )
-            self.sub_data_decrypted = self.sub_data.to_decrypted()
-            self.sub_data_encrypted = self.sub_data
-            pass
-        pass
+        return EncryptedData(
+            self.data[32:32 + 48],
+            self.pid,
+            self.trainer_id
+        )
+
+    @lazy_property
+    def sub_data_decrypted(self) -> DecryptedData:
+        if isinstance(self.sub_data, DecryptedData):
+            return self.sub_data
+        return self.sub_data.to_decrypted()
+
+    @lazy_property
+    def sub_data_encrypted(self) -> EncryptedData:
+        return self.sub_data.to_encrypted()
 
     def __str__(self) -> str:
         msg = "{}:\n".format(self.nickname)
@@ -746,6 +920,10 @@ class Pokemon(ABCPokemon):
 
     @data.setter
     def data(self, val: bytes):
+        self._set_data(val)
+        pass
+
+    def _set_data(self, val: bytes, record=None):
         if len(val) != 100:
             raise InvalidSizeException(
                 "Invalid Pokemon data size: '{0}' != 100.".format(
@@ -756,7 +934,10 @@ class Pokemon(ABCPokemon):
 
         self._data = val
         self.update_from_data()
-        if not self.check() and self.gt == GameType(GameType.FR):
+        if record is not None:
+            record.attach(self)
+            pass
+        if self.gt == GameType(GameType.FR) and not self.check():
             raise ChecksumException(
                 "Pokemon checksum is invalid."
             )
@@ -765,21 +946,43 @@ class Pokemon(ABCPokemon):
     def update_from_sub_data(self):
         assert (self.sub_data is not None)
         checksum = self.sub_data.get_checksum()
-        d = bytearray(self.data)
         if self.gt == GameType(GameType.RR):
-            d[32:32 + 48] = self.sub_data_decrypted.data
+            sub_data = self.sub_data_decrypted.data
             pass
         else:
-            d[32:32 + 48] = self.sub_data_encrypted.data
+            sub_data = self.sub_data_encrypted.data
+            pass
+
+        if isinstance(self._data, memoryview) and not self._data.readonly:
+            # Write in place into the savegame buffer.
+            self._data[32:32 + 48] = sub_data
+            self._data[28:28 + 2] = checksum
+            self.data = self._data
+            if self._owner is not None:
+                self._owner.mark_dirty()
+                pass
+            pass
+        else:
+            d = bytearray(self.data)
+            d[32:32 + 48] = sub_data
+            d[28:28 + 2] = checksum
+            self.data = bytes(d)
+            profiling.count("bytes_copied", 2 * len(d))
             pass
-        d[28:28 + 2] = checksum
-        self.data = bytes(d)
         pass
 
     def check(self) -> bool:
+        record = _live_record(self)
+        if record is not None and record.valid is not None:
+            # Verified on an identical Pokemon.
+            return record.valid
         actual_checksum = self.data[28:28+2]
         calculated = self.sub_data.get_checksum()
-        return actual_checksum == calculated
+        is_valid = actual_checksum == calculated
+        if record is not None:
+            record.valid = is_valid
+            pass
+        return is_valid
 
     def set_species(self, no: int):
         self.sub_data.species = no
@@ -809,18 +1012,27 @@ class Pokemon(ABCPokemon):
         if isinstance(self.sub_data, EncryptedData):
             return self.data
         else:
-            encrypted_pkm: Pokemon = Pokemon(self.data, self.gt)
-            encrypted_pkm.encrypt()
-            return encrypted_pkm.data
+            # Checksum is computed over the decrypted data, keep it.
+            d = bytearray(self.data)
+            d[32:32 + 48] = encrypt_sub_data(
+                self.sub_data_decrypted.data,
+                self.pid,
+                self.trainer_id
+            )
+            return bytes(d)
         pass
 
     def get_decrypted(self) -> bytes:
         if isinstance(self.sub_data, DecryptedData):
             return self.data
         elif isinstance(self.sub_data, EncryptedData):
-            decrypted_pkm: Pokemon = Pokemon(self.data, self.gt)
-            decrypted_pkm.decrypt()
-            return decrypted_pkm.data
+            d = bytearray(self.data)
+            d[32:32 + 48] = decrypt_sub_data(
+                self.sub_data_encrypted.data,
+                self.pid,
+                self.trainer_id
+            )
+            return bytes(d)
         else:
             raise NotImplemented
         pass
@@ -829,44 +1041,113 @@ class Pokemon(ABCPokemon):
 
 
 class BoxPokemon(ABCPokemon):
-    def __init__(self, data, gt: Optional[GameType] = GameType.RR):
+    __slots__ = (
+        "_data", "_storage", "_slot", "_record",
+        # Lazily decoded fields, see ``lazy_property``.
+        "_sub_data", "_nickname", "_lang", "_misc_flags", "_ot_name",
+        "_markings"
+    )
+
+    def __init__(self, data, gt: Optional[GameType] = GameType.RR,
+                 storage=None, slot: Optional[int] = None):
+        """PC box Pokemon, 58 bytes long.
+
+        Fields are decoded from the data on first access.
+
+        Parameters
+        ----------
+        data : bytes
+            Box Pokemon data.
+        gt : GameType
+            Savegame type, only Radical Red is supported.
+        storage : Optional[PCStorage]
+            PC storage columns, if stored in the PC.
+        slot : Optional[int]
+            Slot index within ``storage``.
+        """
         if gt != GameType.RR:
             print(gt)
             raise NotImplementedError
         
         self._data = data
-        self.sub_data: Optional[ABCPokemonSubData] = None
+        # PC storage columns and slot index, if stored in the PC.
+        self._storage = storage
+        self._slot = slot
+        # Decoded record shared with identical Pokemon, see ``record_cache``.
+        self._record = None
 
         self.update_from_data()
 
-        self.sub_data_decrypted = self.sub_data
-
     def update_from_data(self):
-        self.sub_data = DecryptedData(self.data, -1, -1, True)
-        self.sub_data._pid = int.from_bytes(self._data[:0x4], 'little') # self.personality_value = self._data[:0x4]
-        self.sub_data._ot = int.from_bytes(self._data[0x4:0x8], 'little') # self.ot_id = self._data[0x4:0x8]
-
-        nickname = self._data[0x8:0x12]
-        self.nickname = Gen3Charset.bin2char3(nickname)
+        # Fields are decoded again on next access.
+        _clear_lazy(self)
+        self._record = None
 
-        self.lang = self._data[0x12]
-        self.misc_flags = self._data[0x13]
-        ot_name = self._data[0x14:0x1B]
-        self.ot_name = Gen3Charset.bin2char3(ot_name)
-        self.markings = self._data[0x1B]
+    @lazy_property
+    @profiling.phase("pokemon_decode", counter="pokemon_decoded")
+    def sub_data(self) -> "DecryptedData":
+        sub_data = DecryptedData(self.data, -1, -1, True)
+        sub_data._pid = int.from_bytes(self._data[:0x4], 'little') # self.personality_value = self._data[:0x4]
+        sub_data._ot = int.from_bytes(self._data[0x4:0x8], 'little') # self.ot_id = self._data[0x4:0x8]
 
         substruct_data = self._data[0x1C:]
-        self.sub_data.growth = Growth(substruct_data[:10])
-        self.sub_data.attacks = Attacks(substruct_data[11:16], isBoxMon=True)
-        self.sub_data._evs = EVs(substruct_data[16:22])
-        self.sub_data.misc = Misc(substruct_data[22:30])
-        
+        sub_data.growth = Growth(substruct_data[:10])
+        sub_data.attacks = Attacks(substruct_data[11:16], isBoxMon=True)
+        sub_data._evs = EVs(substruct_data[16:22])
+        sub_data.misc = Misc(substruct_data[22:30])
+        return sub_data
+
+    @property
+    def sub_data_decrypted(self) -> "DecryptedData":
+        return self.sub_data
+
+    @shared_lazy_property
+    def nickname(self) -> str:
+        return Gen3Charset.bin2char3(self._data[0x8:0x12])
+
+    @lazy_property
+    def lang(self) -> int:
+        return self._data[0x12]
+
+    @lazy_property
+    def misc_flags(self) -> int:
+        return self._data[0x13]
+
+    @shared_lazy_property
+    def ot_name(self) -> str:
+        return Gen3Charset.bin2char3(self._data[0x14:0x1B])
+
+    @lazy_property
+    def markings(self) -> int:
+        return self._data[0x1B]
 
     def check(self):
         raise NotImplementedError
     
     def update_from_sub_data(self):
         self.update_from_data()
+
+    @property
+    def species(self) -> int:
+        if self._storage is not None:
+            return self._storage.species[self._slot]
+        return self.sub_data.growth.species
+
+    @property
+    def pid(self) -> int:
+        if self._storage is not None:
+            return self._storage.pid[self._slot]
+        return self.sub_data._pid
+
+    @property
+    def moves(self) -> list[int]:
+        if self._storage is not None:
+            return self._storage.slot_moves(self._slot)
+        return list(self.sub_data.attacks.moves)
+
+    @property
+    def is_empty(self) -> bool:
+        return self.species == 0
     
     @property
     def data(self):
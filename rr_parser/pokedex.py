@@ -1,19 +1,174 @@
 from .abstracts import Pokedex as ABCPokedex
 from .enums import GameType
-from typing import Optional
+from typing import Iterable, Iterator, Optional, Union
+
+# Pokedex entries, as a single entry number or a collection of them.
+Entries = Union[int, Iterable[int]]
+
+
+class DexBitset:
+    """Mutable bitset of Pokedex entries.
+
+    Entry ``n`` (1 or higher) is bit ``(n - 1) % 8`` of byte ``(n - 1) // 8``,
+    as stored in the savegame. Entries are set and cleared in place, one at
+    a time or in bulk, and bitsets of the same length support set algebra
+    (``|``, ``&``, ``-``, ``^``), e.g. for comparing two savegames.
+
+    Attributes
+    ----------
+    data : bytearray
+        Serialized bitset.
+    """
+    __slots__ = ("data",)
+
+    def __init__(self, data: bytes):
+        self.data: bytearray = bytearray(data)
+        pass
+
+    @property
+    def size(self) -> int:
+        """Number of entries that fit in the bitset."""
+        return len(self.data) * 8
+
+    def _check(self, entry: int):
+        assert (0 < entry <= self.size)
+        pass
+
+    def _as_int(self) -> int:
+        return int.from_bytes(self.data, 'little')
+
+    def _from_int(self, value: int):
+        self.data[:] = value.to_bytes(len(self.data), 'little')
+        pass
+
+    def _range_mask(self, entries: range) -> Optional[int]:
+        # Contiguous ranges are set and cleared with a single mask.
+        if entries.step != 1 or len(entries) == 0:
+            return None
+        self._check(entries.start)
+        self._check(entries[-1])
+        return ((1 << len(entries)) - 1) << (entries.start - 1)
+
+    def __contains__(self, entry: int) -> bool:
+        if not 0 < entry <= self.size:
+            return False
+        x = entry - 1
+        return bool(self.data[x >> 3] & (1 << (x & 7)))
+
+    def add(self, entries: Entries):
+        """Set one or many entries."""
+        if isinstance(entries, int):
+            entries = (entries,)
+            pass
+        elif isinstance(entries, range):
+            mask = self._range_mask(entries)
+            if mask is not None:
+                self._from_int(self._as_int() | mask)
+                return
+            pass
+        data = self.data
+        for entry in entries:
+            self._check(entry)
+            x = entry - 1
+            data[x >> 3] |= 1 << (x & 7)
+            pass
+        pass
+
+    def discard(self, entries: Entries):
+        """Clear one or many entries."""
+        if isinstance(entries, int):
+            entries = (entries,)
+            pass
+        elif isinstance(entries, range):
+            mask = self._range_mask(entries)
+            if mask is not None:
+                self._from_int(self._as_int() & ~mask)
+                return
+            pass
+        data = self.data
+        for entry in entries:
+            self._check(entry)
+            x = entry - 1
+            data[x >> 3] &= ~(1 << (x & 7)) & 0xFF
+            pass
+        pass
+
+    def fill(self):
+        """Set every entry."""
+        self.data[:] = bytes([0xFF] * len(self.data))
+        pass
+
+    def clear(self):
+        """Clear every entry."""
+        self.data[:] = bytes(len(self.data))
+        pass
+
+    def count(self) -> int:
+        """Number of entries set (popcount)."""
+        return bin(self._as_int()).count("1")
+
+    def __len__(self) -> int:
+        return self.count()
+
+    def __iter__(self) -> Iterator[int]:
+        """Set entries, in increasing order."""
+        for i, byte in enumerate(self.data):
+            while byte:
+                low = byte & -byte
+                yield (i << 3) + low.bit_length()
+                byte ^= low
+                pass
+            pass
+        pass
+
+    def __bytes__(self) -> bytes:
+        return bytes(self.data)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, DexBitset):
+            return self.data == other.data
+        return NotImplemented
+
+    def _combine(self, other: "DexBitset", op) -> "DexBitset":
+        if not isinstance(other, DexBitset):
+            return NotImplemented
+        assert (len(self.data) == len(other.data))
+        result = DexBitset(bytes(len(self.data)))
+        result._from_int(op(self._as_int(), other._as_int()))
+        return result
+
+    def __or__(self, other: "DexBitset") -> "DexBitset":
+        return self._combine(other, lambda a, b: a | b)
+
+    def __and__(self, other: "DexBitset") -> "DexBitset":
+        return self._combine(other, lambda a, b: a & b)
+
+    def __sub__(self, other: "DexBitset") -> "DexBitset":
+        return self._combine(other, lambda a, b: a & ~b)
+
+    def __xor__(self, other: "DexBitset") -> "DexBitset":
+        return self._combine(other, lambda a, b: a ^ b)
+
+    def __repr__(self) -> str:
+        return "DexBitset({} / {})".format(self.count(), self.size)
+
+    pass
 
 
 class Pokedex(ABCPokedex):
     """Pokedex class.
 
+    Entries are edited on ``seen`` and ``caught`` bitsets, and written back
+    into the savegame by ``GameSave.update_pokedex``.
+
     Attributes
     ----------
     gen : GameType
         Game type, defines which bytes contain Pokedex entries.
-    seen : Optional[bytes]
-        Serialized bytes with seen Pokemon.
-    caught : Optional[bytes]
-        Serialized bytes with caught Pokemon.
+    seen : Optional[DexBitset]
+        Seen Pokemon.
+    caught : Optional[DexBitset]
+        Caught Pokemon.
     dex_length_bytes : int
         Allocated space in bytes for Pokedex entries.
     """
@@ -28,8 +183,8 @@ class Pokedex(ABCPokedex):
             Savegame class instance.
         """
         self.gen: GameType = gen
-        self.seen: Optional[bytes] = None
-        self.caught: Optional[bytes] = None
+        self.seen: Optional[DexBitset] = None
+        self.caught: Optional[DexBitset] = None
         self.dex_length_bytes: int = 0
 
         self.update_from_data(game_save)
@@ -46,12 +201,12 @@ class Pokedex(ABCPokedex):
             raise NotImplemented
 
         if self.gen == GameType(GameType.FR):
-            self.seen = game_save.sections[0].section[0x005C:0x005C+49]
-            self.caught = game_save.sections[0].section[0x0028:0x0028+49]
+            self.seen = DexBitset(game_save.sections[0].data[0x005C:0x005C+49])
+            self.caught = DexBitset(game_save.sections[0].data[0x0028:0x0028+49])
             pass
         elif self.gen == GameType(GameType.RR):
-            self.seen = game_save.sections[1].section[0x0310:0x0310 + 125]
-            self.caught = game_save.sections[1].section[0x038D:0x038D + 125]
+            self.seen = DexBitset(game_save.sections[1].data[0x0310:0x0310 + 125])
+            self.caught = DexBitset(game_save.sections[1].data[0x038D:0x038D + 125])
             pass
         else:
             raise NotImplemented
@@ -59,61 +214,72 @@ class Pokedex(ABCPokedex):
 
     @property
     def data_seen(self) -> bytes:
-        return self.seen
+        return bytes(self.seen)
 
     @data_seen.setter
     def data_seen(self, val: bytes):
         assert len(val) == self.pokedex_size_bytes
-        self.seen = val
+        self.seen.data[:] = val
         pass
 
     @property
     def data_caught(self) -> bytes:
-        return self.caught
+        return bytes(self.caught)
 
     @data_caught.setter
     def data_caught(self, val: bytes):
         assert len(val) == self.pokedex_size_bytes
-        self.caught = val
+        self.caught.data[:] = val
         pass
 
     @property
     def pokedex_size_bytes(self) -> int:
         return self.dex_length_bytes
 
-    def set_seen(self, species: int):
-        assert (0 < species <= self.pokedex_size_bytes * 8)
-        temp = bytearray(self.seen)
-        x = species - 1
-        temp[x >> 3] = temp[x >> 3] | (1 << (x % 8))
-        self.data_seen = bytes(temp)
+    @property
+    def num_seen(self) -> int:
+        return self.seen.count()
+
+    @property
+    def num_caught(self) -> int:
+        return self.caught.count()
+
+    def set_seen(self, species: Entries):
+        """Mark one or many Pokemon species as seen.
+
+        Parameters
+        ----------
+        species : Union[int, Iterable[int]]
+            Pokedex entry number, or entry numbers (e.g. a ``range``, set in
+            a single operation).
+        """
+        self.seen.add(species)
         pass
 
-    def set_caught(self, species: int):
-        self.set_seen(species)
-        temp = bytearray(self.caught)
-        x = species - 1
-        temp[x >> 3] = temp[x >> 3] | (1 << (x % 8))
-        self.data_caught = bytes(temp)
+    def set_caught(self, species: Entries):
+        """Mark one or many Pokemon species as seen and caught."""
+        if not isinstance(species, (int, range)):
+            species = list(species)
+            pass
+        self.seen.add(species)
+        self.caught.add(species)
         pass
 
-    def unset_seen(self, species: int):
-        self.unset_caught(species)
-        temp = bytearray(self.seen)
-        x = species - 1
-        temp[x >> 3] = temp[x >> 3] & (~(1 << (x % 8))) & ((1 << 8) - 1)
-        self.data_seen = bytes(temp)
+    def unset_seen(self, species: Entries):
+        """Mark one or many Pokemon species as unseen (and uncaught)."""
+        if not isinstance(species, (int, range)):
+            species = list(species)
+            pass
+        self.caught.discard(species)
+        self.seen.discard(species)
         pass
 
-    def unset_caught(self, species: int):
-        assert (0 < species <= self.pokedex_size_bytes * 8)
-        temp = bytearray(self.caught)
-        x = species - 1
-        temp[x >> 3] = temp[x >> 3] & (~(1 << (x % 8))) & ((1 << 8) - 1)
-        self.data_caught = bytes(temp)
+    def unset_caught(self, species: Entries):
+        """Mark one or many Pokemon species as uncaught."""
+        self.caught.discard(species)
         pass
 
     pass
 
 
-__all__ = ["Pokedex"]
+__all__ = ["Pokedex", "DexBitset"]
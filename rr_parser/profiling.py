@@ -0,0 +1,220 @@
+"""Opt-in instrumentation of the savegame hot paths.
+
+Within a ``profile`` block, parsing, validating and editing savegames
+record counters (checksums computed, sections rebuilt, Pokemon decoded,
+strings decoded, bytes copied) and per-phase wall-clock timers (parse, PC
+decoding, checksums, charset decoding, re-serialization...). Phase timings
+are inclusive: a phase includes the phases it runs, e.g. ``parse``
+includes ``pc_decode``.
+
+Outside of a ``profile`` block, instrumented code only checks that
+``active`` is None.
+
+Usage::
+
+    import rr_parser
+
+    with rr_parser.profile() as report:
+        g = rr_parser.load_radical_red_game("rr.sav")
+        pass
+    print(report)
+"""
+from contextlib import contextmanager
+from functools import wraps
+from typing import Callable, Iterator, Optional
+import time
+
+# Recorder of the innermost ``profile`` block, None if profiling is off.
+active: Optional["Recorder"] = None
+
+
+class PhaseTiming:
+    """Calls and inclusive wall-clock time of a phase, in seconds."""
+    __slots__ = ("calls", "seconds")
+
+    def __init__(self, calls: int = 0, seconds: float = 0.0):
+        self.calls = calls
+        self.seconds = seconds
+        pass
+
+    def to_json(self) -> dict:
+        return {"calls": self.calls, "seconds": self.seconds}
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, PhaseTiming):
+            return NotImplemented
+        return (self.calls, self.seconds) == (other.calls, other.seconds)
+
+    def __repr__(self) -> str:
+        return "PhaseTiming(calls={!r}, seconds={!r})".format(
+            self.calls, self.seconds
+        )
+    pass
+
+
+class ProfileReport:
+    """Counters and phase timings recorded within a ``profile`` block.
+
+    Attributes
+    ----------
+    elapsed : float
+        Wall-clock duration of the block, in seconds.
+    counters : dict[str, int]
+        Counter values, by name.
+    phases : dict[str, PhaseTiming]
+        Calls and inclusive wall-clock time, by phase.
+    """
+    # Plain slots classes: dataclasses would slow down every import of the
+    # package, profiled or not.
+    __slots__ = ("elapsed", "counters", "phases")
+
+    def __init__(self, elapsed: float = 0.0,
+                 counters: Optional[dict[str, int]] = None,
+                 phases: Optional[dict[str, PhaseTiming]] = None):
+        self.elapsed = elapsed
+        self.counters = dict() if counters is None else counters
+        self.phases = dict() if phases is None else phases
+        pass
+
+    def to_json(self) -> dict:
+        return {
+            "elapsed": self.elapsed,
+            "counters": dict(self.counters),
+            "phases": {name: t.to_json() for name, t in self.phases.items()}
+        }
+
+    def __repr__(self) -> str:
+        return "ProfileReport(elapsed={!r}, counters={!r}, phases={!r})" \
+            .format(self.elapsed, self.counters, self.phases)
+
+    def __str__(self) -> str:
+        lines = ["{:<24}{:>10}{:>12}{:>8}".format(
+            "phase", "calls", "ms", "%"
+        )]
+        for name, t in sorted(self.phases.items(),
+                              key=lambda kv: -kv[1].seconds):
+            lines.append("{:<24}{:>10}{:>12.3f}{:>8.1f}".format(
+                name, t.calls, t.seconds * 1e3,
+                100 * t.seconds / self.elapsed if self.elapsed else 0.0
+            ))
+            pass
+        lines.append("{:<24}{:>10}".format("counter", "value"))
+        for name, value in sorted(self.counters.items()):
+            lines.append("{:<24}{:>10}".format(name, value))
+            pass
+        lines.append("{:<24}{:>22.3f}".format("elapsed (ms)",
+                                              self.elapsed * 1e3))
+        return "\n".join(lines)
+    pass
+
+
+class Recorder:
+    """Records events into a report, and into the reports of the
+    enclosing ``profile`` blocks."""
+    __slots__ = ("report", "parent", "_open")
+
+    def __init__(self, report: ProfileReport,
+                 parent: Optional["Recorder"] = None):
+        self.report = report
+        self.parent = parent
+        # Depth of every running phase, re-entered phases are timed once.
+        self._open: dict[str, int] = dict()
+        pass
+
+    def count(self, name: str, n: int = 1):
+        """Increase a counter."""
+        rec = self
+        while rec is not None:
+            counters = rec.report.counters
+            counters[name] = counters.get(name, 0) + n
+            rec = rec.parent
+            pass
+        pass
+
+    def timed(self, name: str, func: Callable, *args, **kwargs):
+        """Call ``func`` and time it as a phase."""
+        depth = self._open.get(name, 0)
+        self._open[name] = depth + 1
+        t0 = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - t0
+            self._open[name] = depth
+            rec = self
+            while rec is not None:
+                t = rec.report.phases.get(name)
+                if t is None:
+                    t = rec.report.phases[name] = PhaseTiming()
+                    pass
+                t.calls += 1
+                if depth == 0:
+                    t.seconds += elapsed
+                    pass
+                rec = rec.parent
+                pass
+            pass
+        pass
+
+    pass
+
+
+def count(name: str, n: int = 1):
+    """Increase a counter, if profiling."""
+    if active is not None:
+        active.count(name, n)
+        pass
+    pass
+
+
+def phase(name: str, counter: Optional[str] = None) -> Callable:
+    """Decorator timing every call of a function as a phase, if profiling.
+
+    Parameters
+    ----------
+    name : str
+        Phase name.
+    counter : Optional[str]
+        Counter increased on every call, if any.
+    """
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            rec = active
+            if rec is None:
+                return func(*args, **kwargs)
+            if counter is not None:
+                rec.count(counter)
+                pass
+            return rec.timed(name, func, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+@contextmanager
+def profile() -> Iterator[ProfileReport]:
+    """Record counters and phase timings of the savegame operations run
+    within the block.
+
+    Blocks can be nested, events are recorded into every enclosing block.
+
+    Returns
+    -------
+    Iterator[ProfileReport]
+        Report, filled in as operations run and complete on exit.
+    """
+    global active
+    report = ProfileReport()
+    parent = active
+    active = Recorder(report, parent)
+    t0 = time.perf_counter()
+    try:
+        yield report
+    finally:
+        report.elapsed = time.perf_counter() - t0
+        active = parent
+        pass
+    pass
+
+
+__all__ = ["profile", "ProfileReport", "PhaseTiming"]
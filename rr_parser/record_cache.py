@@ -0,0 +1,189 @@
+"""Decode-once cache of Pokemon records.
+
+Team and PC box Pokemon views are rebuilt whenever their section is parsed
+again, and successive saves of one run mostly hold the same Pokemon. The
+immutable fields decoded by any view (names, IDs, level, stats...) are kept
+in a bounded LRU cache keyed by the game type and raw record bytes, and
+views of identical records built later start with those fields already
+decoded.
+
+Decoded sub-data blocks are mutable, so they are never shared. The
+decrypted sub-data is kept instead, as immutable bytes, along with the
+record checksum verdict: views of identical records build their own blocks
+from that copy, and skip decryption, unshuffling and checksum verification.
+
+``RECORD_CACHE`` is shared by the whole process. Set its ``maxsize`` to 0
+to disable it, e.g. in tests counting decodes, and restore it afterwards.
+"""
+from collections import OrderedDict
+from typing import Optional
+
+from .enums import GameType
+
+
+class DecodedRecord:
+    """Fields decoded from a Pokemon record.
+
+    Attributes
+    ----------
+    key : tuple[GameType, bytes]
+        Game type and raw record bytes.
+    values : dict[str, object]
+        Decoded values, by ``lazy_property`` slot name.
+    sub_data : Optional[bytes]
+        Decrypted 48 bytes sub-data, in growth, attacks, EVs and misc order,
+        of team Pokemon. None until decoded.
+    valid : Optional[bool]
+        Whether the Pokemon checksum is valid, None until verified.
+    """
+    __slots__ = ("key", "values", "sub_data", "valid")
+
+    def __init__(self, key: tuple[GameType, bytes]):
+        self.key = key
+        self.values: dict[str, object] = dict()
+        self.sub_data: Optional[bytes] = None
+        self.valid: Optional[bool] = None
+        pass
+
+    def attach(self, pkm):
+        """Fill a Pokemon view with the fields already decoded, and share
+        the fields it decodes from now on."""
+        for slot, value in self.values.items():
+            setattr(pkm, slot, value)
+            pass
+        pkm._record = self
+        pass
+
+    pass
+
+
+class CacheStats:
+    """Cache statistics, ``hits`` and ``misses`` count lookups."""
+    __slots__ = ("hits", "misses", "evictions", "size", "maxsize")
+
+    def __init__(self, hits: int, misses: int, evictions: int, size: int,
+                 maxsize: int):
+        self.hits = hits
+        self.misses = misses
+        self.evictions = evictions
+        self.size = size
+        self.maxsize = maxsize
+        pass
+
+    def __repr__(self) -> str:
+        return "CacheStats(hits={}, misses={}, evictions={}, size={}, " \
+               "maxsize={})".format(self.hits, self.misses, self.evictions,
+                                    self.size, self.maxsize)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+    pass
+
+
+class RecordCache:
+    """Bounded LRU cache of decoded Pokemon records."""
+
+    def __init__(self, maxsize: int = 4096):
+        """
+        Parameters
+        ----------
+        maxsize : int
+            Maximum number of records. If 0, caching is disabled, it can
+            be changed at any time.
+        """
+        self._records: OrderedDict = OrderedDict()
+        self._maxsize: int = maxsize
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        pass
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, val: int):
+        assert (val >= 0)
+        self._maxsize = val
+        self._evict()
+        pass
+
+    def _evict(self):
+        while len(self._records) > self._maxsize:
+            self._records.popitem(last=False)
+            self.evictions += 1
+            pass
+        pass
+
+    def lookup(self, gt: GameType,
+               data: bytes) -> Optional[DecodedRecord]:
+        """Get the decoded record of some bytes, added if missing.
+
+        Parameters
+        ----------
+        gt : GameType
+            Savegame type.
+        data : bytes
+            Raw record, 100 (team) or 58 (PC box) bytes long.
+
+        Returns
+        -------
+        Optional[DecodedRecord]
+            Decoded record, None if caching is disabled.
+        """
+        if self._maxsize == 0:
+            return None
+        key = (gt, bytes(data))
+        record = self._records.get(key)
+        if record is not None:
+            self._records.move_to_end(key)
+            self.hits += 1
+            return record
+        self.misses += 1
+        record = self._records[key] = DecodedRecord(key)
+        self._evict()
+        return record
+
+    def attach(self, pkm, gt: GameType):
+        """Fill a Pokemon view with the fields already decoded from
+        identical records, and share the fields it decodes from now on.
+
+        Parameters
+        ----------
+        pkm : Union[Pokemon, BoxPokemon]
+            Freshly built Pokemon view.
+        gt : GameType
+            Savegame type.
+        """
+        record = self.lookup(gt, pkm.data)
+        if record is not None:
+            record.attach(pkm)
+            pass
+        pass
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            size=len(self._records),
+            maxsize=self._maxsize
+        )
+
+    def clear(self):
+        """Drop every record and reset statistics."""
+        self._records.clear()
+        self.hits = self.misses = self.evictions = 0
+        pass
+
+    pass
+
+
+# Cache shared by every team and PC box rebuild.
+RECORD_CACHE = RecordCache()
+
+
+__all__ = ["RecordCache", "DecodedRecord", "CacheStats", "RECORD_CACHE"]
@@ -1,10 +1,13 @@
 from typing import Optional, Union
 
+from . import profiling
 from .charsets import Gen3Charset
 from .pkms import Pokemon, BoxPokemon
 from .enums import GameType
 from .abstracts import Section as ABCSection, GameSave
 from .checksums import RRSectionChecksum, Gen3SectionChecksum
+from .pc_storage import PCStorage
+from .record_cache import RECORD_CACHE
 
 DATA_SIZES = [
         3884,  # 0, Trainer info.
@@ -28,11 +31,24 @@ FILE_SIGNATURE: bytes = 0x08012025.to_bytes(4, 'little')
 
 class Section(Gen3Charset, ABCSection):
 
-    def __init__(self, b: bytes, gt: GameType):
+    def __init__(self, b: memoryview, gt: GameType):
+        """Section over a 4096 bytes window of the savegame buffer.
+
+        Parameters
+        ----------
+        b : memoryview
+            Section window. Edits are written in place through it. Plain
+            bytes are copied into a private buffer.
+        gt : GameType
+            Savegame type.
+        """
         assert (len(b) == 4096)
+        if not isinstance(b, memoryview):
+            b = memoryview(bytearray(b))
+            pass
         self._gt = gt
-        self._section: bytes = b
-        self._data: bytes = bytes(3968)
+        self._section: memoryview = b
+        self._data: memoryview = b[0:3968]
         self._section_id: int = 0
         self._checksum: bytes = bytes(2)
         self._security: bytes = bytes(4)
@@ -42,17 +58,26 @@ class Section(Gen3Charset, ABCSection):
             Union[RRSectionChecksum, Gen3SectionChecksum]
         ] = None
 
+        # Whether section data changed since its checksum was last computed.
+        self._dirty: bool = True
+
+        # Validation result, until the section changes again.
+        self._valid: Optional[bool] = None
+
         self.update_from_data()
+
+        # Whether section bytes changed since loaded or last written back.
+        self._modified: bool = False
         pass
 
     def update_from_data(self):
+        profiling.count("sections_rebuilt")
         self._section_id: int = int.from_bytes(
             self._section[0x0FF4:0x0FF4 + 2],
             'little'
         )
-        self._data: bytes = self._section[0x0000:0x0000 + DATA_SIZES[self._section_id]]
-        self._checksum: bytes = self._section[0x0FF6:0x0FF6 + 2]
-        self._security: bytes = self._section[0x0FF8:0x0FF8 + 4]
+        self._checksum: bytes = bytes(self._section[0x0FF6:0x0FF6 + 2])
+        self._security: bytes = bytes(self._section[0x0FF8:0x0FF8 + 4])
         self._save_index: int = int.from_bytes(
             self._section[0x0FFC:0x0FFC + 4],
             'little'
@@ -60,8 +85,12 @@ class Section(Gen3Charset, ABCSection):
 
         if 0 <= self.section_id < 14:
             self._is_used = True
+            self._data: memoryview = self._section[
+                0x0000:0x0000 + DATA_SIZES[self._section_id]
+            ]
         else:
             self._is_used = False
+            self._data: memoryview = self._section[0x0000:0x0000 + 3968]
 
         if self._gt == GameType(GameType.RR):
             self._checksum_generator = RRSectionChecksum()
@@ -73,25 +102,27 @@ class Section(Gen3Charset, ABCSection):
             raise NotImplemented
             pass
 
-        self.update_checksum()
+        # Checksum is computed lazily, on serialization or validation.
+        self._dirty = True
+        self._valid = None
         pass
 
     @property
-    def section(self) -> bytes:
+    def section(self) -> memoryview:
+        self.update_checksum()
         return self._section
 
     @section.setter
     def section(self, val: bytes):
-        assert (isinstance(val, bytes))
         assert (len(val) == 4096)
-        self._section = val
-        self.update_checksum()
+        self._section[:] = val
+        self._modified = True
         self.update_security()
         self.update_from_data()
         pass
 
     @property
-    def data(self) -> bytes:
+    def data(self) -> memoryview:
         return self._data
 
     @property
@@ -104,6 +135,7 @@ class Section(Gen3Charset, ABCSection):
 
     @property
     def checksum(self) -> bytes:
+        self.update_checksum()
         return self._checksum
 
     @property
@@ -114,23 +146,58 @@ class Section(Gen3Charset, ABCSection):
     def is_used(self) -> bool:
         return self._is_used
 
+    @property
+    def is_dirty(self) -> bool:
+        """Whether section checksum is pending to be computed."""
+        return self._dirty
+
+    @property
+    def is_modified(self) -> bool:
+        """Whether section is pending to be written back to the file."""
+        return self._modified
+
+    def mark_dirty(self):
+        """Flag section data as changed so its checksum gets recomputed."""
+        self._dirty = True
+        self._modified = True
+        self._valid = None
+        pass
+
+    def clear_modified(self):
+        """Flag section as written back to the savegame file."""
+        self._modified = False
+        pass
+
     def update_checksum(self):
-        checksum: bytes = self.checksum_generator.get_checksum(
-            self.section,
-            self.section_id
-        )
-        new_section = bytearray(self.section)
-        new_section[0x0FF6:0x0FF6 + 2] = checksum
-        self._section = bytes(new_section)
+        if not self._dirty:
+            return
+        checksum: bytes = self._compute_checksum()
+        if self._section[0x0FF6:0x0FF6 + 2] != checksum and \
+                not self._section.readonly:
+            # Read-only sections keep their stored checksum, so that
+            # check_valid reports the mismatch.
+            self._section[0x0FF6:0x0FF6 + 2] = checksum
+            self._modified = True
+            pass
         self._checksum = checksum
+        self._dirty = False
         pass
 
+    @profiling.phase("checksum", counter="checksums")
+    def _compute_checksum(self) -> bytes:
+        return self.checksum_generator.get_checksum(
+            self._section,
+            self.section_id
+        )
+
     def update_security(self):
         if self._gt == GameType(GameType.RR):
             security: bytes = FILE_SIGNATURE
-            new_section = bytearray(self.section)
-            new_section[0x0FF8:0x0FF8 + 4] = security
-            self._section = bytes(new_section)
+            if self._section[0x0FF8:0x0FF8 + 4] != security:
+                self._section[0x0FF8:0x0FF8 + 4] = security
+                self._modified = True
+                self._valid = None
+                pass
             self._security = security
             pass
         pass
@@ -140,28 +207,27 @@ class Section(Gen3Charset, ABCSection):
         return self._save_index
 
     def update_from_sub_data(self):
-        data: bytes = self.data
-        junk_1: bytes = self.section[0x0000+3968:0x0000+3968+116]
-        checksum: bytes = self.checksum_generator.get_checksum(
-            self.section,
-            self.section_id
-        )
-        assert (len(checksum) == 2)
-
+        # Data sub-block is a window into the section, only the footer
+        # needs to be written. Checksum is filled in once serialized.
         security: bytes = self._security
         assert len(security) == 4
 
-        section_id: bytes = self.section_id.to_bytes(2, 'little')
-        save_index: bytes = self.save_index.to_bytes(4, 'little')
-
-        section = data + junk_1 + section_id + checksum + security + save_index
-
-        self.section = section
+        self._section[0x0FF4:0x0FF4 + 2] = self.section_id.to_bytes(
+            2, 'little'
+        )
+        self._section[0x0FF8:0x0FF8 + 4] = security
+        self._section[0x0FFC:0x0FFC + 4] = self.save_index.to_bytes(
+            4, 'little'
+        )
+        self.mark_dirty()
         pass
 
     def check_valid(self) -> bool:
         if not self.is_used:
             return True
+        if self._valid is not None and not self._dirty:
+            # Unchanged since last validated.
+            return self._valid
 
         is_valid = True
 
@@ -178,36 +244,39 @@ class Section(Gen3Charset, ABCSection):
             )
 
             is_valid = is_valid and self.security == FILE_SIGNATURE
-            is_valid = is_valid and self.section[
+            is_valid = is_valid and self._section[
                                     0x0FF8:0x0FF8 + 4
                                     ] == FILE_SIGNATURE
             pass
         else:
             raise NotImplemented
 
-        expected_checksum = self._checksum_generator.get_checksum(
-            self.section,
-            self.section_id
-        )
+        # Computed at most once per section change.
+        self.update_checksum()
         current_checksum = self._checksum
-        current_section_checksum: bytes = self.section[0x0FF6:0x0FF6 + 2]
-        is_valid = is_valid and current_checksum == expected_checksum
-        is_valid = is_valid and current_section_checksum == expected_checksum
+        current_section_checksum: bytes = self._section[0x0FF6:0x0FF6 + 2]
+        is_valid = is_valid and current_section_checksum == current_checksum
 
+        self._valid = is_valid
         return is_valid
     pass
 
 
 class TrainerInfo(Section):
-    def __init__(self, b: bytes, gt: GameType):
-        super().__init__(b, gt)
-
+    def __init__(self, b: memoryview, gt: GameType):
         self.player_name: str = ""
         self.player_gender: str = ""
         self.trainer_id: int = 0
         self.trainer_public_id: int = 0
         self.trainer_secret_id: int = 0
         self.played_time: tuple[int, int, int] = 0, 0, 0
+
+        # Fill attributes: parsed along with the section footer.
+        super().__init__(b, gt)
+        pass
+
+    def update_from_data(self):
+        super().update_from_data()
         if self.is_used:
             self._update_from_data()
             pass
@@ -231,12 +300,16 @@ class TrainerInfo(Section):
 
 
 class Team(Section):
-    def __init__(self, b: bytes, gt: GameType):
-        super().__init__(b, gt)
-
+    def __init__(self, b: memoryview, gt: GameType):
         self.team_size: int = 0
         self.team_pokemon_list: list[Pokemon] = list()
 
+        # Fill attributes: parsed along with the section footer.
+        super().__init__(b, gt)
+        pass
+
+    def update_from_data(self):
+        super().update_from_data()
         if self.is_used:
             self._update_from_data()
             pass
@@ -244,7 +317,7 @@ class Team(Section):
 
     def _update_from_data(self):
         self.team_size = int.from_bytes(
-            self.section[0x0034:0x0034 + 4],
+            self._section[0x0034:0x0034 + 4],
             'little'
         )
 
@@ -257,17 +330,22 @@ class Team(Section):
         self.team_pokemon_list = list()
         offset = 0
         for i in range(0, self.team_size):
-            self.team_pokemon_list.append(
-                Pokemon(
-                    self.section[0x0038 + offset:0x0038 + offset + 100],
-                    self._gt
-                )
+            window = self._section[0x0038 + offset:0x0038 + offset + 100]
+            # Looked up before building, so that Fire Red Pokemon already
+            # verified are not decrypted and checksummed again.
+            pkm = Pokemon(
+                window,
+                self._gt,
+                owner=self,
+                record=RECORD_CACHE.lookup(self._gt, window)
             )
+            self.team_pokemon_list.append(pkm)
             offset = offset + 100
             pass
         pass
 
-    def set_pokemon(self, pkm: "Pokemon", team_pos: int):
+    def set_pokemon(self, pkm: "Pokemon", team_pos: int,
+                    validate: bool = True):
         if not self.is_used:
             # Do nothing.
             print("W: Section is invalid, do not set pokemon.")
@@ -275,38 +353,33 @@ class Team(Section):
 
         if 0 <= team_pos < 6:
             if team_pos >= self.team_size:
-                self.team_pokemon_list.append(pkm)
                 p = self.team_size
+                team_size = self.team_size + 1
             else:
-                self.team_pokemon_list[team_pos] = pkm
                 p = team_pos
+                team_size = self.team_size
                 pass
 
-            # Get initial section data.
-            s = bytearray(self.section)
-
             # Assert pokemon length is valid.
             assert (len(pkm.data) == 100)
 
             # Override old team size with new addition (or substitution).
-            s[0x0034:0x0034+4] = (
-                len(self.team_pokemon_list)
-            ).to_bytes(4, 'little')
+            self._section[0x0034:0x0034+4] = team_size.to_bytes(4, 'little')
 
-            # Set the pokemon data.
-            s[0x0038+100*p:0x0038+100*p+100] = pkm.data
+            # Set the pokemon data, in place.
+            self._section[0x0038+100*p:0x0038+100*p+100] = pkm.data
+            profiling.count("bytes_copied", 100)
 
-            # Override old section data and update.
-            self.section = bytes(s)
+            # Update section.
             self.update_security()
-            self.update_checksum()
+            self.mark_dirty()
             self._update_from_data()
             pass
         else:
             print("W: p is not in [0,6), do not set pokemon.")
             pass
 
-        assert self.check_valid()
+        assert not validate or self.check_valid()
         pass
 
     pass
@@ -318,39 +391,68 @@ PKM_PER_BOX = 30
 
 class PC(Section):
     class Box():
-        def __init__(self, id, data, gt=GameType.RR):
+        def __init__(self, id, data, gt=GameType.RR,
+                     storage: Optional[PCStorage] = None):
             self.gt = gt
             self.id = id
             self.capacity = 30
             self.num_pkm = None
-            self.pokemon = [None for i in range(self.capacity)]
+            self._pokemon: list[Optional[BoxPokemon]] = [
+                None for i in range(self.capacity)
+            ]
             self._data = data
+            self._storage = storage
 
             self.update_from_data()
 
         def update_from_data(self):
-            for i in range(0,BYTES_PER_PKM * PKM_PER_BOX, BYTES_PER_PKM):
-                pkm_data = self._data[i:i+BYTES_PER_PKM]
-
-                self.pokemon[i//BYTES_PER_PKM] = BoxPokemon(pkm_data, self.gt)
+            # Box Pokemon are views built on first access, queries over the
+            # whole box go through the PC storage columns.
+            self._pokemon = [None for i in range(self.capacity)]
+            if self._storage is not None:
+                self.num_pkm = len(self._storage.occupied(self.id))
+
+        def pokemon_at(self, pos: int) -> BoxPokemon:
+            if self._pokemon[pos] is None:
+                i = pos * BYTES_PER_PKM
+                pkm = self._pokemon[pos] = BoxPokemon(
+                    self._data[i:i+BYTES_PER_PKM],
+                    self.gt,
+                    storage=self._storage,
+                    slot=None if self._storage is None else
+                    self._storage.slot_of(self.id, pos)
+                )
+                RECORD_CACHE.attach(pkm, self.gt)
+            return self._pokemon[pos]
 
+        @property
+        def pokemon(self) -> list[BoxPokemon]:
+            return [self.pokemon_at(i) for i in range(self.capacity)]
 
-            #self.num_pkm = sum(p.sub_data_decrypted.growth.species != 0 for p in self.pokemon)
-        
+    @profiling.phase("pc_decode")
     def update_from_data(self):
-        self._data = b''.join([self.game_save.sections[i]._data for i in range(5, 14)])
+        # PC buffers are split among sections 5 to 13, gather them once.
+        self._data = memoryview(b''.join([self.game_save.sections[i]._data for i in range(5, 14)]))
+        profiling.count("bytes_copied", len(self._data))
         
         assert(len(self._data) == 33744)
         
         self.current_pc_box = int.from_bytes(self.data[0:4], 'little')
-        self.box_names = [str(self._data[i:i+9]) for i in range(0x8344, 0x83C2, 9)]
+        self.box_names = [str(bytes(self._data[i:i+9])) for i in range(0x8344, 0x83C2, 9)]
         # self.box_wallpapers = [int(self._data[i]) for i in range(0x83C2, 0x83C2+14)]    
 
+        # Every box Pokemon slot, decoded once into columns.
+        self.storage = PCStorage(
+            self._data[0x4:0x4 + MAX_BOXES*PKM_PER_BOX*BYTES_PER_PKM],
+            MAX_BOXES*PKM_PER_BOX,
+            PKM_PER_BOX
+        )
+
         self.boxes = []
         for i in range(0x4, 0x8344, BYTES_PER_PKM*PKM_PER_BOX):
             box_data = self._data[i:i+BYTES_PER_PKM*PKM_PER_BOX]
             if(i//(BYTES_PER_PKM*PKM_PER_BOX) < MAX_BOXES):
-                self.boxes.append(self.Box(i//(BYTES_PER_PKM*PKM_PER_BOX), box_data, self.gt))
+                self.boxes.append(self.Box(i//(BYTES_PER_PKM*PKM_PER_BOX), box_data, self.gt, self.storage))
 
 
     def __init__(self, gt: GameType, game_save: GameSave):
@@ -359,6 +461,7 @@ class PC(Section):
         self.current_pc_box = None
         self.box_names = None
         self.box_wallpapers = None
+        self.storage: Optional[PCStorage] = None
         self.boxes = []
 
         self.update_from_data()
@@ -0,0 +1,396 @@
+"""Content-addressed store of savegame snapshots.
+
+Successive saves of one run mostly hold byte-identical sections. Every
+snapshot is split on the 4 KiB section boundaries, and each block is stored
+once, compressed and keyed by the SHA-256 of its contents. A snapshot is a
+manifest referencing its blocks, and is rebuilt on demand.
+
+The 12 bytes section footer (section ID, checksum, signature and save
+index) changes on every save, even if the section data does not, so it is
+kept in the manifest and only the data before it is deduplicated.
+
+Store layout::
+
+    STORE/objects/ab/abcdef...   zlib-compressed block data
+    STORE/manifests/0123...json  snapshot manifest, named by the SHA-256
+                                 of the whole savegame
+
+Usage::
+
+    python -m rr_parser.snapshots STORE put autosaves/*.sav [--game rr]
+    python -m rr_parser.snapshots STORE list [--player NAME]
+    python -m rr_parser.snapshots STORE get SNAPSHOT_ID out.sav
+    python -m rr_parser.snapshots STORE stats
+"""
+from collections import OrderedDict
+from dataclasses import dataclass, field, asdict
+from typing import Iterator, Optional, Union
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+import zlib
+
+from .batch import GAMES
+from .enums import GameType
+from .exceptions import ChecksumException, InvalidSizeException
+from .functions import SAVEGAME_SIZES
+from .games import Gen3
+
+# Savegames are split into blocks on the section boundaries.
+BLOCK_SIZE: int = 4096
+# Offset of the section footer, kept in the manifests.
+FOOTER_OFFSET: int = 0x0FF4
+
+
+@dataclass
+class SnapshotInfo:
+    """Snapshot manifest.
+
+    Attributes
+    ----------
+    id : str
+        SHA-256 of the savegame, in hexadecimal.
+    game : {'rr', 'fr'}
+        Savegame type.
+    size : int
+        Savegame size, in bytes.
+    player_name : str
+        Trainer name.
+    trainer_id : int
+        Trainer ID.
+    save_index : int
+        Save counter of the active game save.
+    played_time : tuple[int, int, int]
+        Hours, minutes and seconds played.
+    stored_at : float
+        Time the snapshot was stored, as a Unix timestamp.
+    blocks : list[tuple[str, str]]
+        Data digest and hexadecimal footer of every block.
+    """
+    id: str
+    game: str
+    size: int
+    player_name: str
+    trainer_id: int
+    save_index: int
+    played_time: tuple[int, int, int]
+    stored_at: float
+    blocks: list[tuple[str, str]] = field(default_factory=list, repr=False)
+
+    def to_json(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_json(cls, d: dict) -> "SnapshotInfo":
+        d = dict(d)
+        d["played_time"] = tuple(d["played_time"])
+        d["blocks"] = [tuple(block) for block in d["blocks"]]
+        return cls(**d)
+    pass
+
+
+@dataclass
+class StoreStats:
+    snapshots: int
+    objects: int
+    # Size of the snapshots as full savegames, and actually stored.
+    logical_bytes: int
+    stored_bytes: int
+
+    @property
+    def ratio(self) -> float:
+        return self.logical_bytes / self.stored_bytes \
+            if self.stored_bytes else 0.0
+    pass
+
+
+def _write_atomic(filename: str, data: bytes):
+    tmp = "{}.tmp{}".format(filename, os.getpid())
+    with open(tmp, "wb") as f:
+        f.write(data)
+        pass
+    os.replace(tmp, filename)
+    pass
+
+
+class SnapshotStore:
+    """Savegame snapshots, deduplicated by section."""
+
+    def __init__(self, root: str, cache_size: int = 256):
+        """
+        Parameters
+        ----------
+        root : str
+            Store directory, created if missing.
+        cache_size : int
+            Number of decompressed blocks kept in memory, so that rebuilding
+            neighbouring snapshots reads their shared blocks once.
+        """
+        self.root = root
+        self._objects_dir = os.path.join(root, "objects")
+        self._manifests_dir = os.path.join(root, "manifests")
+        os.makedirs(self._objects_dir, exist_ok=True)
+        os.makedirs(self._manifests_dir, exist_ok=True)
+        self._cache: OrderedDict = OrderedDict()
+        self._cache_size = cache_size
+        pass
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self._objects_dir, digest[:2], digest)
+
+    def _manifest_path(self, snapshot_id: str) -> str:
+        return os.path.join(self._manifests_dir, snapshot_id + ".json")
+
+    def _put_object(self, data: bytes) -> str:
+        digest = hashlib.sha256(data).hexdigest()
+        filename = self._object_path(digest)
+        if not os.path.exists(filename):
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+            _write_atomic(filename, zlib.compress(data))
+            pass
+        return digest
+
+    def _get_object(self, digest: str) -> bytes:
+        data = self._cache.get(digest)
+        if data is not None:
+            self._cache.move_to_end(digest)
+            return data
+        with open(self._object_path(digest), "rb") as f:
+            data = zlib.decompress(f.read())
+            pass
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise ChecksumException(
+                "Snapshot block '{}' is corrupt.".format(digest)
+            )
+        self._cache[digest] = data
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+            pass
+        return data
+
+    def put(self, save: Union[Gen3, bytes, str],
+            game: str = "rr") -> SnapshotInfo:
+        """Add a savegame snapshot, if not stored yet.
+
+        Parameters
+        ----------
+        save : Union[Gen3, bytes, str]
+            Savegame, its bytes or its path.
+        game : {'rr', 'fr'}
+            Savegame type, if not given a ``Gen3`` savegame.
+
+        Returns
+        -------
+        SnapshotInfo
+            Snapshot manifest.
+
+        Raises
+        ------
+        InvalidSizeException
+            If savegame size is not 128 KiB.
+        """
+        if isinstance(save, Gen3):
+            g = save
+            # Fill in pending checksums, as saved.
+            for game_save in (g.game_save_a, g.game_save_b):
+                for sec in game_save.sections.values():
+                    sec.update_checksum()
+                    pass
+                pass
+            assert g.check_valid()
+            data = bytes(g.data)
+            game = "rr" if g.gt == GameType(GameType.RR) else "fr"
+            pass
+        else:
+            if isinstance(save, str):
+                with open(save, "rb") as f:
+                    save = f.read()
+                    pass
+                pass
+            data = bytes(save)
+            if len(data) not in SAVEGAME_SIZES:
+                raise InvalidSizeException("Savegame size is not 128 KiB.")
+            g = GAMES[game](data)
+            pass
+
+        snapshot_id = hashlib.sha256(data).hexdigest()
+        if snapshot_id in self:
+            return self.get_info(snapshot_id)
+
+        blocks = list()
+        for offset in range(0, len(data), BLOCK_SIZE):
+            block = data[offset:offset + BLOCK_SIZE]
+            blocks.append((
+                self._put_object(block[:FOOTER_OFFSET]),
+                block[FOOTER_OFFSET:].hex()
+            ))
+            pass
+        trainer_info = g.game_save.trainer_info
+        info = SnapshotInfo(
+            id=snapshot_id,
+            game=game,
+            size=len(data),
+            player_name=trainer_info.player_name,
+            trainer_id=trainer_info.trainer_id,
+            save_index=g.game_save.sections[0].save_index,
+            played_time=tuple(trainer_info.played_time),
+            stored_at=time.time(),
+            blocks=blocks
+        )
+        # Manifest is written last, once every block is stored.
+        _write_atomic(self._manifest_path(snapshot_id),
+                      json.dumps(info.to_json()).encode())
+        return info
+
+    def get_info(self, snapshot_id: str) -> SnapshotInfo:
+        """Snapshot manifest.
+
+        Raises
+        ------
+        KeyError
+            If there is no such snapshot.
+        """
+        try:
+            with open(self._manifest_path(snapshot_id), "rb") as f:
+                return SnapshotInfo.from_json(json.load(f))
+        except FileNotFoundError:
+            raise KeyError(snapshot_id) from None
+
+    def get(self, snapshot_id: str) -> bytes:
+        """Rebuild a savegame snapshot.
+
+        Raises
+        ------
+        KeyError
+            If there is no such snapshot.
+        ChecksumException
+            If the rebuilt savegame does not match the snapshot.
+        """
+        info = self.get_info(snapshot_id)
+        data = b"".join(
+            self._get_object(digest) + bytes.fromhex(footer)
+            for digest, footer in info.blocks
+        )
+        if hashlib.sha256(data).hexdigest() != snapshot_id:
+            raise ChecksumException(
+                "Snapshot '{}' is corrupt.".format(snapshot_id)
+            )
+        return data
+
+    def load(self, snapshot_id: str) -> Gen3:
+        """Rebuild and parse a savegame snapshot."""
+        info = self.get_info(snapshot_id)
+        return GAMES[info.game](self.get(snapshot_id))
+
+    def snapshots(self, player_name: Optional[str] = None,
+                  trainer_id: Optional[int] = None) -> list[SnapshotInfo]:
+        """Stored snapshots, oldest save first.
+
+        Parameters
+        ----------
+        player_name : Optional[str]
+            Only snapshots of this trainer name, if given.
+        trainer_id : Optional[int]
+            Only snapshots of this trainer ID, if given.
+        """
+        infos = [
+            info for info in map(self.get_info, self)
+            if (player_name is None or info.player_name == player_name) and
+            (trainer_id is None or info.trainer_id == trainer_id)
+        ]
+        return sorted(infos, key=lambda info: (info.save_index,
+                                               info.stored_at))
+
+    def stats(self) -> StoreStats:
+        objects = 0
+        stored = 0
+        for dirpath, _, filenames in os.walk(self._objects_dir):
+            for filename in filenames:
+                objects += 1
+                stored += os.path.getsize(os.path.join(dirpath, filename))
+                pass
+            pass
+        logical = 0
+        for snapshot_id in self:
+            logical += self.get_info(snapshot_id).size
+            stored += os.path.getsize(self._manifest_path(snapshot_id))
+            pass
+        return StoreStats(
+            snapshots=len(self),
+            objects=objects,
+            logical_bytes=logical,
+            stored_bytes=stored
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        for filename in sorted(os.listdir(self._manifests_dir)):
+            if filename.endswith(".json"):
+                yield filename[:-len(".json")]
+                pass
+            pass
+        pass
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, snapshot_id: str) -> bool:
+        return os.path.exists(self._manifest_path(snapshot_id))
+
+    pass
+
+
+def main(argv: Optional[list[str]] = None):
+    parser = argparse.ArgumentParser(
+        description="Content-addressed store of savegame snapshots."
+    )
+    parser.add_argument('store', type=str, help="Store directory.")
+    commands = parser.add_subparsers(dest='command', required=True)
+    put = commands.add_parser('put', help="Add savegame snapshots.")
+    put.add_argument('savs', nargs='+', type=str)
+    put.add_argument('--game', type=str, choices=list(GAMES), default='rr')
+    ls = commands.add_parser('list', help="List snapshots, oldest first.")
+    ls.add_argument('--player', type=str, default=None)
+    get = commands.add_parser('get', help="Rebuild a savegame snapshot.")
+    get.add_argument('snapshot_id', type=str)
+    get.add_argument('output', type=str)
+    commands.add_parser('stats', help="Show storage statistics.")
+    args = parser.parse_args(argv)
+
+    store = SnapshotStore(args.store)
+    if args.command == 'put':
+        for filename in args.savs:
+            info = store.put(filename, args.game)
+            print("{}  {}".format(info.id, filename))
+            pass
+        pass
+    elif args.command == 'list':
+        for info in store.snapshots(player_name=args.player):
+            print("{}  {:<8} {:0>5}  save {:<6} {}:{:0>2}:{:0>2}".format(
+                info.id, info.player_name, info.trainer_id,
+                info.save_index, *info.played_time
+            ))
+            pass
+        pass
+    elif args.command == 'get':
+        with open(args.output, "wb") as f:
+            f.write(store.get(args.snapshot_id))
+            pass
+        pass
+    else:
+        stats = store.stats()
+        print("{} snapshots, {} blocks, {} bytes stored for {} bytes "
+              "({:.1f}x)".format(stats.snapshots, stats.objects,
+                                 stats.stored_bytes, stats.logical_bytes,
+                                 stats.ratio))
+        pass
+    return 0
+
+
+__all__ = ["SnapshotStore", "SnapshotInfo", "StoreStats"]
+
+
+if __name__ == '__main__':
+    sys.exit(main())
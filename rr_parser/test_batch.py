@@ -0,0 +1,96 @@
+import multiprocessing
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from . import batch
+from .batch import scan_saves, ScanResult
+
+RR_SAV = "rr.sav"
+
+
+def _scan_or_crash(filename: str, game: str = "rr",
+                   boxes: bool = True) -> ScanResult:
+    # Kills the worker process on 'crash.sav'.
+    if os.path.basename(filename) == "crash.sav":
+        os._exit(1)
+        pass
+    return ScanResult(filename=filename, ok=True)
+
+
+@unittest.skipUnless(os.path.exists(RR_SAV), "Missing Radical Red savegame.")
+class BatchTestCase(unittest.TestCase):
+    def test_scan_saves(self):
+        """Test that corrupt savegames do not stop the batch scan."""
+        with tempfile.TemporaryDirectory() as tmp:
+            shutil.copy(RR_SAV, os.path.join(tmp, "a.sav"))
+            os.makedirs(os.path.join(tmp, "sub"))
+            shutil.copy(RR_SAV, os.path.join(tmp, "sub", "b.sav"))
+            with open(os.path.join(tmp, "sub", "bad.sav"), "wb") as f:
+                f.write(bytes(1000))
+                pass
+
+            for workers in (0, 2):
+                results = {
+                    os.path.basename(r.filename): r
+                    for r in scan_saves(tmp, workers=workers, chunk_size=1)
+                }
+                self.assertEqual(set(results), {"a.sav", "b.sav", "bad.sav"})
+                self.assertFalse(results["bad.sav"].ok)
+                for name in ("a.sav", "b.sav"):
+                    self.assertTrue(results[name].ok, results[name].error)
+                    self.assertTrue(results[name].valid)
+                    self.assertEqual(len(results[name].boxes), 18)
+                    pass
+                self.assertEqual(
+                    results["a.sav"].to_json(),
+                    dict(results["b.sav"].to_json(),
+                         filename=results["a.sav"].filename)
+                )
+                pass
+            pass
+        pass
+
+    pass
+
+
+@unittest.skipUnless(multiprocessing.get_start_method() == "fork",
+                     "Workers do not inherit the patched scanner.")
+class BrokenPoolTestCase(unittest.TestCase):
+    def test_worker_crash(self):
+        """Test that a dying worker only fails its own chunk."""
+        names = ["a.sav", "b.sav", "c.sav", "crash.sav",
+                 "d.sav", "e.sav", "f.sav", "g.sav"]
+        with tempfile.TemporaryDirectory() as tmp:
+            for name in names:
+                open(os.path.join(tmp, name), "wb").close()
+                pass
+            with mock.patch.object(batch, "scan_save", _scan_or_crash):
+                for workers in (1, 2):
+                    results = {
+                        os.path.basename(r.filename): r
+                        for r in scan_saves(tmp, workers=workers,
+                                            chunk_size=1)
+                    }
+                    self.assertEqual(set(results), set(names))
+                    self.assertFalse(results["crash.sav"].ok)
+                    self.assertIn("BrokenProcessPool",
+                                  results["crash.sav"].error)
+                    for name in names:
+                        if name != "crash.sav":
+                            self.assertTrue(results[name].ok,
+                                            results[name].error)
+                            pass
+                        pass
+                    pass
+                pass
+            pass
+        pass
+
+    pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import random
+import unittest
+
+from .charsets import Gen3Charset, INTER_CHARSET, INTER_CHARSET_INV, \
+    TERMINATOR
+
+
+class CharsetTestCase(unittest.TestCase):
+    def test_round_trip(self):
+        """Test that encoding then decoding random strings is lossless."""
+        rnd = random.Random(0)
+        chars = list(INTER_CHARSET_INV)
+        for _ in range(2000):
+            s = ''.join(rnd.choice(chars) for _ in range(rnd.randint(2, 10)))
+            b = Gen3Charset.ascii2bin(s)
+            self.assertEqual(len(b), len(s))
+            self.assertEqual(Gen3Charset.bin2char3(b), s)
+            self.assertEqual(
+                Gen3Charset.bin2char3(b + bytes([TERMINATOR]) + b), s
+            )
+            pass
+        pass
+
+    def test_decode(self):
+        """Test that every byte decodes as the reference table does, and
+        that bytes decode back to themselves."""
+        rnd = random.Random(1)
+        for i in range(256):
+            self.assertEqual(Gen3Charset.bin2char3(i),
+                             INTER_CHARSET.get(i, " "))
+            pass
+        codes = list(INTER_CHARSET)
+        for _ in range(2000):
+            b = bytes(rnd.choice(codes) for _ in range(rnd.randint(2, 10)))
+            self.assertEqual(
+                Gen3Charset.ascii2bin(Gen3Charset.bin2char3(b)), b
+            )
+            pass
+        # Unknown characters encode as 0x00.
+        self.assertEqual(Gen3Charset.ascii2bin("A@B"), b"\xbb\x00\xbc")
+        self.assertEqual(Gen3Charset.ascii2bin("A"), 0xBB)
+        pass
+
+    def test_decode_many(self):
+        """Test that bulk decoding matches decoding one string at a time."""
+        rnd = random.Random(2)
+        stride, offset, length, count = 58, 8, 10, 540
+        data = bytes(rnd.randrange(256) for _ in range(stride * count))
+        self.assertEqual(
+            Gen3Charset.decode_many(data, count, length, stride, offset),
+            [
+                Gen3Charset.bin2char3(
+                    data[i * stride + offset:i * stride + offset + length]
+                )
+                for i in range(count)
+            ]
+        )
+        self.assertEqual(Gen3Charset.decode_many(data, 0, length, stride), [])
+        pass
+
+    pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,21 @@
 import os
+import random
 import unittest
 
 from rr_parser import FireRed
-from .checksums import Gen3SectionChecksum
+from . import checksums
+from .checksums import Gen3SectionChecksum, RRSectionChecksum, \
+    DATA_SIZES, RR_DATA_SIZES
+
+
+def _reference_checksum(section_data: bytes, data_size: int) -> bytes:
+    # Word by word sum, as done by the games.
+    checksum = 0
+    for i in range(0, data_size >> 2):
+        checksum += int.from_bytes(section_data[i * 4:(i + 1) * 4], 'little')
+        pass
+    checksum = ((checksum >> 16) + checksum) & ((1 << 16) - 1)
+    return checksum.to_bytes(2, 'little')
 
 
 class ChecksumTestCase(unittest.TestCase):
@@ -77,6 +90,45 @@ class ChecksumTestCase(unittest.TestCase):
             pass
         pass
 
+    def test_checksum_backends(self):
+        """Test every checksum backend against the word by word sum."""
+
+        rng = random.Random(0x08012025)
+        sections = [rng.randbytes(4096) for _ in range(0, 8)]
+        sections.append(bytes([0xFF] * 4096))
+        sections.append(bytearray(4096))
+
+        default_backend = checksums.CHECKSUM_BACKEND
+        try:
+            for name in checksums.CHECKSUM_BACKENDS:
+                checksums.set_checksum_backend(name)
+                for section in sections:
+                    for section_id in range(0, 14):
+                        self.assertEqual(
+                            Gen3SectionChecksum.get_checksum(
+                                section, section_id
+                            ),
+                            _reference_checksum(
+                                section, DATA_SIZES[section_id]
+                            ),
+                            name
+                        )
+                        self.assertEqual(
+                            RRSectionChecksum.get_checksum(
+                                memoryview(section), section_id
+                            ),
+                            _reference_checksum(
+                                section, RR_DATA_SIZES[section_id]
+                            ),
+                            name
+                        )
+                        pass
+                    pass
+                pass
+        finally:
+            checksums.set_checksum_backend(default_backend)
+        pass
+
     pass
 
 
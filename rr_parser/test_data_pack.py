@@ -0,0 +1,75 @@
+import os
+import tempfile
+import unittest
+
+from .constants.rr import _learnset, _pps
+from .constants.rr.data_pack import DataPack, build_data_pack
+from .constants.rr import species_registry
+from .constants.rr.species_registry import tables_registry
+
+SPECIES_IDS, SPECIES_NAMES, POKEDEX_IDS, SPECIES_POKEDEX_IDS = \
+    tables_registry()
+
+
+class DataPackTestCase(unittest.TestCase):
+    def _check(self, pack: DataPack):
+        for species_id, moves in _learnset.gLevelUpLearnsets.items():
+            self.assertEqual(pack.learnset(species_id), list(moves))
+            pass
+        for move_id, pp in _pps.gBattleMoves.items():
+            self.assertEqual(pack.move_pp(move_id), pp)
+            pass
+        for species_id, name in SPECIES_NAMES.items():
+            self.assertEqual(pack.species_name(species_id), name)
+            self.assertEqual(
+                pack.species_dex(species_id),
+                SPECIES_POKEDEX_IDS[species_id]
+            )
+            pass
+        for name, species_id in SPECIES_IDS.items():
+            self.assertEqual(pack.species_id(name), species_id)
+            pass
+        for name, dex in POKEDEX_IDS.items():
+            self.assertEqual(pack.pokedex_id(name), dex)
+            pass
+        self.assertIsNone(pack.learnset(-1))
+        self.assertIsNone(pack.species_name(-1))
+        pass
+
+    def test_build_data_pack(self):
+        """Test a freshly built data pack against the Python tables."""
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "data_pack.bin")
+            build_data_pack(filename)
+            pack = DataPack(filename)
+            try:
+                self._check(pack)
+            finally:
+                pack.close()
+            pass
+        pass
+
+    def test_registry(self):
+        """Test the registry read from the data pack against the Python
+        tables."""
+        self.assertEqual(species_registry.SPECIES_IDS, SPECIES_IDS)
+        self.assertEqual(species_registry.SPECIES_NAMES, SPECIES_NAMES)
+        self.assertEqual(species_registry.POKEDEX_IDS, POKEDEX_IDS)
+        self.assertEqual(species_registry.SPECIES_POKEDEX_IDS,
+                         SPECIES_POKEDEX_IDS)
+        pass
+
+    def test_bundled_data_pack(self):
+        """Test the bundled data pack is up to date."""
+        pack = DataPack()
+        try:
+            self._check(pack)
+        finally:
+            pack.close()
+        pass
+
+    pass
+
+
+if __name__ == '__main__':
+    unittest.main()
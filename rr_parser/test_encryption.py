@@ -0,0 +1,91 @@
+import random
+import unittest
+
+from .checksums import Gen3PokemonChecksum
+from .encryption import SUBSTRUCTURE_ORDER, xor_sub_data, encrypt_sub_data, \
+    decrypt_sub_data, encrypt_sub_data_many, decrypt_sub_data_many
+from .enums import GameType
+from .pkms import Pokemon
+
+
+def _reference_decrypt(data: bytes, pid: int, ot_id: int) -> bytes:
+    # Word by word decryption, as done by the games.
+    key = (pid ^ ot_id) & ((1 << 32) - 1)
+    plain = b''.join(
+        (int.from_bytes(data[i * 4:(i + 1) * 4], 'little') ^ key).to_bytes(
+            4, 'little'
+        )
+        for i in range(0, 12)
+    )
+    order = SUBSTRUCTURE_ORDER[pid % 24]
+    return b''.join(
+        plain[order.find(block) * 12:(order.find(block) + 1) * 12]
+        for block in "GAEM"
+    )
+
+
+class EncryptionTestCase(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(0x08012025)
+        self.blocks = [
+            (rng.randbytes(48), rng.getrandbits(32), rng.getrandbits(32))
+            for _ in range(0, 200)
+        ]
+        pass
+
+    def test_decrypt_sub_data(self):
+        """Test whole block decryption against word by word decryption."""
+        for data, pid, ot_id in self.blocks:
+            self.assertEqual(
+                decrypt_sub_data(data, pid, ot_id),
+                _reference_decrypt(data, pid, ot_id)
+            )
+            self.assertEqual(
+                encrypt_sub_data(decrypt_sub_data(data, pid, ot_id), pid,
+                                 ot_id),
+                data
+            )
+            self.assertEqual(
+                xor_sub_data(xor_sub_data(data, pid), pid),
+                data
+            )
+            pass
+        pass
+
+    def test_batch_sub_data(self):
+        """Test batch encryption and decryption against single blocks."""
+        data = b''.join(d for d, _, _ in self.blocks)
+        pids = [pid for _, pid, _ in self.blocks]
+        ot_ids = [ot_id for _, _, ot_id in self.blocks]
+        decrypted = decrypt_sub_data_many(data, pids, ot_ids)
+        self.assertEqual(
+            decrypted,
+            [decrypt_sub_data(*block) for block in self.blocks]
+        )
+        self.assertEqual(
+            encrypt_sub_data_many(b''.join(decrypted), pids, ot_ids),
+            data
+        )
+        pass
+
+    def test_get_encrypted(self):
+        """Test an encrypted Radical Red Pokemon is a valid FireRed one."""
+        for data, pid, ot_id in self.blocks[:20]:
+            d = bytearray(100)
+            d[0:4] = pid.to_bytes(4, 'little')
+            d[4:8] = ot_id.to_bytes(4, 'little')
+            d[28:30] = Gen3PokemonChecksum.get_checksum(data)
+            d[32:80] = data
+            pkm = Pokemon(bytes(d), GameType(GameType.RR))
+            encrypted = Pokemon(pkm.get_encrypted(), GameType(GameType.FR))
+            self.assertTrue(encrypted.check())
+            self.assertEqual(encrypted.sub_data_decrypted.data, data)
+            self.assertEqual(encrypted.get_decrypted(), bytes(d))
+            pass
+        pass
+
+    pass
+
+
+if __name__ == '__main__':
+    unittest.main()
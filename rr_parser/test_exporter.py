@@ -0,0 +1,111 @@
+import csv
+import io
+import json
+import os
+import socket
+import threading
+import unittest
+
+from .constants.rr.species_registry import SPECIES_IDS
+from .exporter import export_sets, iter_sets, set_to_text, SetFormat, \
+    _species_info
+from .functions import load_radical_red_game
+
+RR_SAV = "rr.sav"
+
+
+class SpeciesInfoTestCase(unittest.TestCase):
+    def test_abilities(self):
+        """Test that species missing from the dex constants get abilities."""
+        for const, ability in (("KILOWATTRELL", "Wind Power"),
+                               ("TAPU_KOKO", "Electric Surge"),
+                               ("NIDORAN_F", "Poison Touch"),
+                               ("DEOXYS", "Pressure"),
+                               ("PUMPKABOO_XL", "Pickup"),
+                               ("CHARIZARD_MEGA_Y", "Drought")):
+            info = _species_info(SPECIES_IDS[const])
+            self.assertIsNotNone(info.abilities, const)
+            self.assertEqual(info.abilities[0], ability)
+            pass
+        pass
+
+    pass
+
+
+@unittest.skipUnless(os.path.exists(RR_SAV), "Missing Radical Red savegame.")
+class ExporterTestCase(unittest.TestCase):
+    def test_formats(self):
+        """Test that every format exports the same sets, in order."""
+        g = load_radical_red_game(RR_SAV)
+        sets = list(iter_sets(g, level=50))
+        team_size = g.game_save.team.team_size
+        self.assertEqual(
+            len(sets), team_size + len(g.game_save.pc.storage.occupied())
+        )
+        self.assertTrue(all(s.box is None for s in sets[:team_size]))
+        self.assertTrue(all(s.level == 50 for s in sets[team_size:]))
+
+        out = io.StringIO()
+        self.assertEqual(export_sets(g, out, "showdown", level=50), len(sets))
+        self.assertEqual(
+            out.getvalue(), ''.join(set_to_text(s) + '\n\n' for s in sets)
+        )
+
+        out = io.StringIO()
+        export_sets(g, out, "jsonl", level=50)
+        rows = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual(rows, [s.to_json() for s in sets])
+
+        out = io.StringIO()
+        export_sets(g, out, "csv", level=50)
+        rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+        self.assertEqual([r["species"] for r in rows],
+                         [s.species for s in sets])
+        self.assertEqual([r["move1"] for r in rows],
+                         [s.moves[0] if s.moves else '' for s in sets])
+        pass
+
+    def test_box_level(self):
+        """Test that box exports need a fixed level."""
+        g = load_radical_red_game(RR_SAV)
+        out = io.StringIO()
+        with self.assertRaises(ValueError):
+            export_sets(g, out, "csv")
+        self.assertEqual(out.getvalue(), '')
+        self.assertEqual(export_sets(g, out, "csv", box_range=(0, 0)),
+                         g.game_save.team.team_size)
+        with self.assertRaises(TypeError):
+            SetFormat()
+        pass
+
+    def test_stream(self):
+        """Test that many savegames are streamed, and sent to a socket."""
+        sets = iter_sets([RR_SAV] * 1000, box_range=(0, 0))
+        self.assertEqual(next(sets).source, RR_SAV)
+
+        server = socket.create_server(("127.0.0.1", 0))
+        port = server.getsockname()[1]
+        received = list()
+
+        def _serve():
+            conn, _ = server.accept()
+            with conn, conn.makefile('r', encoding='utf-8') as f:
+                received.extend(f.read().splitlines())
+                pass
+            pass
+
+        thread = threading.Thread(target=_serve)
+        thread.start()
+        n = export_sets([RR_SAV, RR_SAV], f"tcp://127.0.0.1:{port}", "jsonl",
+                        level=50)
+        thread.join()
+        server.close()
+        self.assertEqual(len(received), n)
+        self.assertEqual(received[:n // 2], received[n // 2:])
+        pass
+
+    pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+import os
+import unittest
+
+from .enums import PokedexEntryState
+from .exceptions import ChecksumException
+from .functions import load_radical_red_game, set_pokedex_entry, \
+    set_money, clone_first_team_pkm
+
+RR_SAV = "rr.sav"
+
+
+@unittest.skipUnless(os.path.exists(RR_SAV), "Missing Radical Red savegame.")
+class GameSaveTestCase(unittest.TestCase):
+    def test_update_section(self):
+        """Test that a section edit only re-parses the views built from it."""
+        game_save = load_radical_red_game(RR_SAV).game_save
+        pc = game_save.pc
+        boxes = pc.boxes
+        trainer_info = game_save.trainer_info
+
+        # Mark the first Pokedex entry as caught, straight in the section.
+        team = game_save.team
+        team.data[0x038D] |= 1
+        team.data[0x0310] |= 1
+        game_save.update_section(1)
+
+        self.assertEqual(game_save.pokedex.data_caught[0] & 1, 1)
+        self.assertEqual(game_save.pokedex.data_seen[0] & 1, 1)
+        self.assertIs(game_save.pc, pc)
+        self.assertIs(pc.boxes, boxes)
+        self.assertIs(game_save.trainer_info, trainer_info)
+        self.assertTrue(team.is_dirty)
+        self.assertTrue(game_save.check_valid())
+        self.assertFalse(team.is_dirty)
+
+        # PC buffer edits re-parse the PC.
+        game_save.update_section(5)
+        self.assertIsNot(pc.boxes, boxes)
+        pass
+
+    def test_bulk_pokedex_edits(self):
+        """Test that many Pokedex edits leave a valid savegame."""
+        g = load_radical_red_game(RR_SAV)
+        for species in range(1, 401):
+            set_pokedex_entry(g, species,
+                              PokedexEntryState(PokedexEntryState.CAUGHT))
+            pass
+        self.assertTrue(g.check_valid())
+
+        reloaded = type(g)(bytes(g.data))
+        self.assertTrue(reloaded.check_valid())
+        self.assertEqual(reloaded.game_save.pokedex.data_caught[:50],
+                         bytes([0xFF] * 50))
+        pass
+
+    def test_batch(self):
+        """Test that batch edits are serialized once, on commit."""
+        g = load_radical_red_game(RR_SAV)
+        team = g.game_save.team
+        with g.batch():
+            for species in range(1, 401):
+                set_pokedex_entry(g, species,
+                                  PokedexEntryState(PokedexEntryState.CAUGHT))
+                pass
+            set_money(g, 123456)
+            # Pokedex write back and checksums are deferred.
+            self.assertNotEqual(bytes(team.data[0x038D:0x038D + 50]),
+                                bytes([0xFF] * 50))
+            self.assertTrue(team.is_dirty)
+            pass
+        self.assertFalse(g.in_batch)
+        self.assertFalse(team.is_dirty)
+        self.assertTrue(g.check_valid())
+
+        reloaded = type(g)(bytes(g.data))
+        self.assertEqual(reloaded.game_save.pokedex.data_caught[:50],
+                         bytes([0xFF] * 50))
+        self.assertEqual(
+            int.from_bytes(reloaded.game_save.team.data[0x0290:0x0294],
+                           'little'),
+            123456
+        )
+        pass
+
+    def test_batch_rollback(self):
+        """Test that a failing batch rolls back every edit."""
+        g = load_radical_red_game(RR_SAV)
+        original = bytes(g.data)
+        caught = bytes(g.game_save.pokedex.data_caught)
+        team_size = g.game_save.team.team_size
+        with self.assertRaises(RuntimeError):
+            with g.batch():
+                set_pokedex_entry(g, 1,
+                                  PokedexEntryState(PokedexEntryState.UNSEEN))
+                set_money(g, 1)
+                clone_first_team_pkm(g)
+                raise RuntimeError
+            pass
+        self.assertFalse(g.in_batch)
+        self.assertEqual(bytes(g.data), original)
+        self.assertEqual(g.game_save.pokedex.data_caught, caught)
+        self.assertEqual(g.game_save.team.team_size, team_size)
+        self.assertEqual(g.game_save.modified_sections(), [])
+        self.assertTrue(g.check_valid())
+        pass
+
+    def test_batch_invalid(self):
+        """Test that a savegame invalid on batch exit raises a checksum
+        error, and is rolled back."""
+        g = load_radical_red_game(RR_SAV)
+        original = bytes(g.data)
+        with self.assertRaises(ChecksumException):
+            with g.batch():
+                set_money(g, 1)
+                team = g.game_save.team
+                team._section[0x0FF8] ^= 0xFF
+                team.mark_dirty()
+                pass
+            pass
+        self.assertFalse(g.in_batch)
+        self.assertEqual(bytes(g.data), original)
+        self.assertTrue(g.check_valid())
+        pass
+
+    pass
+
+
+if __name__ == '__main__':
+    unittest.main()
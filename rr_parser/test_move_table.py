@@ -0,0 +1,21 @@
+import unittest
+
+from .constants.rr._moves import MOVE_HIGHJUMPKICK, MOVE_ODORSLEUTH
+from .constants.rr.move_table import get_move_name, get_move_id
+
+
+class MoveTableTestCase(unittest.TestCase):
+    def test_duplicate_rows(self):
+        """Test that the first row of a move ID listed twice wins, and that
+        move constants take priority over table names."""
+        self.assertEqual(get_move_name(MOVE_HIGHJUMPKICK), "High Jump Kick")
+        self.assertEqual(get_move_id("High Jump Kick"), MOVE_HIGHJUMPKICK)
+        self.assertEqual(get_move_id("Odor Sleuth"), MOVE_ODORSLEUTH)
+        self.assertEqual(get_move_id("ODOR_SLEUTH"), MOVE_ODORSLEUTH)
+        pass
+
+    pass
+
+
+if __name__ == '__main__':
+    unittest.main()
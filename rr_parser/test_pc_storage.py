@@ -0,0 +1,49 @@
+import os
+import unittest
+
+from .functions import load_radical_red_game
+
+RR_SAV = "rr.sav"
+
+
+@unittest.skipUnless(os.path.exists(RR_SAV), "Missing Radical Red savegame.")
+class PCStorageTestCase(unittest.TestCase):
+    def test_columns_match_box_pokemon(self):
+        """Test that the PC columns match every box Pokemon decoding."""
+        pc = load_radical_red_game(RR_SAV).game_save.pc
+        storage = pc.storage
+        self.assertEqual(len(storage), 18 * 30)
+        for box in pc.boxes:
+            self.assertEqual(box.num_pkm, len(storage.occupied(box.id)))
+            for pos, pkm in enumerate(box.pokemon):
+                slot = storage.slot_of(box.id, pos)
+                self.assertEqual(storage.box_of(slot), (box.id, pos))
+                sub_data = pkm.sub_data
+                self.assertEqual(storage.species[slot],
+                                 sub_data.growth.species)
+                self.assertEqual(storage.pid[slot], sub_data._pid)
+                self.assertEqual(storage.ot_id[slot], sub_data._ot)
+                self.assertEqual(storage.slot_moves(slot),
+                                 sub_data.attacks.moves)
+                self.assertEqual(storage.slot_ivs(slot), sub_data.misc.IVs)
+                self.assertEqual(storage.ball[slot],
+                                 sub_data.misc.ball_caught)
+                self.assertEqual(storage.hidden_ability[slot],
+                                 sub_data.misc.ability)
+                pass
+            pass
+
+        species = storage.species[storage.occupied()[0]]
+        self.assertTrue(all(
+            storage.species[slot] == species
+            for slot in storage.where(species=species)
+        ))
+        self.assertEqual(len(storage.where(species=species)),
+                         storage.species_counts()[species])
+        pass
+
+    pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,229 @@
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+from .constants import species_db
+from .constants.species_db import SpeciesData, AbilitySlot, \
+    get_species_data
+from .enums import GameType
+from .exceptions import SpeciesDataException
+from .pkm_builder import solve_pid, is_shiny, _pid, pkm_builder, \
+    build_many, PokemonSpec
+from .pkms import Pokemon
+
+
+class SolvePidTestCase(unittest.TestCase):
+    def test_constraints(self):
+        """Test that every solved PID satisfies its constraints."""
+        rng = random.Random(0)
+        ot_ids = [0, 0xFFFFFFFF, 123456789] + [
+            rng.getrandbits(32) for _ in range(0, 50)
+        ]
+        for ot_id in ot_ids:
+            for nature in [None] + list(range(0, 25)):
+                for ability_bit in (None, 0, 1):
+                    for shiny in (None, False, True):
+                        pid = solve_pid(ot_id, nature, ability_bit, shiny)
+                        self.assertTrue(0 <= pid < (1 << 32))
+                        if nature is not None:
+                            self.assertEqual(pid % 25, nature)
+                            pass
+                        if ability_bit is not None:
+                            self.assertEqual(pid % 2, ability_bit)
+                            pass
+                        if shiny is not None:
+                            self.assertEqual(is_shiny(pid, ot_id), shiny)
+                            pass
+                        pass
+                    pass
+                pass
+            pass
+        pass
+
+    def test_builder_pid(self):
+        """Test the PIDs used by the Pokemon builder."""
+        for ability in (1, 2):
+            for nature in range(0, 25):
+                # Same PIDs as before for non shiny Pokemon.
+                c = nature - ability
+                expected = 50 + nature if c % 2 == 0 else 25 + nature
+                self.assertEqual(_pid(ability, nature, 123456789, False),
+                                 expected)
+
+                pid = _pid(ability, nature, 123456789, True)
+                self.assertTrue(is_shiny(pid, 123456789))
+                self.assertEqual(pid % 25, nature)
+                self.assertEqual(pid % 2, ability % 2)
+                pass
+            pass
+        pass
+
+    pass
+
+
+class BuildManyTestCase(unittest.TestCase):
+    def setUp(self):
+        # The bundled dataset has no base stats nor growth rates, use
+        # complete species data within the test only.
+        species = {
+            name: SpeciesData(
+                id=species_id,
+                name=name,
+                growth_rate="medium-slow",
+                base_stats=[45, 49, 49, 45, 65, 65],
+                abilities=[AbilitySlot("overgrow", False),
+                           AbilitySlot("chlorophyll", True)],
+                learnset_fr=[(33, 1, "tackle"), (45, 4, "growl"),
+                             (73, 7, "leech-seed"), (22, 10, "vine-whip"),
+                             (77, 15, "poison-powder")]
+            )
+            for name, species_id in (("bulbasaur", 1), ("pikachu", 25))
+        }
+        patcher = mock.patch.dict(species_db._species_db()["species"],
+                                  species)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        pass
+
+    def test_build_many(self):
+        """Test that bulk built Pokemon match one by one built Pokemon."""
+        for gen in (GameType.RR, GameType.FR):
+            specs = [
+                PokemonSpec(species, level=level, ability=1,
+                            nature=level % 25, evs=[4] * 6,
+                            ivs=[level % 32] * 6, shiny=level % 2 == 0)
+                for level in (5, 16, 50, 100)
+                for species in ("bulbasaur", "pikachu")
+            ]
+            buf = build_many(gen, specs)
+            self.assertEqual(len(buf), 100 * len(specs))
+            for i, spec in enumerate(specs):
+                expected = pkm_builder(
+                    gen, spec.species, level=spec.level,
+                    ability=spec.ability, nature=spec.nature,
+                    evs=spec.evs, ivs=spec.ivs, shiny=spec.shiny
+                )
+                self.assertEqual(bytes(buf[i * 100:(i + 1) * 100]),
+                                 bytes(expected.data))
+                pkm = Pokemon(bytes(buf[i * 100:(i + 1) * 100]), gen)
+                self.assertTrue(pkm.check())
+                self.assertEqual(pkm.level, spec.level)
+                pass
+            pass
+        pass
+
+    pass
+
+
+class SpeciesDataTestCase(unittest.TestCase):
+    def test_bundled_dataset(self):
+        """Test the species dataset generated from the Pokemon table."""
+        bulbasaur = get_species_data("Bulbasaur")
+        self.assertEqual(bulbasaur.id, 1)
+        self.assertEqual(
+            [(ab.name, ab.is_hidden) for ab in bulbasaur.abilities],
+            [("overgrow", False), ("chlorophyll", True)]
+        )
+        self.assertFalse(get_species_data("metapod").abilities[0].is_hidden)
+        pass
+
+    def test_missing_data(self):
+        """Test that species data which could not be fetched raises."""
+        with self.assertRaisesRegex(SpeciesDataException, "not in"):
+            pkm_builder(GameType.RR, "missingno")
+        incomplete = {"bulbasaur": SpeciesData(1, "bulbasaur")}
+        with mock.patch.dict(species_db._species_db()["species"],
+                             incomplete), \
+                mock.patch.object(species_db, "fetch_species_data",
+                                  side_effect=OSError("offline")):
+            with self.assertRaisesRegex(SpeciesDataException, "base stats"):
+                pkm_builder(GameType.RR, "bulbasaur")
+            pass
+        pass
+
+    def test_fetch_missing_data(self):
+        """Test that missing species data is fetched once, and cached."""
+        fetched = SpeciesData(
+            id=1, name="bulbasaur", growth_rate="medium-slow",
+            base_stats=[45, 49, 49, 45, 65, 65],
+            abilities=[AbilitySlot("overgrow", False)],
+            learnset_fr=[(33, 1, "tackle"), (45, 4, "growl")]
+        )
+        abilities = [AbilitySlot("overgrow", False),
+                     AbilitySlot("chlorophyll", True)]
+        incomplete = {
+            "bulbasaur": SpeciesData(1, "bulbasaur", abilities=abilities)
+        }
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache_file = os.path.join(tmp_dir, "rr_parser", "species_db.json")
+            with mock.patch.dict(species_db._species_db()["species"],
+                                 incomplete), \
+                    mock.patch.object(species_db, "SPECIES_CACHE_FILE",
+                                      cache_file), \
+                    mock.patch.object(species_db, "fetch_species_data",
+                                      return_value=fetched) as fetch:
+                for _ in range(0, 2):
+                    pkm = pkm_builder(GameType.FR, "bulbasaur", level=5)
+                    self.assertTrue(pkm.check())
+                    pass
+                fetch.assert_called_once_with("bulbasaur")
+                # Bundled abilities are kept.
+                self.assertEqual(get_species_data("bulbasaur").abilities,
+                                 abilities)
+
+                # Reloading the dataset uses the cache.
+                with mock.patch.object(species_db, "_SPECIES_DB", None):
+                    cached = get_species_data("bulbasaur")
+                    self.assertTrue(cached.is_complete(True))
+                    self.assertEqual(cached.base_stats, fetched.base_stats)
+                    self.assertEqual(cached.abilities, abilities)
+                    pass
+                pass
+            pass
+        pass
+
+    def test_build_real_species(self):
+        """Test building a species from the bundled dataset, unmocked."""
+        try:
+            pkm = pkm_builder(GameType.RR, "bulbasaur", level=5)
+        except SpeciesDataException as e:
+            if isinstance(e.__cause__, (ImportError, OSError)):
+                self.skipTest("PokeAPI unreachable: {}".format(e.__cause__))
+                pass
+            raise
+        self.assertTrue(pkm.check())
+        self.assertEqual(pkm.level, 5)
+        self.assertEqual(get_species_data("bulbasaur").base_stats,
+                         [45, 49, 49, 45, 65, 65])
+        pass
+
+    def test_build_many_real_species(self):
+        """Test bulk building species from the bundled dataset, unmocked."""
+        specs = [PokemonSpec(species, level=level)
+                 for species in ("bulbasaur", "pikachu")
+                 for level in (5, 50)]
+        for gen in (GameType.RR, GameType.FR):
+            try:
+                buf = build_many(gen, specs)
+            except SpeciesDataException as e:
+                if isinstance(e.__cause__, (ImportError, OSError)):
+                    self.skipTest(
+                        "PokeAPI unreachable: {}".format(e.__cause__)
+                    )
+                    pass
+                raise
+            for i, spec in enumerate(specs):
+                pkm = Pokemon(bytes(buf[i * 100:(i + 1) * 100]), gen)
+                self.assertTrue(pkm.check())
+                self.assertEqual(pkm.level, spec.level)
+                pass
+            pass
+        pass
+
+    pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import os
+import unittest
+
+from .enums import PokedexEntryState
+from .functions import load_radical_red_game, set_pokedex_entries
+from .pokedex import DexBitset
+
+RR_SAV = "rr.sav"
+
+
+class DexBitsetTestCase(unittest.TestCase):
+    def test_bulk_operations(self):
+        """Test that bulk and single entry edits set the same bits."""
+        a = DexBitset(bytes(125))
+        b = DexBitset(bytes(125))
+        a.add(range(1, 152))
+        b.add(list(range(1, 152)))
+        self.assertEqual(a, b)
+        self.assertEqual(a.count(), 151)
+        self.assertEqual(list(a), list(range(1, 152)))
+        self.assertIn(151, a)
+        self.assertNotIn(152, a)
+
+        a.discard(range(100, 152))
+        b.discard(set(range(100, 152)))
+        self.assertEqual(a, b)
+        self.assertEqual(list(a), list(range(1, 100)))
+
+        a.add(1000)
+        self.assertEqual(bytes(a)[-1], 0x80)
+        with self.assertRaises(AssertionError):
+            a.add(1001)
+            pass
+        a.fill()
+        self.assertEqual(len(a), 1000)
+        a.clear()
+        self.assertEqual(len(a), 0)
+        pass
+
+    def test_set_algebra(self):
+        """Test set operations against Python sets."""
+        x, y = {1, 5, 8, 9, 200, 999}, {5, 9, 10, 1000}
+        a = DexBitset(bytes(125))
+        b = DexBitset(bytes(125))
+        a.add(x)
+        b.add(y)
+        self.assertEqual(set(a | b), x | y)
+        self.assertEqual(set(a & b), x & y)
+        self.assertEqual(set(a - b), x - y)
+        self.assertEqual(set(a ^ b), x ^ y)
+        pass
+
+    pass
+
+
+@unittest.skipUnless(os.path.exists(RR_SAV), "Missing Radical Red savegame.")
+class PokedexTestCase(unittest.TestCase):
+    def test_set_pokedex_entries(self):
+        """Test that region wide edits are written into the savegame."""
+        g = load_radical_red_game(RR_SAV)
+        set_pokedex_entries(g, range(1, 387),
+                            PokedexEntryState(PokedexEntryState.CAUGHT))
+        set_pokedex_entries(g, [25, 150],
+                            PokedexEntryState(PokedexEntryState.SEEN))
+        self.assertTrue(g.check_valid())
+
+        pokedex = type(g)(bytes(g.data)).game_save.pokedex
+        self.assertTrue(set(range(1, 387)) <= set(pokedex.seen))
+        self.assertTrue(set(range(1, 387)) - {25, 150} <= set(pokedex.caught))
+        self.assertNotIn(25, pokedex.caught)
+        self.assertEqual(pokedex.num_seen, len(set(pokedex.seen)))
+        pass
+
+    pass
+
+
+if __name__ == '__main__':
+    unittest.main()
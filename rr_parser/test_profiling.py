@@ -0,0 +1,72 @@
+import os
+import unittest
+
+from . import profiling
+from .functions import load_radical_red_game, set_money
+from .record_cache import RECORD_CACHE
+
+RR_SAV = "rr.sav"
+
+
+@unittest.skipUnless(os.path.exists(RR_SAV), "Missing Radical Red savegame.")
+class ProfilingTestCase(unittest.TestCase):
+    def setUp(self):
+        # Count every decode, none are shared between views.
+        self._maxsize = RECORD_CACHE.maxsize
+        RECORD_CACHE.maxsize = 0
+        pass
+
+    def tearDown(self):
+        RECORD_CACHE.maxsize = self._maxsize
+        pass
+
+    def test_profile(self):
+        """Test counters and phases recorded by nested profile blocks."""
+        with profiling.profile() as outer:
+            g = load_radical_red_game(RR_SAV)
+            with profiling.profile() as inner:
+                for box in g.game_save.pc.boxes:
+                    for pkm in box.pokemon:
+                        pkm.nickname, pkm.sub_data
+                        pass
+                    pass
+                set_money(g, 1234)
+                pass
+            pass
+        self.assertIsNone(profiling.active)
+
+        # Both game saves, 14 sections each, are parsed and validated.
+        self.assertEqual(outer.counters["sections_rebuilt"], 28)
+        self.assertGreaterEqual(outer.counters["checksums"], 28)
+        self.assertEqual(outer.phases["parse"].calls, 1)
+        self.assertEqual(outer.phases["pc_decode"].calls, 2)
+        self.assertNotIn("parse", inner.phases)
+
+        # Inner events are recorded into the outer block too.
+        self.assertEqual(inner.counters["pokemon_decoded"], 540)
+        self.assertEqual(inner.counters["strings_decoded"], 540)
+        for name, value in inner.counters.items():
+            self.assertGreaterEqual(outer.counters[name], value)
+            pass
+        self.assertEqual(inner.phases["reserialize"].calls, 3)
+        self.assertGreater(outer.elapsed, inner.elapsed)
+        self.assertIn("pc_decode", str(outer))
+        self.assertEqual(outer.to_json()["phases"]["parse"],
+                         {"calls": 1,
+                          "seconds": outer.phases["parse"].seconds})
+        pass
+
+    def test_disabled(self):
+        """Test that nothing is recorded outside of a profile block."""
+        with profiling.profile() as report:
+            pass
+        load_radical_red_game(RR_SAV)
+        self.assertEqual(report.counters, {})
+        self.assertEqual(report.phases, {})
+        pass
+
+    pass
+
+
+if __name__ == '__main__':
+    unittest.main()
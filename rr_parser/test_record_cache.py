@@ -0,0 +1,124 @@
+import os
+import unittest
+
+from . import profiling
+from .enums import GameType
+from .functions import load_radical_red_game
+from .pkms import Pokemon
+from .record_cache import RecordCache, RECORD_CACHE
+
+RR_SAV = "rr.sav"
+
+
+class RecordCacheTestCase(unittest.TestCase):
+    def test_lru(self):
+        """Test lookups, eviction and statistics."""
+        cache = RecordCache(maxsize=2)
+        a = cache.lookup(GameType.RR, b"a")
+        cache.lookup(GameType.RR, b"b")
+        self.assertIs(cache.lookup(GameType.RR, b"a"), a)
+        # "b" is the least recently used record.
+        cache.lookup(GameType.RR, b"c")
+        self.assertIs(cache.lookup(GameType.RR, b"a"), a)
+        stats = cache.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.evictions),
+                         (2, 3, 1))
+        self.assertEqual(stats.size, 2)
+        self.assertAlmostEqual(stats.hit_rate, 0.4)
+        self.assertIsNot(cache.lookup(GameType.FR, b"a"), a)
+
+        cache.maxsize = 0
+        self.assertEqual(cache.stats().size, 0)
+        self.assertIsNone(cache.lookup(GameType.RR, b"a"))
+        cache.clear()
+        self.assertEqual(cache.stats().misses, 0)
+        pass
+
+    @unittest.skipUnless(os.path.exists(RR_SAV),
+                         "Missing Radical Red savegame.")
+    def test_shared_decoding(self):
+        """Test that views of identical records reuse decoded fields, and
+        stop sharing them once edited."""
+        RECORD_CACHE.clear()
+        g = load_radical_red_game(RR_SAV)
+        team = g.game_save.team.team_pokemon_list
+        boxes = g.game_save.pc.boxes
+        expected = [(pkm.nickname, pkm.ot_name, pkm.status) for pkm in team]
+        expected_box = [
+            [(pkm.nickname, pkm.ot_name) for pkm in box.pokemon]
+            for box in boxes
+        ]
+        misses = RECORD_CACHE.stats().misses
+
+        g = load_radical_red_game(RR_SAV)
+        team = g.game_save.team.team_pokemon_list
+        boxes = g.game_save.pc.boxes
+        # Decoded fields are filled in when the views are built.
+        self.assertTrue(all(
+            pkm._nickname == nickname for pkm, (nickname, _, _)
+            in zip(team, expected)
+        ))
+        self.assertEqual(
+            [(pkm.nickname, pkm.ot_name, pkm.status) for pkm in team],
+            expected
+        )
+        self.assertEqual(
+            [
+                [(pkm.nickname, pkm.ot_name) for pkm in box.pokemon]
+                for box in boxes
+            ],
+            expected_box
+        )
+        self.assertEqual(RECORD_CACHE.stats().misses, misses)
+
+        # Edited views decode their own fields again.
+        pkm = team[0]
+        record = pkm._record
+        nickname = pkm.nickname
+        pkm.data[84] = 100
+        pkm.data = pkm.data
+        self.assertIsNone(pkm._record)
+        self.assertEqual(pkm.nickname, nickname)
+        self.assertEqual(pkm.level, 100)
+        self.assertEqual(record.values["_nickname"], nickname)
+        pass
+
+    @unittest.skipUnless(os.path.exists(RR_SAV),
+                         "Missing Radical Red savegame.")
+    def test_shared_sub_data(self):
+        """Test that Fire Red Pokemon identical to a verified one skip
+        decryption and checksum verification, and get their own blocks."""
+        team = load_radical_red_game(RR_SAV).game_save.team
+        # Same Pokemon, with encrypted sub-data and a checksum, unused by
+        # Radical Red.
+        pkm = team.team_pokemon_list[0]
+        data = bytearray(pkm.get_encrypted())
+        data[28:28 + 2] = pkm.sub_data.get_checksum()
+        data = bytes(data)
+        cache = RecordCache()
+        first = Pokemon(data, GameType.FR,
+                        record=cache.lookup(GameType.FR, data))
+        record = first._record
+        self.assertTrue(record.valid)
+        self.assertEqual(record.sub_data, first.sub_data_decrypted.data)
+
+        with profiling.profile() as report:
+            pkm = Pokemon(data, GameType.FR,
+                          record=cache.lookup(GameType.FR, data))
+            sub_data = pkm.sub_data
+            pass
+        self.assertNotIn("pokemon_decoded", report.counters)
+        self.assertEqual(pkm.sub_data_decrypted.data, record.sub_data)
+        self.assertEqual(sub_data.to_encrypted().data, data[32:32 + 48])
+
+        species = first.sub_data.species
+        sub_data.species = species + 1
+        self.assertEqual(first.sub_data.species, species)
+        self.assertEqual(record.sub_data, first.sub_data_decrypted.data)
+        pass
+
+    pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import os
+import tempfile
+import unittest
+import zlib
+
+from .exceptions import ChecksumException
+from .functions import load_radical_red_game, set_money
+from .snapshots import SnapshotStore, BLOCK_SIZE
+
+RR_SAV = "rr.sav"
+
+
+@unittest.skipUnless(os.path.exists(RR_SAV), "Missing Radical Red savegame.")
+class SnapshotStoreTestCase(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.store = SnapshotStore(self._tmp.name)
+        pass
+
+    def tearDown(self):
+        self._tmp.cleanup()
+        pass
+
+    def test_round_trip(self):
+        """Test that snapshots are rebuilt byte for byte, and that sections
+        shared by successive snapshots are stored once."""
+        with open(RR_SAV, "rb") as f:
+            data = f.read()
+            pass
+        first = self.store.put(RR_SAV)
+        self.assertEqual(self.store.put(data).id, first.id)
+        n_objects = self.store.stats().objects
+
+        g = load_radical_red_game(RR_SAV)
+        saved = list()
+        for money in (1000, 2000, 3000):
+            set_money(g, money)
+            saved.append((self.store.put(g).id, bytes(g.data)))
+            pass
+        # Money is stored in a single section of each game save.
+        self.assertLessEqual(self.store.stats().objects, n_objects + 2 * 3)
+
+        self.assertEqual(self.store.get(first.id), data)
+        for snapshot_id, expected in saved:
+            self.assertEqual(self.store.get(snapshot_id), expected)
+            pass
+        self.assertEqual(
+            [info.id for info in self.store.snapshots()],
+            [first.id] + [snapshot_id for snapshot_id, _ in saved]
+        )
+        self.assertEqual(
+            len(self.store.snapshots(player_name=first.player_name)), 4
+        )
+        self.assertEqual(self.store.snapshots(player_name="?"), [])
+        self.assertEqual(len(first.blocks), len(data) // BLOCK_SIZE)
+        self.assertGreater(self.store.stats().ratio, 10)
+
+        g = self.store.load(saved[-1][0])
+        self.assertEqual(bytes(g.data), saved[-1][1])
+        pass
+
+    def test_corrupt(self):
+        """Test that corrupt blocks and unknown snapshots are reported."""
+        info = self.store.put(RR_SAV)
+        with self.assertRaises(KeyError):
+            self.store.get("0" * 64)
+        digest = info.blocks[0][0]
+        with open(self.store._object_path(digest), "wb") as f:
+            f.write(zlib.compress(bytes(16)))
+            pass
+        store = SnapshotStore(self._tmp.name)
+        with self.assertRaises(ChecksumException):
+            store.get(info.id)
+        pass
+
+    pass
+
+
+if __name__ == '__main__':
+    unittest.main()
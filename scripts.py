@@ -25,6 +25,14 @@ def create_pokemon_db():
         json.dump(db, f)
 
 
+# NOTE: Growth rates, base stats and FireRed learnsets need network access.
+def create_species_db(fetch: bool = False):
+    from rr_parser.constants.species_db import generate_species_db, \
+        dump_species_db
+
+    dump_species_db(generate_species_db(fetch=fetch))
+
+
 def create_items_list():
     FP = './rr_parser/constants/rr/_items.txt'
     OUT_FP = './rr_parser/constants/rr/_items.py'
@@ -59,6 +67,8 @@ def create_items_list():
 if __name__ == '__main__':
     parser = argparse.ArgumentParser()
     parser.add_argument('script', type=str)
+    parser.add_argument('--fetch', action='store_true',
+                        help="Fetch missing species data from PokeAPI.")
 
     args = parser.parse_args()
 
@@ -66,4 +76,7 @@ if __name__ == '__main__':
         create_items_list()
 
     if args.script.lower() in ['pokemon']:
-        create_pokemon_db()
\ No newline at end of file
+        create_pokemon_db()
+
+    if args.script.lower() in ['species', 'species_db', 'create_species_db']:
+        create_species_db(fetch=args.fetch)
\ No newline at end of file
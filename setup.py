@@ -18,6 +18,10 @@ setup(
     ],
     keywords="pokemon radical red radicalred editor",
     packages=find_packages(include=["rr_parser", "rr_parser.*"]),
+    package_data={
+        "rr_parser.constants": ["_species_db.json"],
+        "rr_parser.constants.rr": ["move_names.tsv", "_pokemon.json", "_data_pack.bin"]
+    },
     install_requires=[
         "pokebase>=1.3.0"
     ],